@@ -1,34 +1,292 @@
 import json
+import queue
 import sqlite3
 import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
-
-def now_str() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA busy_timeout=30000;
+"""
+
+
+# Tables whose created_at moved from ISO TEXT to INTEGER epoch microseconds.
+EPOCH_TABLES = ("alert_history", "monitoring_run_history")
+LEGACY_TABLE_SUFFIX = "_text_legacy"
+
+# Upper bound of queued write jobs the writer thread folds into one transaction.
+WRITER_MAX_BATCH = 64
+
+# Below this many rows, per-row decoding is as fast as splicing one JSON array.
+BATCH_DECODE_MIN_ROWS = 16
+
+# Aggregate FILTER clauses (SQLite 3.30+) count without evaluating a CASE expression per row.
+SQLITE_SUPPORTS_AGGREGATE_FILTER = sqlite3.sqlite_version_info >= (3, 30, 0)
+
+# INSERT ... RETURNING (SQLite 3.35+) hands back ids from the statement itself, which also works for batches.
+SQLITE_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+RETURNING_ID = "RETURNING id" if SQLITE_SUPPORTS_RETURNING else ""
+
+WriteJob = Callable[[sqlite3.Connection], object]
+
+
+def now_epoch_us() -> int:
+    return int(time.time() * 1_000_000)
+
+
+def count_if(condition: str) -> str:
+    if SQLITE_SUPPORTS_AGGREGATE_FILTER:
+        return f"COUNT(*) FILTER (WHERE {condition})"
+    return f"SUM(CASE WHEN {condition} THEN 1 ELSE 0 END)"
+
+
+def format_timestamp(t: datetime) -> str:
+    # Plain field formatting skips strftime's locale-aware path.
+    return f"{t.year:04d}-{t.month:02d}-{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d}"
+
+
+def to_epoch_us(value: object) -> int:
+    if isinstance(value, int):
+        return value
+    text = str(value or "").strip()
+    if text:
+        try:
+            return int(datetime.fromisoformat(text).timestamp() * 1_000_000)
+        except ValueError:
+            pass
+    return now_epoch_us()
+
+
+# Rows saved in one batch share a timestamp, so a small memo skips most repeat formatting.
+@lru_cache(maxsize=1024)
+def format_epoch_us(value: object) -> str:
+    if value is None or value == "":
+        return ""
+    if isinstance(value, str):
+        return value
+    return format_timestamp(datetime.fromtimestamp(int(value) / 1_000_000))
+
+
+def dumps_payload(value: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def loads_payload(raw: object) -> object:
+    # Rows written before the BLOB switch come back as TEXT; both decoders accept str and bytes.
+    raw = raw or b"{}"
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        if isinstance(raw, (bytes, bytearray, memoryview)):
+            raw = bytes(raw).decode("utf-8", errors="replace")
+        return {"raw": str(raw)}
+
+
+def loads_payloads(raws: List[object]) -> List[object]:
+    # orjson keeps the GIL, so a thread pool only adds overhead; instead decode a whole page in one call
+    # by splicing the stored documents into a single JSON array, and fall back per row on any mismatch.
+    if orjson is not None and len(raws) >= BATCH_DECODE_MIN_ROWS:
+        chunks = [
+            raw if isinstance(raw, bytes) else (raw.encode("utf-8") if isinstance(raw, str) and raw else b"{}")
+            for raw in raws
+        ]
+        try:
+            decoded = orjson.loads(b"[" + b",".join(chunks) + b"]")
+        except orjson.JSONDecodeError:
+            decoded = None
+        if decoded is not None and len(decoded) == len(raws):
+            return decoded
+    return [loads_payload(raw) for raw in raws]
+
+
+# Pre-render one statement per filter bitmask so sqlite3's statement cache sees stable SQL text.
+def build_filtered_select_sql(select_sql: str, filters: tuple) -> Dict[int, str]:
+    statements: Dict[int, str] = {}
+    for mask in range(1 << len(filters)):
+        conditions = [condition for bit, condition in enumerate(filters) if mask & (1 << bit)]
+        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        statements[mask] = f"{select_sql} {where_clause} ORDER BY id DESC LIMIT ?"
+    return statements
+
+
+LIST_ALERT_HISTORY_FILTERS = ("stock_code = ?", "delivery_level = ?", "importance_score >= ?")
+
+LIST_ALERT_HISTORY_SQL = build_filtered_select_sql(
+    """
+    SELECT
+        id, created_at, stock_code, stock_name, importance_score, delivery_level,
+        priority, article_count, sentiment, summary, payload_json
+    FROM alert_history
+    """,
+    LIST_ALERT_HISTORY_FILTERS,
+)
+
+# Same row shape without reading the (large) payload column.
+LIST_ALERT_HISTORY_NO_PAYLOAD_SQL = build_filtered_select_sql(
+    """
+    SELECT
+        id, created_at, stock_code, stock_name, importance_score, delivery_level,
+        priority, article_count, sentiment, summary, NULL
+    FROM alert_history
+    """,
+    LIST_ALERT_HISTORY_FILTERS,
+)
+
+LIST_MONITORING_RUNS_SQL = build_filtered_select_sql(
+    """
+    SELECT
+        id, created_at, trigger, policy_name, status, result_count,
+        average_score, duration_ms, error_message, payload_json
+    FROM monitoring_run_history
+    """,
+    ("status = ?", "trigger = ?", "created_at >= ?"),
+)
 
 
 class AlertStore:
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._lock = threading.Lock()
+        self._tls = threading.local()
+        self._write_q: "queue.Queue[Optional[Tuple[WriteJob, Future]]]" = queue.Queue()
+        self._writer: Optional[threading.Thread] = None
+        # Every connection this store opened (writer + per-thread readers), so close() can release them.
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # Single read-write connection: used by _init_db, then owned by the writer thread.
+        self._write_conn = self._open_connection(read_only=False)
         self._init_db()
 
-    def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+    def _open_connection(self, read_only: bool) -> sqlite3.Connection:
+        if read_only:
+            uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False, isolation_level=None)
+        else:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
         conn.row_factory = sqlite3.Row
+        conn.executescript(CONNECTION_PRAGMAS)
+        with self._connections_lock:
+            self._connections.append(conn)
+        return conn
+
+    def _connect(self) -> sqlite3.Connection:
+        # Per-thread read-only connections; in WAL mode they never wait on the writer.
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = self._open_connection(read_only=True)
+            self._tls.conn = conn
         return conn
 
+    def _submit_write(self, job: WriteJob) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._write_q.put((job, future))
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._drain_writes, name="alert-store-writer", daemon=True)
+                self._writer.start()
+        return future
+
+    def _drain_writes(self):
+        conn = self._write_conn
+        while True:
+            item = self._write_q.get()
+            if item is None:
+                return
+            batch: List[Tuple[WriteJob, Future]] = [item]
+            stop = False
+            while len(batch) < WRITER_MAX_BATCH:
+                try:
+                    pending = self._write_q.get_nowait()
+                except queue.Empty:
+                    break
+                if pending is None:
+                    stop = True
+                    break
+                batch.append(pending)
+            self._run_write_batch(conn, batch)
+            if stop:
+                return
+
+    def _run_write_batch(self, conn: sqlite3.Connection, batch: List[Tuple[WriteJob, Future]]):
+        # One BEGIN/COMMIT (one WAL fsync) per drained batch; a savepoint per job keeps failures isolated.
+        outcomes: List[Tuple[Future, object, Optional[BaseException]]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for job, future in batch:
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    result = job(conn)
+                except Exception as exc:
+                    conn.execute("ROLLBACK TO write_job")
+                    conn.execute("RELEASE write_job")
+                    outcomes.append((future, None, exc))
+                    continue
+                conn.execute("RELEASE write_job")
+                outcomes.append((future, result, None))
+            conn.execute("COMMIT")
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def close(self):
+        with self._lock:
+            writer = self._writer
+            self._writer = None
+        if writer is not None and writer.is_alive():
+            self._write_q.put(None)
+            writer.join()
+        # The writer is gone, so _write_conn is idle; reader connections of other threads close with it.
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+    def _fetch_tuples(self, sql: str, params: tuple = ()) -> List[tuple]:
+        cursor = self._connect().cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params).fetchall()
+
     def _init_db(self):
-        with self._connect() as conn:
+        with self._lock:
+            conn = self._write_conn
+            legacy_tables = [table for table in EPOCH_TABLES if self._has_text_created_at(conn, table)]
+            for table in legacy_tables:
+                self._detach_legacy_table(conn, table)
+
             conn.executescript(
                 """
                 PRAGMA journal_mode=WAL;
 
                 CREATE TABLE IF NOT EXISTS alert_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
                     stock_code TEXT NOT NULL,
                     stock_name TEXT NOT NULL,
                     importance_score INTEGER NOT NULL,
@@ -37,7 +295,7 @@ class AlertStore:
                     article_count INTEGER NOT NULL,
                     sentiment TEXT NOT NULL,
                     summary TEXT NOT NULL,
-                    payload_json TEXT NOT NULL
+                    payload_json BLOB NOT NULL
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_alert_history_created
@@ -49,9 +307,33 @@ class AlertStore:
                 CREATE INDEX IF NOT EXISTS idx_alert_history_level
                 ON alert_history(delivery_level, created_at DESC);
 
+                CREATE INDEX IF NOT EXISTS idx_alert_history_recent
+                ON alert_history(created_at, delivery_level, priority, importance_score);
+
+                CREATE TABLE IF NOT EXISTS alert_counters (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                ) WITHOUT ROWID;
+
+                CREATE TRIGGER IF NOT EXISTS trg_alert_history_count_insert
+                AFTER INSERT ON alert_history
+                BEGIN
+                    INSERT INTO alert_counters (key, value)
+                    VALUES ('total', 1), ('level:' || NEW.delivery_level, 1), ('priority:' || NEW.priority, 1)
+                    ON CONFLICT(key) DO UPDATE SET value = value + 1;
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS trg_alert_history_count_delete
+                AFTER DELETE ON alert_history
+                BEGIN
+                    UPDATE alert_counters
+                    SET value = value - 1
+                    WHERE key IN ('total', 'level:' || OLD.delivery_level, 'priority:' || OLD.priority);
+                END;
+
                 CREATE TABLE IF NOT EXISTS monitoring_run_history (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TEXT NOT NULL,
+                    created_at INTEGER NOT NULL,
                     trigger TEXT NOT NULL,
                     policy_name TEXT NOT NULL,
                     status TEXT NOT NULL,
@@ -59,7 +341,7 @@ class AlertStore:
                     average_score REAL NOT NULL,
                     duration_ms REAL NOT NULL,
                     error_message TEXT NOT NULL,
-                    payload_json TEXT NOT NULL
+                    payload_json BLOB NOT NULL
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_monitoring_run_created
@@ -70,29 +352,130 @@ class AlertStore:
                 """
             )
 
+            for table in EPOCH_TABLES:
+                if self._table_exists(conn, f"{table}{LEGACY_TABLE_SUFFIX}"):
+                    self._copy_legacy_rows(conn, table)
+
+            self._rebuild_alert_counters(conn)
+
+            # Refresh planner stats for the covering metrics index; analysis_limit bounds the cost.
+            conn.executescript(
+                """
+                PRAGMA analysis_limit=1000;
+                ANALYZE;
+                """
+            )
+
+    def _rebuild_alert_counters(self, conn: sqlite3.Connection):
+        # Triggers keep the counters current; recounting once at startup also seeds databases created before them.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM alert_counters")
+            conn.execute(
+                """
+                INSERT INTO alert_counters (key, value)
+                SELECT 'total', COUNT(*) FROM alert_history
+                UNION ALL
+                SELECT 'level:' || delivery_level, COUNT(*) FROM alert_history GROUP BY delivery_level
+                UNION ALL
+                SELECT 'priority:' || priority, COUNT(*) FROM alert_history GROUP BY priority
+                """
+            )
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _read_alert_counters(self, conn: sqlite3.Connection) -> Dict[str, int]:
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        return dict(cursor.execute("SELECT key, value FROM alert_counters").fetchall())
+
+    @staticmethod
+    def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (table,),
+        ).fetchone()
+        return row is not None
+
+    @staticmethod
+    def _has_text_created_at(conn: sqlite3.Connection, table: str) -> bool:
+        for column in conn.execute(f"PRAGMA table_info({table})").fetchall():
+            if column["name"] == "created_at":
+                return str(column["type"]).upper() == "TEXT"
+        return False
+
+    def _detach_legacy_table(self, conn: sqlite3.Connection, table: str):
+        # Indexes follow a renamed table, so drop them first to let the schema script recreate them.
+        index_rows = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL",
+            (table,),
+        ).fetchall()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for row in index_rows:
+                conn.execute(f"DROP INDEX IF EXISTS {row['name']}")
+            conn.execute(f"ALTER TABLE {table} RENAME TO {table}{LEGACY_TABLE_SUFFIX}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _copy_legacy_rows(self, conn: sqlite3.Connection, table: str):
+        legacy_table = f"{table}{LEGACY_TABLE_SUFFIX}"
+        columns = [str(row["name"]) for row in conn.execute(f"PRAGMA table_info({legacy_table})").fetchall()]
+        select_exprs = [
+            "COALESCE(CAST(strftime('%s', created_at, 'utc') AS INTEGER), 0) * 1000000"
+            if column == "created_at"
+            else column
+            for column in columns
+        ]
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                f"""
+                INSERT INTO {table} ({", ".join(columns)})
+                SELECT {", ".join(select_exprs)}
+                FROM {legacy_table}
+                """
+            )
+            conn.execute(f"DROP TABLE {legacy_table}")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
     def save_alerts(self, alerts: List[Dict[str, object]], created_at: Optional[str] = None) -> int:
-        if not alerts:
-            return 0
+        return int(self.submit_alerts(alerts, created_at=created_at).result())
 
-        timestamp = created_at or now_str()
-        rows = []
-        for alert in alerts:
-            rows.append(
-                (
-                    timestamp,
-                    str(alert.get("stock_code", "")),
-                    str(alert.get("stock_name", "")),
-                    int(alert.get("importance_score", 0)),
-                    str(alert.get("delivery_level", "daily_digest")),
-                    str(alert.get("priority", "low")),
-                    int(alert.get("article_count", 0)),
-                    str(alert.get("sentiment", "neutral")),
-                    str(alert.get("summary", "")),
-                    json.dumps(alert, ensure_ascii=False, separators=(",", ":")),
-                )
+    def submit_alerts(self, alerts: List[Dict[str, object]], created_at: Optional[str] = None) -> Future:
+        # Queue the insert and hand back its Future; a failed insert only rolls back its own savepoint,
+        # so callers must call .result() to see the error (later writes on this store still see the rows).
+        if not alerts:
+            future: Future = Future()
+            future.set_result(0)
+            return future
+
+        timestamp = to_epoch_us(created_at) if created_at else now_epoch_us()
+        dumps = dumps_payload
+        rows = [
+            (
+                timestamp,
+                str(alert.get("stock_code", "")),
+                str(alert.get("stock_name", "")),
+                int(alert.get("importance_score", 0)),
+                str(alert.get("delivery_level", "daily_digest")),
+                str(alert.get("priority", "low")),
+                int(alert.get("article_count", 0)),
+                str(alert.get("sentiment", "neutral")),
+                str(alert.get("summary", "")),
+                dumps(alert),
             )
+            for alert in alerts
+        ]
 
-        with self._lock, self._connect() as conn:
+        def _insert(conn: sqlite3.Connection) -> int:
             conn.executemany(
                 """
                 INSERT INTO alert_history (
@@ -103,7 +486,9 @@ class AlertStore:
                 """,
                 rows,
             )
-        return len(rows)
+            return len(rows)
+
+        return self._submit_write(_insert)
 
     def list_alert_history(
         self,
@@ -111,153 +496,119 @@ class AlertStore:
         stock_code: Optional[str] = None,
         delivery_level: Optional[str] = None,
         min_score: int = 0,
+        include_payload: bool = True,
     ) -> List[Dict[str, object]]:
-        conditions = ["importance_score >= ?"]
-        params: List[object] = [int(min_score)]
-
+        # Scores are clamped to 0..100 upstream, so a non-positive min_score needs no filter.
+        mask = 0
+        params: List[object] = []
         if stock_code:
-            conditions.append("stock_code = ?")
+            mask |= 1
             params.append(stock_code)
         if delivery_level:
-            conditions.append("delivery_level = ?")
+            mask |= 2
             params.append(delivery_level)
-
-        where_clause = " AND ".join(conditions)
+        if min_score > 0:
+            mask |= 4
+            params.append(int(min_score))
         params.append(int(limit))
 
-        with self._connect() as conn:
-            rows = conn.execute(
-                f"""
-                SELECT
-                    id, created_at, stock_code, stock_name, importance_score, delivery_level,
-                    priority, article_count, sentiment, summary, payload_json
-                FROM alert_history
-                WHERE {where_clause}
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                tuple(params),
-            ).fetchall()
-
-        result: List[Dict[str, object]] = []
-        for row in rows:
-            payload_raw = str(row["payload_json"] or "{}")
-            try:
-                payload = json.loads(payload_raw)
-            except json.JSONDecodeError:
-                payload = {"raw": payload_raw}
-
-            result.append(
-                {
-                    "id": int(row["id"]),
-                    "created_at": str(row["created_at"]),
-                    "stock_code": str(row["stock_code"]),
-                    "stock_name": str(row["stock_name"]),
-                    "importance_score": int(row["importance_score"]),
-                    "delivery_level": str(row["delivery_level"]),
-                    "priority": str(row["priority"]),
-                    "article_count": int(row["article_count"]),
-                    "sentiment": str(row["sentiment"]),
-                    "summary": str(row["summary"]),
-                    "payload": payload,
-                }
-            )
-        return result
+        statements = LIST_ALERT_HISTORY_SQL if include_payload else LIST_ALERT_HISTORY_NO_PAYLOAD_SQL
+        rows = self._fetch_tuples(statements[mask], tuple(params))
+
+        # Column affinities already yield int/str values, so rows are unpacked positionally without re-casting.
+        payloads = loads_payloads([row[10] for row in rows]) if include_payload else [None] * len(rows)
+        format_ts = format_epoch_us
+        return [
+            {
+                "id": row_id,
+                "created_at": format_ts(created_at),
+                "stock_code": stock_code_value,
+                "stock_name": stock_name,
+                "importance_score": importance_score,
+                "delivery_level": delivery_level_value,
+                "priority": priority,
+                "article_count": article_count,
+                "sentiment": sentiment,
+                "summary": summary,
+                "payload": payload,
+            }
+            for (
+                row_id,
+                created_at,
+                stock_code_value,
+                stock_name,
+                importance_score,
+                delivery_level_value,
+                priority,
+                article_count,
+                sentiment,
+                summary,
+                _payload_raw,
+            ), payload in zip(rows, payloads)
+        ]
 
     def get_metrics(self, since_hours: int = 24) -> Dict[str, object]:
         bounded_hours = max(1, int(since_hours))
-        cutoff = (datetime.now() - timedelta(hours=bounded_hours)).strftime("%Y-%m-%d %H:%M:%S")
-
-        with self._connect() as conn:
-            total_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS total_alert_history_rows,
-                    MIN(created_at) AS first_alert_at,
-                    MAX(created_at) AS last_alert_at
-                FROM alert_history
-                """
-            ).fetchone()
-
-            recent_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS recent_alert_history_rows,
-                    AVG(importance_score) AS avg_importance_score
-                FROM alert_history
-                WHERE created_at >= ?
-                """,
-                (cutoff,),
-            ).fetchone()
-
-            total_level_rows = conn.execute(
-                """
-                SELECT delivery_level, COUNT(*) AS cnt
-                FROM alert_history
-                GROUP BY delivery_level
-                """
-            ).fetchall()
-
-            recent_level_rows = conn.execute(
-                """
-                SELECT delivery_level, COUNT(*) AS cnt
-                FROM alert_history
-                WHERE created_at >= ?
-                GROUP BY delivery_level
-                """,
-                (cutoff,),
-            ).fetchall()
-
-            total_priority_rows = conn.execute(
-                """
-                SELECT priority, COUNT(*) AS cnt
-                FROM alert_history
-                GROUP BY priority
-                """
-            ).fetchall()
-
-            recent_priority_rows = conn.execute(
-                """
-                SELECT priority, COUNT(*) AS cnt
-                FROM alert_history
-                WHERE created_at >= ?
-                GROUP BY priority
-                """,
-                (cutoff,),
-            ).fetchall()
+        cutoff_dt = datetime.now() - timedelta(hours=bounded_hours)
+        cutoff = format_timestamp(cutoff_dt)
+        cutoff_us = int(cutoff_dt.timestamp() * 1_000_000)
+
+        conn = self._connect()
+        counters = self._read_alert_counters(conn)
+        bounds_row = conn.execute(
+            """
+            SELECT
+                (SELECT MIN(created_at) FROM alert_history) AS first_alert_at,
+                (SELECT MAX(created_at) FROM alert_history) AS last_alert_at
+            """
+        ).fetchone()
+        # Only the recent window is scanned: a range seek on the covering idx_alert_history_recent.
+        recent_rows = self._fetch_tuples(
+            """
+            SELECT delivery_level, priority, COUNT(*), SUM(importance_score)
+            FROM alert_history INDEXED BY idx_alert_history_recent
+            WHERE created_at >= ?
+            GROUP BY delivery_level, priority
+            """,
+            (cutoff_us,),
+        )
 
         total_levels: Dict[str, int] = {}
-        for row in total_level_rows:
-            total_levels[str(row["delivery_level"])] = int(row["cnt"] or 0)
-
-        recent_levels: Dict[str, int] = {}
-        for row in recent_level_rows:
-            recent_levels[str(row["delivery_level"])] = int(row["cnt"] or 0)
-
         total_priorities: Dict[str, int] = {}
-        for row in total_priority_rows:
-            total_priorities[str(row["priority"])] = int(row["cnt"] or 0)
-
+        for key, value in counters.items():
+            if value <= 0:
+                continue
+            if key.startswith("level:"):
+                total_levels[key[6:]] = value
+            elif key.startswith("priority:"):
+                total_priorities[key[9:]] = value
+
+        recent_total = 0
+        recent_score_sum = 0
+        recent_levels: Dict[str, int] = {}
         recent_priorities: Dict[str, int] = {}
-        for row in recent_priority_rows:
-            recent_priorities[str(row["priority"])] = int(row["cnt"] or 0)
+        for level, priority, cnt, score_sum in recent_rows:
+            recent_total += cnt
+            recent_score_sum += score_sum
+            recent_levels[level] = recent_levels.get(level, 0) + cnt
+            recent_priorities[priority] = recent_priorities.get(priority, 0) + cnt
 
         return {
             "window_hours": bounded_hours,
             "window_start": cutoff,
-            "total_alert_history_rows": int(total_row["total_alert_history_rows"] or 0),
-            "recent_alert_history_rows": int(recent_row["recent_alert_history_rows"] or 0),
-            "recent_avg_importance_score": round(float(recent_row["avg_importance_score"] or 0.0), 2),
+            "total_alert_history_rows": counters.get("total", 0),
+            "recent_alert_history_rows": recent_total,
+            "recent_avg_importance_score": round(recent_score_sum / recent_total, 2) if recent_total else 0.0,
             "delivery_level_distribution": total_levels,
             "recent_delivery_level_distribution": recent_levels,
             "priority_distribution": total_priorities,
             "recent_priority_distribution": recent_priorities,
-            "first_alert_at": str(total_row["first_alert_at"] or ""),
-            "last_alert_at": str(total_row["last_alert_at"] or ""),
+            "first_alert_at": format_epoch_us(bounds_row["first_alert_at"]),
+            "last_alert_at": format_epoch_us(bounds_row["last_alert_at"]),
         }
 
     def save_monitoring_run(self, run: Dict[str, object], created_at: Optional[str] = None) -> int:
-        timestamp = created_at or str(run.get("finished_at") or now_str())
+        timestamp = to_epoch_us(created_at or run.get("finished_at"))
         trigger = str(run.get("trigger", ""))
         policy_name = str(run.get("policy_name", ""))
         status = str(run.get("status", "success"))
@@ -265,16 +616,17 @@ class AlertStore:
         average_score = float(run.get("average_score", 0.0))
         duration_ms = float(run.get("duration_ms", 0.0))
         error_message = str(run.get("error", ""))
-        payload_json = json.dumps(run, ensure_ascii=False, separators=(",", ":"))
+        payload_json = dumps_payload(run)
 
-        with self._lock, self._connect() as conn:
+        def _insert(conn: sqlite3.Connection) -> int:
             cursor = conn.execute(
-                """
+                f"""
                 INSERT INTO monitoring_run_history (
                     created_at, trigger, policy_name, status, result_count, average_score,
                     duration_ms, error_message, payload_json
                 )
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                {RETURNING_ID}
                 """,
                 (
                     timestamp,
@@ -288,8 +640,12 @@ class AlertStore:
                     payload_json,
                 ),
             )
+            if SQLITE_SUPPORTS_RETURNING:
+                return int(cursor.fetchone()[0])
             return int(cursor.lastrowid)
 
+        return int(self._submit_write(_insert).result())
+
     def list_monitoring_runs(
         self,
         limit: int = 50,
@@ -297,124 +653,114 @@ class AlertStore:
         trigger: Optional[str] = None,
         since_hours: Optional[int] = None,
     ) -> List[Dict[str, object]]:
-        conditions: List[str] = []
+        mask = 0
         params: List[object] = []
-
         if status:
-            conditions.append("status = ?")
+            mask |= 1
             params.append(status)
         if trigger:
-            conditions.append("trigger = ?")
+            mask |= 2
             params.append(trigger)
         if since_hours is not None:
             bounded_hours = max(1, int(since_hours))
-            cutoff = (datetime.now() - timedelta(hours=bounded_hours)).strftime("%Y-%m-%d %H:%M:%S")
-            conditions.append("created_at >= ?")
-            params.append(cutoff)
-
-        where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            mask |= 4
+            params.append(int((datetime.now() - timedelta(hours=bounded_hours)).timestamp() * 1_000_000))
         params.append(int(limit))
 
-        with self._connect() as conn:
-            rows = conn.execute(
-                f"""
-                SELECT
-                    id, created_at, trigger, policy_name, status, result_count,
-                    average_score, duration_ms, error_message, payload_json
-                FROM monitoring_run_history
-                {where_clause}
-                ORDER BY id DESC
-                LIMIT ?
-                """,
-                tuple(params),
-            ).fetchall()
-
-        result: List[Dict[str, object]] = []
-        for row in rows:
-            payload_raw = str(row["payload_json"] or "{}")
-            try:
-                payload = json.loads(payload_raw)
-            except json.JSONDecodeError:
-                payload = {"raw": payload_raw}
-            result.append(
-                {
-                    "id": int(row["id"]),
-                    "created_at": str(row["created_at"]),
-                    "trigger": str(row["trigger"]),
-                    "policy_name": str(row["policy_name"]),
-                    "status": str(row["status"]),
-                    "result_count": int(row["result_count"] or 0),
-                    "average_score": float(row["average_score"] or 0.0),
-                    "duration_ms": float(row["duration_ms"] or 0.0),
-                    "error": str(row["error_message"] or ""),
-                    "payload": payload,
-                }
-            )
-        return result
+        rows = self._fetch_tuples(LIST_MONITORING_RUNS_SQL[mask], tuple(params))
+
+        payloads = loads_payloads([row[9] for row in rows])
+        format_ts = format_epoch_us
+        return [
+            {
+                "id": row_id,
+                "created_at": format_ts(created_at),
+                "trigger": trigger_value,
+                "policy_name": policy_name,
+                "status": status_value,
+                "result_count": result_count,
+                "average_score": average_score,
+                "duration_ms": duration_ms,
+                "error": error_message,
+                "payload": payload,
+            }
+            for (
+                row_id,
+                created_at,
+                trigger_value,
+                policy_name,
+                status_value,
+                result_count,
+                average_score,
+                duration_ms,
+                error_message,
+                _payload_raw,
+            ), payload in zip(rows, payloads)
+        ]
 
     def get_monitoring_run_metrics(self, since_hours: int = 24) -> Dict[str, object]:
         bounded_hours = max(1, int(since_hours))
-        cutoff = (datetime.now() - timedelta(hours=bounded_hours)).strftime("%Y-%m-%d %H:%M:%S")
-
-        with self._connect() as conn:
-            total_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS total_runs,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS total_success_runs,
-                    SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) AS total_error_runs,
-                    AVG(duration_ms) AS total_avg_duration_ms,
-                    AVG(average_score) AS total_avg_score,
-                    MIN(created_at) AS first_run_at,
-                    MAX(created_at) AS last_run_at
-                FROM monitoring_run_history
-                """
-            ).fetchone()
-
-            recent_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS recent_runs,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS recent_success_runs,
-                    SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END) AS recent_error_runs,
-                    AVG(duration_ms) AS recent_avg_duration_ms,
-                    AVG(average_score) AS recent_avg_score
-                FROM monitoring_run_history
-                WHERE created_at >= ?
-                """,
-                (cutoff,),
-            ).fetchone()
-
-            policy_rows = conn.execute(
-                """
-                SELECT
-                    policy_name,
-                    COUNT(*) AS run_count,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) AS success_count,
-                    AVG(average_score) AS avg_score,
-                    AVG(duration_ms) AS avg_duration_ms
-                FROM monitoring_run_history
-                WHERE created_at >= ?
-                GROUP BY policy_name
-                ORDER BY run_count DESC, policy_name ASC
-                """,
-                (cutoff,),
-            ).fetchall()
-
-        by_policy: List[Dict[str, object]] = []
-        for row in policy_rows:
-            run_count = int(row["run_count"] or 0)
-            success_count = int(row["success_count"] or 0)
-            by_policy.append(
-                {
-                    "policy_name": str(row["policy_name"] or ""),
-                    "run_count": run_count,
-                    "success_count": success_count,
-                    "success_ratio": round(success_count / max(1, run_count), 4),
-                    "avg_score": round(float(row["avg_score"] or 0.0), 2),
-                    "avg_duration_ms": round(float(row["avg_duration_ms"] or 0.0), 2),
-                }
-            )
+        cutoff_dt = datetime.now() - timedelta(hours=bounded_hours)
+        cutoff = format_timestamp(cutoff_dt)
+        cutoff_us = int(cutoff_dt.timestamp() * 1_000_000)
+
+        conn = self._connect()
+        total_row = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS total_runs,
+                {count_if("status = 'success'")} AS total_success_runs,
+                {count_if("status = 'error'")} AS total_error_runs,
+                AVG(duration_ms) AS total_avg_duration_ms,
+                AVG(average_score) AS total_avg_score,
+                MIN(created_at) AS first_run_at,
+                MAX(created_at) AS last_run_at
+            FROM monitoring_run_history
+            """
+        ).fetchone()
+
+        recent_row = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS recent_runs,
+                {count_if("status = 'success'")} AS recent_success_runs,
+                {count_if("status = 'error'")} AS recent_error_runs,
+                AVG(duration_ms) AS recent_avg_duration_ms,
+                AVG(average_score) AS recent_avg_score
+            FROM monitoring_run_history
+            WHERE created_at >= ?
+            """,
+            (cutoff_us,),
+        ).fetchone()
+
+        policy_rows = self._fetch_tuples(
+            f"""
+            SELECT
+                policy_name,
+                COUNT(*) AS run_count,
+                {count_if("status = 'success'")} AS success_count,
+                AVG(average_score) AS avg_score,
+                AVG(duration_ms) AS avg_duration_ms
+            FROM monitoring_run_history
+            WHERE created_at >= ?
+            GROUP BY policy_name
+            ORDER BY run_count DESC, policy_name ASC
+            """,
+            (cutoff_us,),
+        )
+
+        # GROUP BY guarantees run_count >= 1 and non-NULL aggregates, so only the tuple unpack remains.
+        by_policy: List[Dict[str, object]] = [
+            {
+                "policy_name": policy_name or "",
+                "run_count": run_count,
+                "success_count": success_count,
+                "success_ratio": round(success_count / run_count, 4),
+                "avg_score": round(avg_score, 2),
+                "avg_duration_ms": round(avg_duration_ms, 2),
+            }
+            for policy_name, run_count, success_count, avg_score, avg_duration_ms in policy_rows
+        ]
 
         total_runs = int(total_row["total_runs"] or 0)
         recent_runs = int(recent_row["recent_runs"] or 0)
@@ -436,34 +782,27 @@ class AlertStore:
             "recent_avg_duration_ms": round(float(recent_row["recent_avg_duration_ms"] or 0.0), 2),
             "total_avg_score": round(float(total_row["total_avg_score"] or 0.0), 2),
             "recent_avg_score": round(float(recent_row["recent_avg_score"] or 0.0), 2),
-            "first_run_at": str(total_row["first_run_at"] or ""),
-            "last_run_at": str(total_row["last_run_at"] or ""),
+            "first_run_at": format_epoch_us(total_row["first_run_at"]),
+            "last_run_at": format_epoch_us(total_row["last_run_at"]),
             "by_policy": by_policy,
         }
 
     def preview_prune(self, retention_days: int = 30, max_rows: int = 20000) -> Dict[str, int]:
         bounded_days = max(1, int(retention_days))
         bounded_max_rows = max(100, int(max_rows))
-        cutoff = (datetime.now() - timedelta(days=bounded_days)).strftime("%Y-%m-%d %H:%M:%S")
-
-        with self._connect() as conn:
-            total_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM alert_history
-                """
-            ).fetchone()
-            total_count = int(total_row["cnt"] or 0)
-
-            old_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM alert_history
-                WHERE created_at < ?
-                """,
-                (cutoff,),
-            ).fetchone()
-            old_count = int(old_row["cnt"] or 0)
+        cutoff_us = int((datetime.now() - timedelta(days=bounded_days)).timestamp() * 1_000_000)
+
+        conn = self._connect()
+        total_count = self._read_alert_counters(conn).get("total", 0)
+        old_row = conn.execute(
+            """
+            SELECT COUNT(*) AS cnt
+            FROM alert_history
+            WHERE created_at < ?
+            """,
+            (cutoff_us,),
+        ).fetchone()
+        old_count = int(old_row["cnt"] or 0)
 
         remaining_after_old = max(0, total_count - old_count)
         overflow_count = max(0, remaining_after_old - bounded_max_rows)
@@ -483,43 +822,48 @@ class AlertStore:
     def prune_history(self, retention_days: int = 30, max_rows: int = 20000) -> Dict[str, int]:
         bounded_days = max(1, int(retention_days))
         bounded_max_rows = max(100, int(max_rows))
-        cutoff = (datetime.now() - timedelta(days=bounded_days)).strftime("%Y-%m-%d %H:%M:%S")
+        cutoff_us = int((datetime.now() - timedelta(days=bounded_days)).timestamp() * 1_000_000)
 
-        with self._lock, self._connect() as conn:
+        def _prune(conn: sqlite3.Connection) -> Dict[str, int]:
             old_deleted = conn.execute(
                 """
                 DELETE FROM alert_history
                 WHERE created_at < ?
                 """,
-                (cutoff,),
+                (cutoff_us,),
             ).rowcount
 
-            row = conn.execute("SELECT COUNT(*) AS cnt FROM alert_history").fetchone()
-            current_count = int(row["cnt"] or 0)
+            current_count = self._read_alert_counters(conn).get("total", 0)
             overflow_deleted = 0
             if current_count > bounded_max_rows:
                 overflow = current_count - bounded_max_rows
+                # ids are monotonic, so the oldest overflow rows sit below the id at offset `overflow`.
+                threshold_row = conn.execute(
+                    """
+                    SELECT id
+                    FROM alert_history
+                    ORDER BY id ASC
+                    LIMIT 1 OFFSET ?
+                    """,
+                    (overflow,),
+                ).fetchone()
                 overflow_deleted = conn.execute(
                     """
                     DELETE FROM alert_history
-                    WHERE id IN (
-                        SELECT id
-                        FROM alert_history
-                        ORDER BY id ASC
-                        LIMIT ?
-                    )
+                    WHERE id < ?
                     """,
-                    (overflow,),
+                    (int(threshold_row["id"]),),
                 ).rowcount
 
-            row_after = conn.execute("SELECT COUNT(*) AS cnt FROM alert_history").fetchone()
-            remaining = int(row_after["cnt"] or 0)
+            remaining = current_count - int(overflow_deleted or 0)
 
-        return {
-            "retention_days": bounded_days,
-            "max_rows": bounded_max_rows,
-            "old_deleted": int(old_deleted or 0),
-            "overflow_deleted": int(overflow_deleted or 0),
-            "deleted_total": int((old_deleted or 0) + (overflow_deleted or 0)),
-            "remaining": remaining,
-        }
+            return {
+                "retention_days": bounded_days,
+                "max_rows": bounded_max_rows,
+                "old_deleted": int(old_deleted or 0),
+                "overflow_deleted": int(overflow_deleted or 0),
+                "deleted_total": int((old_deleted or 0) + (overflow_deleted or 0)),
+                "remaining": remaining,
+            }
+
+        return self._submit_write(_prune).result()
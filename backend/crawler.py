@@ -1,12 +1,192 @@
+import functools
+import itertools
+import logging
 import os
 import random
+import re
+import sqlite3
+import threading
 import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup, Tag
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from lxml import etree
+from lxml import html as lxml_html
+
+from news_cache_store import NewsCacheStore
+
+logger = logging.getLogger(__name__)
+
+
+def _class_xpath(name: str) -> str:
+    # XPath equivalent of the CSS ".name" class match.
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Selectors are compiled once per process; the CSS/XPath parsers never run on the crawl path.
+_XP_STOCK_TABLE = etree.XPath(f"//table[{_class_xpath('type5')}]")
+_XP_STOCK_TITLE_CELL = etree.XPath(f".//td[{_class_xpath('title')}]")
+_XP_STOCK_DATE_CELL = etree.XPath(f".//td[{_class_xpath('date')}]")
+_XP_STOCK_INFO_CELL = etree.XPath(f".//td[{_class_xpath('info')}]")
+_XP_GROUP_NEWS = etree.XPath(f"//div[{_class_xpath('group_news')}]")
+_XP_TITLE_LINKS_FALLBACK = etree.XPath(f"//a[{_class_xpath('news_tit')} and @href]")
+_XP_PROFILES = etree.XPath("//div[@data-sds-comp='Profile']")
+_XP_LEGACY_PRESS = etree.XPath(f".//a[{_class_xpath('info')} and {_class_xpath('press')}]")
+_XP_PROFILE_TITLE = etree.XPath(f".//span[{_class_xpath('sds-comps-profile-info-title-text')}]")
+_XP_PROFILE_SUBTEXTS = etree.XPath(
+    f".//div[{_class_xpath('sds-comps-profile-info-subtexts')}]"
+    f"//span[{_class_xpath('sds-comps-profile-info-subtext')}]"
+)
+
+_SEL_TITLE_LINKS = soupsieve.compile("div.group_news a[data-heatmap-target='.tit'][href]")
+_SEL_TITLE_LINKS_FALLBACK = soupsieve.compile("a.news_tit[href]")
+_SEL_PROFILES = soupsieve.compile("div[data-sds-comp='Profile']")
+_SEL_LEGACY_PRESS = soupsieve.compile("a.info.press")
+_SEL_PROFILE_TITLE = soupsieve.compile("span.sds-comps-profile-info-title-text")
+_SEL_PROFILE_SUBTEXTS = soupsieve.compile("div.sds-comps-profile-info-subtexts span.sds-comps-profile-info-subtext")
+
+# Limit BeautifulSoup tree building to the parts of the page the parsers read.
+_STRAIN_STOCK_TABLE = SoupStrainer("table", class_="type5")
+_STRAIN_SEARCH_RESULTS = SoupStrainer("div", class_="group_news")
+
+
+# Validates an article href and captures its host (minus "www.") in a single match.
+_ARTICLE_URL_RE = re.compile(r"https?://(?:(?i:www)\.)?([^/:?#]+)")
+
+# Cached search results are shared read-only snapshots; hits hand out the same item objects.
+NewsSnapshot = Tuple[Mapping[str, str], ...]
+
+
+def _freeze_news(news_list: Iterable[Mapping[str, str]]) -> NewsSnapshot:
+    return tuple(MappingProxyType(dict(item)) for item in news_list)
+
+
+PARSER_BACKENDS = ("lxml", "bs4")
+
+
+def _resolve_parser_backend(value: str) -> str:
+    # Unknown backends (e.g. "selectolax", which is not a dependency) fall back to lxml,
+    # which already matches in libxml2 and only wraps the nodes that are read.
+    backend = (value or "").strip().lower()
+    if backend in PARSER_BACKENDS:
+        return backend
+    logger.warning("[파서 설정] 지원하지 않는 파서 '%s', lxml 사용", value)
+    return "lxml"
+
+
+def _element_text(element, separator: str = "") -> str:
+    # Mirrors BeautifulSoup's get_text(separator, strip=True) for lxml elements.
+    return separator.join(text for text in (chunk.strip() for chunk in element.itertext()) if text)
+
+
+def _normalized_text(element) -> str:
+    # _normalize_text(_element_text(element, " ")) in one pass: split each text node
+    # once instead of joining the page text and splitting it again.
+    return " ".join(word for chunk in element.itertext() for word in chunk.split())
+
+
+# Headers shared by both crawlers live on the session; each crawler adds its own extras per request.
+_NAVER_HEADERS = MappingProxyType(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+        # requests advertises br/zstd only when a decoder for them is installed.
+        "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
+    }
+)
+_STOCK_NEWS_HEADERS = MappingProxyType(
+    {
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Connection": "keep-alive",
+    }
+)
+_NEWS_SEARCH_HEADERS = MappingProxyType({"Referer": "https://search.naver.com/"})
+
+
+def _build_naver_session() -> requests.Session:
+    session = requests.Session()
+    session.headers.update(_NAVER_HEADERS)
+
+    # Stock news pages retry inside urllib3; the search crawler keeps its own retry loop
+    # with throttling, so its adapter does not retry.
+    finance_retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["GET"]),
+    )
+    session.mount(
+        "https://finance.naver.com/",
+        HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=finance_retry),
+    )
+    search_pool_size = max(10, int(os.getenv("NAVER_SEARCH_MAX_CONCURRENCY", "4")))
+    session.mount(
+        "https://search.naver.com/",
+        HTTPAdapter(pool_connections=4, pool_maxsize=search_pool_size),
+    )
+    return session
+
+
+# One connection pool per Naver host, shared by every crawler instance.
+_NAVER_SESSION = _build_naver_session()
+
+
+class _ProfileIndex:
+    # Built once per search page: maps every Profile block to its parent and containing
+    # ancestors so each title link resolves its profile by walking only its own ancestors.
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.profiles = _XP_PROFILES(tree)
+        self.by_parent: Dict[object, List] = {}
+        self.containers: Dict[object, List] = {}
+        for profile in self.profiles:
+            self.by_parent.setdefault(profile.getparent(), []).append(profile)
+            for ancestor in profile.iterancestors():
+                self.containers.setdefault(ancestor, []).append(profile)
+        self._positions: Optional[Dict[object, int]] = None
+
+    def _document_positions(self) -> Dict[object, int]:
+        # Document order is only needed to break ties between several profiles.
+        if self._positions is None:
+            self._positions = {node: idx for idx, node in enumerate(self.tree.iter(etree.Element))}
+        return self._positions
+
+    def nearest(self, title_link):
+        if not self.profiles:
+            return None
+
+        # Prefer a direct Profile child in nearest containers first.
+        ancestors = list(title_link.iterancestors())
+        for ancestor in ancestors:
+            direct_profiles = self.by_parent.get(ancestor)
+            if direct_profiles is not None and len(direct_profiles) == 1:
+                return direct_profiles[0]
+
+        # Fallback to nearest profile by relative distance.
+        for ancestor in ancestors:
+            profiles = self.containers.get(ancestor)
+            if not profiles:
+                continue
+            positions = self._document_positions()
+            link_pos = positions[title_link]
+            return min(profiles, key=lambda profile: abs(positions[profile] - link_pos))
+
+        return None
 
 
 class NaverStockNewsCrawler:
@@ -16,86 +196,142 @@ class NaverStockNewsCrawler:
     """
 
     def __init__(self):
-        self.headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            "Accept-Encoding": "gzip, deflate",
-            "Connection": "keep-alive",
-        }
+        self.headers = _STOCK_NEWS_HEADERS
+        self.max_concurrent_fetches = int(os.getenv("NAVER_STOCK_MAX_CONCURRENCY", "8"))
+        # "lxml" walks the libxml2 tree directly; "bs4" keeps the BeautifulSoup path as a fallback.
+        self.parser_backend = _resolve_parser_backend(os.getenv("CRAWLER_PARSER_BACKEND", "lxml"))
+        self.session = _NAVER_SESSION
 
     def get_stock_news(self, stock_code: str, max_count: int = 10) -> List[Dict[str, str]]:
         try:
-            print(f"[크롤링 시작] 종목코드: {stock_code}")
+            logger.debug("[크롤링 시작] 종목코드: %s", stock_code)
 
             url = f"https://finance.naver.com/item/news_news.nhn?code={stock_code}&page=1"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, headers=self.headers, timeout=10)
             response.raise_for_status()
-            response.encoding = "euc-kr"
 
-            soup = BeautifulSoup(response.text, "lxml")
-            news_list: List[Dict[str, str]] = []
-
-            news_table = soup.find("table", {"class": "type5"})
-            if not news_table:
-                print(f"[경고] {stock_code}: 뉴스 테이블을 찾을 수 없습니다.")
+            # The page is always euc-kr; decode once instead of letting requests sniff the charset.
+            html = response.content.decode("euc-kr", errors="replace")
+            news_list = self._parse_stock_html(html, stock_code, max_count)
+            if news_list is None:
+                logger.warning("[경고] %s: 뉴스 테이블을 찾을 수 없습니다.", stock_code)
                 return []
 
-            rows = news_table.find_all("tr")
-            for idx, row in enumerate(rows):
-                if len(news_list) >= max_count:
-                    break
-
-                title_cell = row.find("td", {"class": "title"})
-                if not title_cell:
-                    continue
-
-                title_link = title_cell.find("a")
-                if not title_link:
-                    continue
-
-                date_cell = row.find("td", {"class": "date"})
-                date_text = date_cell.get_text(strip=True) if date_cell else "시간 정보 없음"
-
-                info_cell = row.find("td", {"class": "info"})
-                source_text = info_cell.get_text(strip=True) if info_cell else "출처 정보 없음"
-
-                title = title_link.get_text(strip=True)
-                link = title_link.get("href", "")
-                if link.startswith("/"):
-                    link = "https://finance.naver.com" + link
-
-                news_item = {
-                    "id": f"{stock_code}_{idx}_{int(time.time())}",
-                    "title": title,
-                    "link": link,
-                    "source": source_text,
-                    "published_date": date_text,
-                    "stock_code": stock_code,
-                    "crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                }
-                news_list.append(news_item)
-
-            print(f"[크롤링 완료] {stock_code}: {len(news_list)}개 뉴스 수집")
+            logger.info("[크롤링 완료] %s: %d개 뉴스 수집", stock_code, len(news_list))
             return news_list
 
         except requests.RequestException as e:
-            print(f"[네트워크 에러] {stock_code}: {e}")
+            logger.warning("[네트워크 에러] %s: %s", stock_code, e)
             return []
         except Exception as e:
-            print(f"[크롤링 에러] {stock_code}: {e}")
+            logger.error("[크롤링 에러] %s: %s", stock_code, e)
             return []
 
+    def _parse_stock_html(self, html: str, stock_code: str, max_count: int) -> Optional[List[Dict[str, str]]]:
+        if self.parser_backend == "bs4":
+            return self._parse_stock_html_bs4(html, stock_code, max_count)
+
+        tree = lxml_html.fromstring(html)
+        news_tables = _XP_STOCK_TABLE(tree)
+        if not news_tables:
+            return None
+
+        news_list: List[Dict[str, str]] = []
+        # One page is one crawl; every item shares the same id suffix and crawled_at.
+        crawl_ts = int(time.time())
+        crawled_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        for idx, row in enumerate(news_tables[0].iter("tr")):
+            if len(news_list) >= max_count:
+                break
+
+            title_cells = _XP_STOCK_TITLE_CELL(row)
+            if not title_cells:
+                continue
+
+            title_link = next(title_cells[0].iter("a"), None)
+            if title_link is None:
+                continue
+
+            date_cells = _XP_STOCK_DATE_CELL(row)
+            date_text = _element_text(date_cells[0]) if date_cells else "시간 정보 없음"
+
+            info_cells = _XP_STOCK_INFO_CELL(row)
+            source_text = _element_text(info_cells[0]) if info_cells else "출처 정보 없음"
+
+            title = _element_text(title_link)
+            link = title_link.get("href", "")
+            if link.startswith("/"):
+                link = "https://finance.naver.com" + link
+
+            news_item = {
+                "id": f"{stock_code}_{idx}_{crawl_ts}",
+                "title": title,
+                "link": link,
+                "source": source_text,
+                "published_date": date_text,
+                "stock_code": stock_code,
+                "crawled_at": crawled_at,
+            }
+            news_list.append(news_item)
+
+        return news_list
+
+    def _parse_stock_html_bs4(self, html: str, stock_code: str, max_count: int) -> Optional[List[Dict[str, str]]]:
+        soup = BeautifulSoup(html, "lxml", parse_only=_STRAIN_STOCK_TABLE)
+        news_list: List[Dict[str, str]] = []
+        crawl_ts = int(time.time())
+        crawled_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        news_table = soup.find("table", {"class": "type5"})
+        if not news_table:
+            return None
+
+        rows = news_table.find_all("tr")
+        for idx, row in enumerate(rows):
+            if len(news_list) >= max_count:
+                break
+
+            title_cell = row.find("td", {"class": "title"})
+            if not title_cell:
+                continue
+
+            title_link = title_cell.find("a")
+            if not title_link:
+                continue
+
+            date_cell = row.find("td", {"class": "date"})
+            date_text = date_cell.get_text(strip=True) if date_cell else "시간 정보 없음"
+
+            info_cell = row.find("td", {"class": "info"})
+            source_text = info_cell.get_text(strip=True) if info_cell else "출처 정보 없음"
+
+            title = title_link.get_text(strip=True)
+            link = title_link.get("href", "")
+            if link.startswith("/"):
+                link = "https://finance.naver.com" + link
+
+            news_item = {
+                "id": f"{stock_code}_{idx}_{crawl_ts}",
+                "title": title,
+                "link": link,
+                "source": source_text,
+                "published_date": date_text,
+                "stock_code": stock_code,
+                "crawled_at": crawled_at,
+            }
+            news_list.append(news_item)
+
+        return news_list
+
     def get_multiple_stocks_news(self, stock_codes: List[str], max_each: int = 5) -> Dict[str, List[Dict[str, str]]]:
-        results: Dict[str, List[Dict[str, str]]] = {}
-        for stock_code in stock_codes:
-            results[stock_code] = self.get_stock_news(stock_code, max_each)
-            time.sleep(1.0)
-        return results
+        # Fetches are network-bound; run them side by side instead of sleeping between codes.
+        # get_stock_news never raises, so every code gets an entry.
+        if not stock_codes:
+            return {}
+        workers = max(1, min(self.max_concurrent_fetches, len(stock_codes)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="stock-news") as pool:
+            fetched = list(pool.map(lambda code: self.get_stock_news(code, max_each), stock_codes))
+        return dict(zip(stock_codes, fetched))
 
 
 class NaverNewsSearchCrawler:
@@ -104,32 +340,58 @@ class NaverNewsSearchCrawler:
     """
 
     def __init__(self):
-        self.headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-            "Referer": "https://search.naver.com/",
-        }
-        self.session = requests.Session()
-        self.session.headers.update(self.headers)
+        self.headers = _NEWS_SEARCH_HEADERS
+        self.max_concurrent_requests = int(os.getenv("NAVER_SEARCH_MAX_CONCURRENCY", "4"))
+        self.session = _NAVER_SESSION
 
         self.max_retries = 3
         self.base_backoff = 0.8
         self.min_request_interval_sec = float(os.getenv("NAVER_MIN_REQUEST_INTERVAL_SEC", "0.9"))
         self.cache_ttl_sec = int(os.getenv("NEWS_CACHE_TTL_SEC", "180"))
+        self.cache_max_entries = max(1, int(os.getenv("NEWS_CACHE_MAX", "1024")))
+        # Between cache_ttl_sec and stale_ttl_sec a hit is served immediately and refreshed in the background.
+        self.stale_ttl_sec = int(os.getenv("NEWS_STALE_TTL_SEC", "1800"))
+        # Only cache a keyword once it has been fetched this many times (1 = cache on first fetch).
+        self.cache_admit_after = max(1, int(os.getenv("NEWS_CACHE_ADMIT_AFTER", "1")))
+        # Optional SQLite file shared by every worker process; the in-memory cache stays the first tier.
+        shared_cache_path = os.getenv("NEWS_CACHE_DB_PATH", "").strip()
+        self._shared_cache: Optional[NewsCacheStore] = None
+        if shared_cache_path:
+            self._shared_cache = NewsCacheStore(
+                shared_cache_path,
+                max_age_sec=max(self.cache_ttl_sec, self.stale_ttl_sec),
+            )
+        self.parser_backend = _resolve_parser_backend(os.getenv("CRAWLER_PARSER_BACKEND", "lxml"))
 
         self._last_request_ts = 0.0
-        self._cache: Dict[str, Dict[str, object]] = {}
+        self._next_request_ts = 0.0
+        self._throttle_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        # key -> (fetched_at, news). Kept in refresh order and capped at cache_max_entries;
+        # expired entries stay around as the stale fallback until evicted.
+        self._cache: "OrderedDict[str, Tuple[float, NewsSnapshot]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._fetch_counts: Dict[str, int] = {}
+        self._refreshing: set = set()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        # Parsing runs on the fetching thread by default (lxml releases the GIL while it
+        # builds the tree). NAVER_PARSE_PROCESSES > 0 moves large pages to worker processes.
+        self.parse_processes = max(0, int(os.getenv("NAVER_PARSE_PROCESSES", "0")))
+        self.parse_process_min_bytes = int(os.getenv("NAVER_PARSE_PROCESS_MIN_BYTES", "32768"))
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        # Concurrent misses for the same cache key wait on the first caller's fetch.
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
         self._last_result_meta: Dict[str, Dict[str, object]] = {}
         self._runtime_stats: Dict[str, int] = {
             "requests_total": 0,
             "request_failures": 0,
             "network_fetches": 0,
             "cache_hits": 0,
+            "warm_cache_hits": 0,
             "stale_cache_hits": 0,
+            "background_refreshes": 0,
+            "coalesced_fetches": 0,
             "empty_results": 0,
             "exceptions": 0,
         }
@@ -138,7 +400,7 @@ class NaverNewsSearchCrawler:
         """
         Example:
         {
-          "source": "network|cache|stale_cache|empty",
+          "source": "network|cache|warm_cache|stale_cache|empty",
           "age_sec": 1.2,
           "fetched_at": "YYYY-mm-dd HH:MM:SS",
           "cache_ttl_sec": 180
@@ -148,19 +410,15 @@ class NaverNewsSearchCrawler:
 
     def get_runtime_metrics(self) -> Dict[str, object]:
         now = time.time()
-        cache_entries = len(self._cache)
-        valid_cache_entries = 0
-        stale_cache_entries = 0
-
-        for entry in self._cache.values():
-            fetched_at = float(entry.get("fetched_at", 0.0))
-            if fetched_at <= 0:
-                stale_cache_entries += 1
-                continue
-            if now - fetched_at <= self.cache_ttl_sec:
+        with self._cache_lock:
+            cache_entries = len(self._cache)
+            # Entries are ordered by fetch time, so only the fresh tail is visited.
+            valid_cache_entries = 0
+            for fetched_at, _news in reversed(self._cache.values()):
+                if now - fetched_at > self.cache_ttl_sec:
+                    break
                 valid_cache_entries += 1
-            else:
-                stale_cache_entries += 1
+        stale_cache_entries = cache_entries - valid_cache_entries
 
         last_request_age_sec = None
         if self._last_request_ts > 0:
@@ -168,6 +426,7 @@ class NaverNewsSearchCrawler:
 
         return {
             "cache_ttl_sec": self.cache_ttl_sec,
+            "stale_ttl_sec": self.stale_ttl_sec,
             "min_request_interval_sec": self.min_request_interval_sec,
             "cache_entries": cache_entries,
             "valid_cache_entries": valid_cache_entries,
@@ -178,7 +437,10 @@ class NaverNewsSearchCrawler:
         }
 
     def _cache_key(self, keyword: str, max_count: int) -> str:
-        return f"{keyword}::{max_count}"
+        # Width/compatibility forms, case and surrounding or repeated whitespace do not
+        # change the search, so they share one entry.
+        normalized = " ".join(unicodedata.normalize("NFKC", keyword).split()).casefold()
+        return f"{normalized}::{max_count}"
 
     def _set_last_meta(self, keyword: str, source: str, fetched_at: float):
         age_sec = max(0.0, time.time() - fetched_at)
@@ -189,48 +451,107 @@ class NaverNewsSearchCrawler:
             "cache_ttl_sec": self.cache_ttl_sec,
         }
 
-    def _get_cached_news(self, keyword: str, max_count: int) -> Optional[Tuple[List[Dict[str, str]], float]]:
+    def _cache_entry(self, keyword: str, max_count: int) -> Optional[Tuple[float, NewsSnapshot]]:
         key = self._cache_key(keyword, max_count)
-        entry = self._cache.get(key)
-        if not entry:
-            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if self._shared_cache is None or (entry is not None and time.time() - entry[0] <= self.cache_ttl_sec):
+            return entry
 
-        news = entry.get("data", [])
-        fetched_at = float(entry.get("fetched_at", 0.0))
-        if not isinstance(news, list) or fetched_at <= 0:
+        # Missing or no longer fresh here; another worker may have fetched it more recently.
+        try:
+            shared = self._shared_cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning("[공유 캐시 조회 실패] %s: %s", key, e)
+            return entry
+        if shared is None or (entry is not None and shared[0] <= entry[0]):
+            return entry
+
+        fetched_at, news = shared
+        entry = (fetched_at, _freeze_news(news))
+        self._store_cache_entry(key, entry)
+        return entry
+
+    def _store_cache_entry(self, key: str, entry: Tuple[float, NewsSnapshot]):
+        with self._cache_lock:
+            self._cache[key] = entry
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def _get_cached_news(self, keyword: str, max_count: int) -> Optional[Tuple[List[Mapping[str, str]], float]]:
+        entry = self._cache_entry(keyword, max_count)
+        if entry is None:
             return None
 
-        age_sec = time.time() - fetched_at
-        if age_sec > self.cache_ttl_sec:
+        fetched_at, news = entry
+        if time.time() - fetched_at > self.cache_ttl_sec:
             return None
 
-        return ([dict(item) for item in news], fetched_at)
+        return (list(news), fetched_at)
 
-    def _get_stale_cached_news(self, keyword: str, max_count: int) -> Optional[Tuple[List[Dict[str, str]], float]]:
-        key = self._cache_key(keyword, max_count)
-        entry = self._cache.get(key)
-        if not entry:
+    def _get_warm_cached_news(self, keyword: str, max_count: int) -> Optional[Tuple[List[Mapping[str, str]], float]]:
+        entry = self._cache_entry(keyword, max_count)
+        if entry is None:
             return None
 
-        news = entry.get("data", [])
-        fetched_at = float(entry.get("fetched_at", 0.0))
-        if not isinstance(news, list) or fetched_at <= 0:
+        fetched_at, news = entry
+        if time.time() - fetched_at > self.stale_ttl_sec:
             return None
 
-        return ([dict(item) for item in news], fetched_at)
+        return (list(news), fetched_at)
+
+    def _get_stale_cached_news(self, keyword: str, max_count: int) -> Optional[Tuple[List[Mapping[str, str]], float]]:
+        entry = self._cache_entry(keyword, max_count)
+        if entry is None:
+            return None
+
+        fetched_at, news = entry
+        return (list(news), fetched_at)
+
+    def _admit_to_cache(self, key: str) -> bool:
+        if self.cache_admit_after <= 1:
+            return True
+        with self._cache_lock:
+            if key in self._cache:
+                return True
+            # The counter map is only an admission hint; reset it rather than let it grow without bound.
+            if len(self._fetch_counts) >= self.cache_max_entries * 4:
+                self._fetch_counts.clear()
+            count = self._fetch_counts.get(key, 0) + 1
+            if count >= self.cache_admit_after:
+                self._fetch_counts.pop(key, None)
+                return True
+            self._fetch_counts[key] = count
+            return False
 
-    def _set_cache(self, keyword: str, max_count: int, news_list: List[Dict[str, str]]):
+    def _set_cache(self, keyword: str, max_count: int, news_list: Iterable[Mapping[str, str]]):
         key = self._cache_key(keyword, max_count)
-        self._cache[key] = {
-            "fetched_at": time.time(),
-            "data": [dict(item) for item in news_list],
-        }
+        if not self._admit_to_cache(key):
+            return
+        snapshot = news_list if isinstance(news_list, tuple) else _freeze_news(news_list)
+        entry = (time.time(), snapshot)
+        self._store_cache_entry(key, entry)
+
+        if self._shared_cache is not None:
+            try:
+                self._shared_cache.set(key, entry[0], snapshot)
+            except sqlite3.Error as e:
+                logger.warning("[공유 캐시 저장 실패] %s: %s", key, e)
+
+    def _bump_stat(self, name: str):
+        with self._stats_lock:
+            self._runtime_stats[name] += 1
 
     def _throttle(self):
-        now = time.time()
-        elapsed = now - self._last_request_ts
-        if elapsed < self.min_request_interval_sec:
-            time.sleep(self.min_request_interval_sec - elapsed)
+        # Each caller reserves the next request slot under the lock and sleeps outside it,
+        # so concurrent fetches stay min_request_interval_sec apart without serializing.
+        with self._throttle_lock:
+            now = time.time()
+            slot = max(now, self._next_request_ts)
+            self._next_request_ts = slot + self.min_request_interval_sec
+        if slot > now:
+            time.sleep(slot - now)
         self._last_request_ts = time.time()
 
     def _request_search(self, keyword: str) -> Optional[requests.Response]:
@@ -241,113 +562,324 @@ class NaverNewsSearchCrawler:
         for attempt in range(1, self.max_retries + 1):
             try:
                 self._throttle()
-                self._runtime_stats["requests_total"] += 1
-                response = self.session.get(url, params=params, timeout=15)
+                self._bump_stat("requests_total")
+                response = self.session.get(url, params=params, headers=self.headers, timeout=15)
                 response.raise_for_status()
                 return response
             except requests.RequestException as e:
-                self._runtime_stats["request_failures"] += 1
+                self._bump_stat("request_failures")
                 last_error = e
                 status_code = getattr(getattr(e, "response", None), "status_code", None)
                 should_retry = status_code in (403, 429, 500, 502, 503, 504) or status_code is None
 
                 if attempt < self.max_retries and should_retry:
                     sleep_sec = self.base_backoff * attempt + random.uniform(0.1, 0.5)
-                    print(f"[검색 재시도] {keyword}: attempt={attempt}, sleep={sleep_sec:.2f}s, status={status_code}")
+                    logger.warning(
+                        "[검색 재시도] %s: attempt=%d, sleep=%.2fs, status=%s", keyword, attempt, sleep_sec, status_code
+                    )
                     time.sleep(sleep_sec)
                     continue
                 break
 
-        print(f"[검색 요청 실패] {keyword}: {last_error}")
+        logger.warning("[검색 요청 실패] %s: %s", keyword, last_error)
         return None
 
-    def get_news_by_keyword(self, keyword: str, max_count: int = 10) -> List[Dict[str, str]]:
+    def get_news_by_keyword(self, keyword: str, max_count: int = 10, copy: bool = False) -> List[Mapping[str, str]]:
+        # Items are read-only mappings shared with the cache; pass copy=True for mutable dicts.
+        news_list = self._get_news_by_keyword(keyword, max_count)
+        if copy:
+            return [dict(item) for item in news_list]
+        return news_list
+
+    def _get_news_by_keyword(self, keyword: str, max_count: int) -> List[Mapping[str, str]]:
         try:
-            print(f"[검색 크롤링 시작] 키워드: {keyword}")
+            logger.debug("[검색 크롤링 시작] 키워드: %s", keyword)
 
             cached = self._get_cached_news(keyword, max_count)
             if cached is not None:
                 cached_news, fetched_at = cached
                 self._set_last_meta(keyword, source="cache", fetched_at=fetched_at)
-                self._runtime_stats["cache_hits"] += 1
-                print(f"[검색 캐시 사용] {keyword}: {len(cached_news)}개")
+                self._bump_stat("cache_hits")
+                logger.debug("[검색 캐시 사용] %s: %d개", keyword, len(cached_news))
                 return cached_news
 
-            response = self._request_search(keyword)
-            if response is None:
+            warm = self._get_warm_cached_news(keyword, max_count)
+            if warm is not None:
+                warm_news, fetched_at = warm
+                self._schedule_refresh(keyword, max_count)
+                self._set_last_meta(keyword, source="warm_cache", fetched_at=fetched_at)
+                self._bump_stat("warm_cache_hits")
+                logger.debug("[검색 캐시 사용 + 백그라운드 갱신] %s: %d개", keyword, len(warm_news))
+                return warm_news
+
+            news_list = self._fetch_news_coalesced(keyword, max_count)
+            if news_list is None:
                 stale = self._get_stale_cached_news(keyword, max_count)
                 if stale is not None:
                     stale_news, fetched_at = stale
                     self._set_last_meta(keyword, source="stale_cache", fetched_at=fetched_at)
-                    self._runtime_stats["stale_cache_hits"] += 1
-                    print(f"[검색 stale 캐시 fallback] {keyword}: {len(stale_news)}개")
+                    self._bump_stat("stale_cache_hits")
+                    logger.warning("[검색 stale 캐시 fallback] %s: %d개", keyword, len(stale_news))
                     return stale_news
 
                 self._set_last_meta(keyword, source="empty", fetched_at=time.time())
-                self._runtime_stats["empty_results"] += 1
+                self._bump_stat("empty_results")
                 return []
 
-            soup = BeautifulSoup(response.text, "lxml")
-            title_links = self._select_title_links(soup)
-            news_list: List[Dict[str, str]] = []
-            seen_links = set()
-
-            for link in title_links:
-                if len(news_list) >= max_count:
-                    break
-
-                href = (link.get("href") or "").strip()
-                if not self._is_valid_article_link(href):
-                    continue
-                if href in seen_links:
-                    continue
-
-                title = self._normalize_text(link.get("title") or link.get_text(" ", strip=True))
-                if not title or title == "\ub124\uc774\ubc84\ub274\uc2a4":
-                    continue
-
-                source, published_date = self._extract_source_and_date(link, href)
-                news_item = {
-                    "id": f"{keyword}_{len(news_list)}_{int(time.time())}",
-                    "title": title,
-                    "link": href,
-                    "source": source,
-                    "published_date": published_date,
-                    "keyword": keyword,
-                    "crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                }
-                news_list.append(news_item)
-                seen_links.add(href)
-
-            fetched_at = time.time()
-            self._set_cache(keyword, max_count, news_list)
-            self._set_last_meta(keyword, source="network", fetched_at=fetched_at)
-            self._runtime_stats["network_fetches"] += 1
-            if not news_list:
-                self._runtime_stats["empty_results"] += 1
-            print(f"[검색 크롤링 완료] {keyword}: {len(news_list)}개 뉴스 수집")
+            logger.info("[검색 크롤링 완료] %s: %d개 뉴스 수집", keyword, len(news_list))
             return news_list
 
         except Exception as e:
-            self._runtime_stats["exceptions"] += 1
+            self._bump_stat("exceptions")
             stale = self._get_stale_cached_news(keyword, max_count)
             if stale is not None:
                 stale_news, fetched_at = stale
                 self._set_last_meta(keyword, source="stale_cache", fetched_at=fetched_at)
-                self._runtime_stats["stale_cache_hits"] += 1
-                print(f"[검색 예외 stale 캐시 fallback] {keyword}: {len(stale_news)}개")
+                self._bump_stat("stale_cache_hits")
+                logger.warning("[검색 예외 stale 캐시 fallback] %s: %d개", keyword, len(stale_news))
                 return stale_news
 
             self._set_last_meta(keyword, source="empty", fetched_at=time.time())
-            self._runtime_stats["empty_results"] += 1
-            print(f"[검색 크롤링 에러] {keyword}: {e}")
+            self._bump_stat("empty_results")
+            logger.error("[검색 크롤링 에러] %s: %s", keyword, e)
             return []
 
+    def _fetch_news(self, keyword: str, max_count: int) -> Optional[List[Mapping[str, str]]]:
+        # Returns None when the request itself failed so callers can fall back to stale cache.
+        response = self._request_search(keyword)
+        if response is None:
+            return None
+
+        news_snapshot = _freeze_news(self._parse_search_response(response.text, keyword, max_count))
+        news_list = list(news_snapshot)
+
+        fetched_at = time.time()
+        self._set_cache(keyword, max_count, news_snapshot)
+        self._set_last_meta(keyword, source="network", fetched_at=fetched_at)
+        self._bump_stat("network_fetches")
+        if not news_list:
+            self._bump_stat("empty_results")
+        return news_list
+
+    def _parse_search_response(self, html: str, keyword: str, max_count: int) -> List[Dict[str, str]]:
+        if self.parse_processes <= 0 or len(html) < self.parse_process_min_bytes:
+            return self._parse_search_html(html, keyword, max_count)
+
+        with self._cache_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(max_workers=self.parse_processes)
+            pool = self._parse_pool
+        return pool.submit(_parse_search_page, html, keyword, max_count, self.parser_backend).result()
+
+    def _fetch_news_coalesced(self, keyword: str, max_count: int) -> Optional[List[Mapping[str, str]]]:
+        key = self._cache_key(keyword, max_count)
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            self._bump_stat("coalesced_fetches")
+            news_list = future.result()
+            if news_list is None:
+                return None
+            self._set_last_meta(keyword, source="network", fetched_at=time.time())
+            return list(news_list)
+
+        try:
+            news_list = self._fetch_news(keyword, max_count)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(news_list)
+            return news_list
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _schedule_refresh(self, keyword: str, max_count: int):
+        key = self._cache_key(keyword, max_count)
+        with self._cache_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="news-refresh")
+            pool = self._refresh_pool
+        self._bump_stat("background_refreshes")
+        pool.submit(self._refresh, key, keyword, max_count)
+
+    def _refresh(self, key: str, keyword: str, max_count: int):
+        try:
+            self._fetch_news_coalesced(keyword, max_count)
+        except Exception as e:
+            self._bump_stat("exceptions")
+            logger.warning("[검색 백그라운드 갱신 에러] %s: %s", keyword, e)
+        finally:
+            with self._cache_lock:
+                self._refreshing.discard(key)
+
+    def get_news_by_keywords(self, keywords: List[str], max_count: int = 10) -> Dict[str, List[Mapping[str, str]]]:
+        # Fresh and warm cache hits are answered inline; only misses go to the pool, where the
+        # shared throttle still spaces out the actual network requests.
+        unique_keywords = list(dict.fromkeys(keywords))
+        results: Dict[str, List[Mapping[str, str]]] = {}
+        misses: List[str] = []
+        for keyword in unique_keywords:
+            entry = self._cache_entry(keyword, max_count)
+            if entry is not None and time.time() - entry[0] <= max(self.cache_ttl_sec, self.stale_ttl_sec):
+                results[keyword] = self.get_news_by_keyword(keyword, max_count)
+            else:
+                misses.append(keyword)
+
+        if len(misses) == 1:
+            results[misses[0]] = self.get_news_by_keyword(misses[0], max_count)
+        elif misses:
+            workers = max(1, min(self.max_concurrent_requests, len(misses)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news-search") as pool:
+                fetched = list(pool.map(lambda keyword: self.get_news_by_keyword(keyword, max_count), misses))
+            results.update(zip(misses, fetched))
+
+        return {keyword: results[keyword] for keyword in unique_keywords}
+
+    def _parse_search_html(self, html: str, keyword: str, max_count: int) -> List[Dict[str, str]]:
+        if self.parser_backend == "bs4":
+            # The modern layout keeps every result inside div.group_news; only the legacy
+            # fallback needs the whole page.
+            soup = BeautifulSoup(html, "lxml", parse_only=_STRAIN_SEARCH_RESULTS)
+            title_links = _SEL_TITLE_LINKS.iselect(soup)
+            first_link = next(title_links, None)
+            if first_link is None:
+                soup = BeautifulSoup(html, "lxml")
+                title_links = self._select_title_links(soup)
+            else:
+                title_links = itertools.chain([first_link], title_links)
+            return self._collect_search_items(
+                title_links,
+                keyword,
+                max_count,
+                title_of=lambda link: self._normalize_text(link.get_text(" ", strip=True)),
+                extract=functools.partial(self._extract_source_and_date, position_cache={}),
+            )
+
+        tree = lxml_html.fromstring(html)
+        profile_index = _ProfileIndex(tree)
+        # Pick the extractor once per page: pages with Profile blocks never need the
+        # legacy press lookup, and legacy pages have no profiles to search.
+        if profile_index.profiles:
+            def extract(link, url_source):
+                return self._extract_profile_source_and_date(link, url_source, profile_index)
+        else:
+            extract = self._extract_legacy_source_and_date
+        return self._collect_search_items(
+            self._iter_title_links_lxml(tree),
+            keyword,
+            max_count,
+            title_of=_normalized_text,
+            extract=extract,
+        )
+
+    def _collect_search_items(self, title_links, keyword: str, max_count: int, title_of, extract) -> List[Dict[str, str]]:
+        news_list: List[Dict[str, str]] = []
+        if max_count <= 0:
+            return news_list
+        crawl_ts = int(time.time())
+        crawled_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        seen_links = set()
+
+        for link in title_links:
+            href = (link.get("href") or "").strip()
+            url_match = _ARTICLE_URL_RE.match(href)
+            if url_match is None:
+                continue
+            if href in seen_links:
+                continue
+
+            title_attr = link.get("title")
+            title = self._normalize_text(title_attr) if title_attr else title_of(link)
+            if not title or title == "\ub124\uc774\ubc84\ub274\uc2a4":
+                continue
+
+            source, published_date = extract(link, url_match.group(1).lower())
+            news_item = {
+                "id": f"{keyword}_{len(news_list)}_{crawl_ts}",
+                "title": title,
+                "link": href,
+                "source": source,
+                "published_date": published_date,
+                "keyword": keyword,
+                "crawled_at": crawled_at,
+            }
+            news_list.append(news_item)
+            seen_links.add(href)
+            # Stop before pulling another anchor from the (lazy) link iterator.
+            if len(news_list) >= max_count:
+                break
+
+        return news_list
+
+    def _iter_title_links_lxml(self, tree) -> Iterator:
+        # Yields lazily so _collect_search_items stops walking anchors once max_count items are built.
+        containers = _XP_GROUP_NEWS(tree)
+        container_set = set(containers)
+        found = False
+        for container in containers:
+            # Anchors of a nested group_news are already visited through the outer one.
+            if any(ancestor in container_set for ancestor in container.iterancestors()):
+                continue
+            for link in container.iter("a"):
+                if link.get("data-heatmap-target") == ".tit" and link.get("href") is not None:
+                    found = True
+                    yield link
+
+        if not found:
+            yield from _XP_TITLE_LINKS_FALLBACK(tree)
+
+    def _extract_legacy_source_and_date(self, title_link, url_source: str) -> Tuple[str, str]:
+        source = url_source
+        parent = title_link.getparent()
+        if parent is not None:
+            press_elems = _XP_LEGACY_PRESS(parent)
+            if press_elems:
+                press_text = _normalized_text(press_elems[0])
+                if press_text:
+                    source = press_text
+        return source, "시간 정보 없음"
+
+    def _extract_profile_source_and_date(self, title_link, url_source: str, profile_index: _ProfileIndex) -> Tuple[str, str]:
+        source = url_source
+        published_date = "시간 정보 없음"
+
+        profile = profile_index.nearest(title_link)
+        if profile is None:
+            return source, published_date
+
+        source_elems = _XP_PROFILE_TITLE(profile)
+        if source_elems:
+            source_text = _normalized_text(source_elems[0])
+            if source_text:
+                source = source_text
+
+        subtexts = _XP_PROFILE_SUBTEXTS(profile)
+        for sub in subtexts:
+            text = _normalized_text(sub)
+            if not text:
+                continue
+            if text in ("\ub124\uc774\ubc84\ub274\uc2a4", source):
+                continue
+            published_date = text
+            break
+
+        return source, published_date
+
     def _select_title_links(self, soup: BeautifulSoup) -> List[Tag]:
-        links = soup.select("div.group_news a[data-heatmap-target='.tit'][href]")
+        links = _SEL_TITLE_LINKS.select(soup)
         if links:
             return links
-        return soup.select("a.news_tit[href]")
+        return _SEL_TITLE_LINKS_FALLBACK.select(soup)
 
     def _is_valid_article_link(self, href: str) -> bool:
         if not href:
@@ -358,30 +890,35 @@ class NaverNewsSearchCrawler:
             return False
         return True
 
-    def _extract_source_and_date(self, title_link: Tag, href: str) -> Tuple[str, str]:
-        source = self._source_from_url(href)
+    def _extract_source_and_date(
+        self,
+        title_link: Tag,
+        url_source: str,
+        position_cache: Optional[Dict[int, Tuple[List[Tag], Dict[int, int]]]] = None,
+    ) -> Tuple[str, str]:
+        source = url_source
         published_date = "시간 정보 없음"
 
         # Legacy layout fallback.
         parent = title_link.parent
         if parent:
-            press_elem = parent.select_one("a.info.press")
+            press_elem = _SEL_LEGACY_PRESS.select_one(parent)
             if press_elem:
                 press_text = self._normalize_text(press_elem.get_text(" ", strip=True))
                 if press_text:
                     source = press_text
 
-        profile = self._find_nearest_profile(title_link)
+        profile = self._find_nearest_profile(title_link, position_cache)
         if not profile:
             return source, published_date
 
-        source_elem = profile.select_one("span.sds-comps-profile-info-title-text")
+        source_elem = _SEL_PROFILE_TITLE.select_one(profile)
         if source_elem:
             source_text = self._normalize_text(source_elem.get_text(" ", strip=True))
             if source_text:
                 source = source_text
 
-        subtexts = profile.select("div.sds-comps-profile-info-subtexts span.sds-comps-profile-info-subtext")
+        subtexts = _SEL_PROFILE_SUBTEXTS.select(profile)
         for sub in subtexts:
             text = self._normalize_text(sub.get_text(" ", strip=True))
             if not text:
@@ -393,7 +930,11 @@ class NaverNewsSearchCrawler:
 
         return source, published_date
 
-    def _find_nearest_profile(self, title_link: Tag) -> Optional[Tag]:
+    def _find_nearest_profile(
+        self,
+        title_link: Tag,
+        position_cache: Optional[Dict[int, Tuple[List[Tag], Dict[int, int]]]] = None,
+    ) -> Optional[Tag]:
         # Prefer a direct Profile child in nearest containers first.
         for ancestor in title_link.parents:
             if not isinstance(ancestor, Tag):
@@ -406,12 +947,22 @@ class NaverNewsSearchCrawler:
         for ancestor in title_link.parents:
             if not isinstance(ancestor, Tag):
                 continue
-            profiles = ancestor.select("div[data-sds-comp='Profile']")
+            # Links on one page share ancestors; position_cache (one per parsed page) keeps
+            # each ancestor's profile list and tag positions so its subtree is walked once.
+            cached = position_cache.get(id(ancestor)) if position_cache is not None else None
+            if cached is None:
+                profiles = _SEL_PROFILES.select(ancestor)
+                positions: Dict[int, int] = {}
+                if profiles:
+                    tags_in_ancestor = (node for node in ancestor.descendants if isinstance(node, Tag))
+                    positions = {id(node): idx for idx, node in enumerate(tags_in_ancestor)}
+                if position_cache is not None:
+                    position_cache[id(ancestor)] = (profiles, positions)
+            else:
+                profiles, positions = cached
             if not profiles:
                 continue
 
-            tags_in_ancestor = [node for node in ancestor.descendants if isinstance(node, Tag)]
-            positions = {id(node): idx for idx, node in enumerate(tags_in_ancestor)}
             link_pos = positions.get(id(title_link))
             if link_pos is None:
                 continue
@@ -431,10 +982,24 @@ class NaverNewsSearchCrawler:
             return "출처 정보 없음"
 
     def _normalize_text(self, value: str) -> str:
+        # str.split/join measured faster than a compiled \s+ regex substitution here.
         return " ".join(value.split()) if value else ""
 
 
+_PARSE_WORKER: Optional[NaverNewsSearchCrawler] = None
+
+
+def _parse_search_page(html: str, keyword: str, max_count: int, parser_backend: str) -> List[Dict[str, str]]:
+    # Module-level entry point for the parse process pool; one crawler per worker process.
+    global _PARSE_WORKER
+    if _PARSE_WORKER is None:
+        _PARSE_WORKER = NaverNewsSearchCrawler()
+    _PARSE_WORKER.parser_backend = parser_backend
+    return _PARSE_WORKER._parse_search_html(html, keyword, max_count)
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     crawler = NaverNewsSearchCrawler()
     keyword = "\uc0bc\uc131\uc804\uc790"
     print(f"=== '{keyword}' 뉴스 검색 크롤링 테스트 ===")
@@ -1,16 +1,20 @@
+import functools
 import hashlib
+import heapq
 import json
 import re
 import sqlite3
 import threading
 import time
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Callable, Dict, Iterator, List, Mapping, Optional, Tuple
 
 
 LABELS = ("positive", "negative", "neutral")
 TESTER_TIERS = ("core", "general", "observer")
-STOPWORDS = {
+STOPWORDS = frozenset({
     "기자",
     "뉴스",
     "관련",
@@ -21,7 +25,7 @@ STOPWORDS = {
     "시장",
     "기업",
     "주식",
-}
+})
 DEFAULT_CONSENSUS_MIN_VOTES = 20
 DEFAULT_CONSENSUS_THRESHOLD = 0.8
 DEFAULT_TRUST_WEIGHT = 1.0
@@ -42,28 +46,195 @@ TIER_DEMOTE_TARGET = {
     "general": "observer",
     "observer": "observer",
 }
+# (target tier, recommendation) per current tier; tiers already at the end of the ladder are absent.
+TIER_PROMOTE_DECISION = {
+    tier: (target, f"promote_{tier}_to_{target}")
+    for tier, target in TIER_PROMOTE_TARGET.items()
+    if target != tier
+}
+TIER_DEMOTE_DECISION = {
+    tier: (target, f"demote_{tier}_to_{target}")
+    for tier, target in TIER_DEMOTE_TARGET.items()
+    if target != tier
+}
+
+# Orders label groups the way _consensus_label breaks ties: positive, then negative, then neutral.
+LABEL_RANK_SQL = "CASE user_label WHEN 'positive' THEN 0 WHEN 'negative' THEN 1 ELSE 2 END"
+
+# Users whose resolved trust stays cached; the cache is reset wholesale once it fills up.
+TRUST_CACHE_MAX_ENTRIES = 4096
+# Aggregate reads (metrics, per-stock signals) served from memory until the TTL lapses or this store commits a write.
+READ_CACHE_TTL_SEC = 15.0
+READ_CACHE_MAX_ENTRIES = 1024
+
+# weighted_score is derived by SQLite so no writer has to keep it in sync with trust_weight.
+# SQLite does not serve generated columns from an index, so analytic queries aggregate this
+# expression over the indexed base columns to stay index-only.
+WEIGHTED_SCORE_SQL = "ROUND(user_confidence * trust_weight, 4)"
+FEEDBACK_EVENTS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    user_id_hash TEXT NOT NULL,
+    stock_code TEXT NOT NULL,
+    article_link TEXT NOT NULL,
+    article_title TEXT NOT NULL,
+    article_source TEXT DEFAULT '',
+    ai_label TEXT NOT NULL CHECK(ai_label IN ('positive','negative','neutral')),
+    user_label TEXT NOT NULL CHECK(user_label IN ('positive','negative','neutral')),
+    user_confidence INTEGER NOT NULL DEFAULT 3 CHECK(user_confidence >= 1 AND user_confidence <= 5),
+    note TEXT DEFAULT '',
+    trust_weight REAL NOT NULL DEFAULT 1.0,
+    weighted_score REAL GENERATED ALWAYS AS ({weighted_score}) STORED
+)
+""".replace("{weighted_score}", WEIGHTED_SCORE_SQL)
+FEEDBACK_EVENTS_COPY_COLUMNS = (
+    "id",
+    "created_at",
+    "user_id_hash",
+    "stock_code",
+    "article_link",
+    "article_title",
+    "article_source",
+    "ai_label",
+    "user_label",
+    "user_confidence",
+    "note",
+)
+
+TESTER_TIER_UPSERT_SQL = """
+INSERT INTO user_tester_tiers (user_id_hash, tester_tier, note, updated_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(user_id_hash) DO UPDATE SET
+    tester_tier = excluded.tester_tier,
+    note = excluded.note,
+    updated_at = excluded.updated_at
+"""
+KEYWORD_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]{2,}")
+
+CONNECTION_PRAGMAS = """
+PRAGMA foreign_keys=ON;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+"""
+
+
+@functools.lru_cache(maxsize=256)
+def _format_local_second(epoch_second: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(epoch_second))
 
 
 def now_str() -> str:
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Timestamps have one-second resolution, so each second is formatted once however many writes share it.
+    return _format_local_second(int(time.time()))
 
 
-def hash_user_id(user_id: str) -> str:
-    return hashlib.sha256(user_id.encode("utf-8")).hexdigest()
+def cutoff_str(seconds_ago: float) -> str:
+    return _format_local_second(int(time.time() - seconds_ago))
 
 
-def extract_keywords(text: str) -> List[str]:
-    tokens = re.findall(r"[0-9A-Za-z가-힣]{2,}", text.lower())
-    unique: List[str] = []
-    seen = set()
-    for token in tokens:
-        if token in STOPWORDS:
-            continue
-        if token in seen:
-            continue
-        seen.add(token)
-        unique.append(token)
-    return unique
+@functools.lru_cache(maxsize=8192)
+def hash_user_id(user_id: str) -> str:
+    # Request bodies arrive whitespace-stripped while query params do not; normalize here so both agree.
+    return hashlib.sha256(user_id.strip().encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_keywords(text: str) -> Tuple[str, ...]:
+    # Cached per title: every tester voting on an article submits the same title.
+    return tuple(dict.fromkeys(token for token in KEYWORD_TOKEN_RE.findall(text.lower()) if token not in STOPWORDS))
+
+
+def _consensus_label(positive: float, negative: float, neutral: float) -> str:
+    if positive >= negative and positive >= neutral:
+        return "positive"
+    if negative >= neutral:
+        return "negative"
+    return "neutral"
+
+
+# Applied rules bucketed by keyword length: (length, {keyword: (rank, keyword, rule)}), shortest first.
+RulesMatcher = Tuple[Tuple[int, Dict[str, Tuple[int, str, Dict[str, object]]]], ...]
+
+
+def _build_rules_matcher(rules: Mapping[str, Dict[str, object]]) -> RulesMatcher:
+    buckets: Dict[int, Dict[str, Tuple[int, str, Dict[str, object]]]] = {}
+    for rank, (keyword, rule) in enumerate(rules.items()):
+        if keyword:
+            buckets.setdefault(len(keyword), {})[keyword] = (rank, keyword, rule)
+    return tuple(sorted(buckets.items()))
+
+
+def _match_rules(matcher: RulesMatcher, lowered: str) -> List[Tuple[str, Dict[str, object]]]:
+    # Large buckets are matched by hashing every same-length window of the text once instead of
+    # running one substring scan per keyword; small buckets keep the plain scan, which is cheaper there.
+    text_len = len(lowered)
+    hits: List[Tuple[int, str, Dict[str, object]]] = []
+    for length, bucket in matcher:
+        windows = text_len - length + 1
+        if windows <= 0:
+            break
+        if len(bucket) <= 4 * windows:
+            hits.extend(entry for keyword, entry in bucket.items() if keyword in lowered)
+        else:
+            window_set = {lowered[start:start + length] for start in range(windows)}
+            hits.extend(bucket[keyword] for keyword in window_set.intersection(bucket))
+    hits.sort()
+    return [(keyword, rule) for _, keyword, rule in hits]
+
+
+def _trust_profile_row(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, object]:
+    user_id_hash, trust_weight, note, updated_at = row
+    return {
+        "user_id_hash": user_id_hash,
+        "trust_weight": float(trust_weight),
+        "note": note or "",
+        "updated_at": updated_at,
+    }
+
+
+def _tester_tier_row(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, object]:
+    user_id_hash, tester_tier, note, updated_at = row
+    return {
+        "user_id_hash": user_id_hash,
+        "tester_tier": tester_tier,
+        "default_weight": TESTER_TIER_WEIGHTS.get(tester_tier, DEFAULT_TRUST_WEIGHT),
+        "note": note or "",
+        "updated_at": updated_at,
+    }
+
+
+def _keyword_rule_row(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, object]:
+    keyword, label, status, source, support_votes, consensus_ratio, updated_at = row
+    return {
+        "keyword": keyword,
+        "label": label,
+        "status": status,
+        "source": source,
+        "support_votes": support_votes,
+        "consensus_ratio": float(consensus_ratio),
+        "updated_at": updated_at,
+    }
+
+
+def _admin_audit_row(cursor: sqlite3.Cursor, row: Tuple) -> Dict[str, object]:
+    audit_id, created_at, action, target_type, target_id, meta_json = row
+    raw_meta = meta_json or "{}"
+    try:
+        meta = json.loads(raw_meta)
+    except json.JSONDecodeError:
+        meta = {"raw": raw_meta}
+    return {
+        "id": audit_id,
+        "created_at": created_at,
+        "action": action,
+        "target_type": target_type,
+        "target_id": target_id,
+        "meta": meta,
+    }
 
 
 class FeedbackStore:
@@ -76,104 +247,165 @@ class FeedbackStore:
 
     def __init__(self, db_path: str):
         self.db_path = db_path
-        self._lock = threading.Lock()
-        self._rules_cache: Dict[str, Dict[str, object]] = {}
+        self._tls = threading.local()
+        self._rules_cache: Mapping[str, Dict[str, object]] = MappingProxyType({})
+        self._rules_matcher: RulesMatcher = ()
         self._rules_cache_ts = 0.0
         self._rules_cache_ttl_sec = 30.0
+        self._trust_cache: Dict[str, Tuple[Dict[str, object], float]] = {}
+        self._trust_cache_lock = threading.RLock()
+        # Bumped after every committed trust/tier write; a read that started earlier may not fill the cache.
+        self._trust_generation = 0
+        self._read_cache: Dict[Tuple[object, ...], Tuple[float, int, Dict[str, object]]] = {}
+        self._write_generation = 0
+        self._write_generation_lock = threading.Lock()
+        self._metrics_pool: Optional[ThreadPoolExecutor] = None
+        self._metrics_pool_lock = threading.Lock()
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path, check_same_thread=False)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
+        # One long-lived autocommit connection per thread; reopening per call cost more than most queries.
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._apply_pragmas(conn)
+            self._tls.conn = conn
         return conn
 
-    def _init_db(self):
-        with self._connect() as conn:
-            conn.executescript(
-                """
-                PRAGMA journal_mode=WAL;
-
-                CREATE TABLE IF NOT EXISTS feedback_events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TEXT NOT NULL,
-                    user_id_hash TEXT NOT NULL,
-                    stock_code TEXT NOT NULL,
-                    article_link TEXT NOT NULL,
-                    article_title TEXT NOT NULL,
-                    article_source TEXT DEFAULT '',
-                    ai_label TEXT NOT NULL CHECK(ai_label IN ('positive','negative','neutral')),
-                    user_label TEXT NOT NULL CHECK(user_label IN ('positive','negative','neutral')),
-                    user_confidence INTEGER NOT NULL DEFAULT 3 CHECK(user_confidence >= 1 AND user_confidence <= 5),
-                    note TEXT DEFAULT ''
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_feedback_article ON feedback_events(article_link);
-                CREATE INDEX IF NOT EXISTS idx_feedback_stock ON feedback_events(stock_code);
-                CREATE INDEX IF NOT EXISTS idx_feedback_created ON feedback_events(created_at);
-
-                CREATE TABLE IF NOT EXISTS keyword_votes (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    feedback_id INTEGER NOT NULL,
-                    created_at TEXT NOT NULL,
-                    keyword TEXT NOT NULL,
-                    ai_label TEXT NOT NULL CHECK(ai_label IN ('positive','negative','neutral')),
-                    user_label TEXT NOT NULL CHECK(user_label IN ('positive','negative','neutral')),
-                    weight REAL NOT NULL DEFAULT 3.0,
-                    FOREIGN KEY(feedback_id) REFERENCES feedback_events(id) ON DELETE CASCADE
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_keyword_votes_keyword ON keyword_votes(keyword);
-                CREATE INDEX IF NOT EXISTS idx_keyword_votes_created ON keyword_votes(created_at);
-
-                CREATE TABLE IF NOT EXISTS keyword_rules (
-                    keyword TEXT PRIMARY KEY,
-                    label TEXT NOT NULL CHECK(label IN ('positive','negative','neutral')),
-                    status TEXT NOT NULL CHECK(status IN ('applied','disabled')),
-                    source TEXT NOT NULL DEFAULT 'manual',
-                    support_votes INTEGER NOT NULL DEFAULT 0,
-                    consensus_ratio REAL NOT NULL DEFAULT 0,
-                    updated_at TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS user_trust_profiles (
-                    user_id_hash TEXT PRIMARY KEY,
-                    trust_weight REAL NOT NULL
-                        CHECK(trust_weight >= 0.2 AND trust_weight <= 3.0),
-                    note TEXT DEFAULT '',
-                    updated_at TEXT NOT NULL
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_user_trust_updated
-                ON user_trust_profiles(updated_at);
-
-                CREATE TABLE IF NOT EXISTS user_tester_tiers (
-                    user_id_hash TEXT PRIMARY KEY,
-                    tester_tier TEXT NOT NULL
-                        CHECK(tester_tier IN ('core', 'general', 'observer')),
-                    note TEXT DEFAULT '',
-                    updated_at TEXT NOT NULL
-                );
-
-                CREATE INDEX IF NOT EXISTS idx_user_tier_updated
-                ON user_tester_tiers(updated_at);
-
-                CREATE TABLE IF NOT EXISTS admin_audit_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    created_at TEXT NOT NULL,
-                    action TEXT NOT NULL,
-                    target_type TEXT NOT NULL,
-                    target_id TEXT NOT NULL,
-                    meta_json TEXT NOT NULL
-                );
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # BEGIN IMMEDIATE takes SQLite's write lock up front and busy_timeout queues competing writers,
+        # so writers need no Python-level lock and WAL readers never wait on them.
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        # Writers commit concurrently now; an unlocked += could let two commits share one generation.
+        with self._write_generation_lock:
+            self._write_generation += 1
+
+    def _cached_read(self, key: Tuple[object, ...], compute: Callable[[], Dict[str, object]]) -> Dict[str, object]:
+        # The generation is sampled before computing, so a write that lands mid-query still invalidates the entry.
+        now = time.time()
+        generation = self._write_generation
+        cached = self._read_cache.get(key)
+        if cached and cached[0] > now and cached[1] == generation:
+            return cached[2]
+
+        result = compute()
+        if len(self._read_cache) >= READ_CACHE_MAX_ENTRIES:
+            self._read_cache.clear()
+        self._read_cache[key] = (now + READ_CACHE_TTL_SEC, generation, result)
+        return result
+
+    def _apply_pragmas(self, conn: sqlite3.Connection):
+        if self.db_path == ":memory:":
+            conn.execute("PRAGMA foreign_keys=ON")
+            return
+        conn.executescript(CONNECTION_PRAGMAS)
 
-                CREATE INDEX IF NOT EXISTS idx_admin_audit_created
-                ON admin_audit_logs(created_at);
+    def _init_db(self):
+        conn = self._connect()
+        conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA wal_autocheckpoint=1000;
+            """
+            + FEEDBACK_EVENTS_TABLE_SQL.format(table="feedback_events")
+            + """;
+
+            CREATE TABLE IF NOT EXISTS keyword_votes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feedback_id INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                ai_label TEXT NOT NULL CHECK(ai_label IN ('positive','negative','neutral')),
+                user_label TEXT NOT NULL CHECK(user_label IN ('positive','negative','neutral')),
+                weight REAL NOT NULL DEFAULT 3.0,
+                FOREIGN KEY(feedback_id) REFERENCES feedback_events(id) ON DELETE CASCADE
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_keyword_votes_keyword_cover
+            ON keyword_votes(keyword, user_label, ai_label, weight);
+            CREATE INDEX IF NOT EXISTS idx_keyword_votes_created ON keyword_votes(created_at);
+
+            CREATE TABLE IF NOT EXISTS keyword_rules (
+                keyword TEXT PRIMARY KEY,
+                label TEXT NOT NULL CHECK(label IN ('positive','negative','neutral')),
+                status TEXT NOT NULL CHECK(status IN ('applied','disabled')),
+                source TEXT NOT NULL DEFAULT 'manual',
+                support_votes INTEGER NOT NULL DEFAULT 0,
+                consensus_ratio REAL NOT NULL DEFAULT 0,
+                updated_at TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_keyword_rules_applied
+            ON keyword_rules(support_votes DESC, consensus_ratio DESC, updated_at DESC)
+            WHERE status = 'applied';
+
+            CREATE TABLE IF NOT EXISTS user_trust_profiles (
+                user_id_hash TEXT PRIMARY KEY,
+                trust_weight REAL NOT NULL
+                    CHECK(trust_weight >= 0.2 AND trust_weight <= 3.0),
+                note TEXT DEFAULT '',
+                updated_at TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_user_trust_updated
+            ON user_trust_profiles(updated_at);
+
+            CREATE TABLE IF NOT EXISTS user_tester_tiers (
+                user_id_hash TEXT PRIMARY KEY,
+                tester_tier TEXT NOT NULL
+                    CHECK(tester_tier IN ('core', 'general', 'observer')),
+                note TEXT DEFAULT '',
+                updated_at TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_user_tier_updated
+            ON user_tester_tiers(updated_at);
+
+            CREATE TABLE IF NOT EXISTS admin_audit_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                action TEXT NOT NULL,
+                target_type TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                meta_json TEXT NOT NULL
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_admin_audit_created
+            ON admin_audit_logs(created_at);
+
+            CREATE INDEX IF NOT EXISTS idx_admin_audit_action_created
+            ON admin_audit_logs(action, created_at);
+
+            CREATE TABLE IF NOT EXISTS schema_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        # A feedback_events rebuild must not cascade-delete keyword_votes; foreign_keys only toggles outside a transaction.
+        conn.execute("PRAGMA foreign_keys=OFF")
+        try:
+            self._migrate()
+        finally:
+            conn.execute("PRAGMA foreign_keys=ON")
+
+    def _migrate(self):
+        with self._transaction() as conn:
+            # Migrations only run when the schema changed since the last startup that completed them.
+            schema_version = str(conn.execute("PRAGMA schema_version").fetchone()[0])
+            migrated_row = conn.execute("SELECT value FROM schema_meta WHERE key = 'schema_version'").fetchone()
+            if migrated_row and str(migrated_row["value"]) == schema_version:
+                return
 
-                CREATE INDEX IF NOT EXISTS idx_admin_audit_action
-                ON admin_audit_logs(action);
-                """
-            )
             self._ensure_feedback_columns(conn)
             self._dedupe_feedback_events(conn)
             conn.execute(
@@ -182,27 +414,61 @@ class FeedbackStore:
                 ON feedback_events(user_id_hash, article_link);
                 """
             )
-
-    def _column_exists(self, conn: sqlite3.Connection, table: str, column: str) -> bool:
-        rows = conn.execute(f"PRAGMA table_info({table})").fetchall()
-        return any(str(row["name"]) == column for row in rows)
-
-    def _ensure_feedback_columns(self, conn: sqlite3.Connection):
-        if not self._column_exists(conn, "feedback_events", "trust_weight"):
             conn.execute(
                 """
-                ALTER TABLE feedback_events
-                ADD COLUMN trust_weight REAL NOT NULL DEFAULT 1.0
+                CREATE UNIQUE INDEX IF NOT EXISTS ux_keyword_votes_feedback_keyword
+                ON keyword_votes(feedback_id, keyword);
                 """
             )
-
-        if not self._column_exists(conn, "feedback_events", "weighted_score"):
             conn.execute(
                 """
-                ALTER TABLE feedback_events
-                ADD COLUMN weighted_score REAL NOT NULL DEFAULT 0.0
+                CREATE INDEX IF NOT EXISTS idx_feedback_stock_cover
+                ON feedback_events(stock_code, created_at, user_label, ai_label, user_confidence, trust_weight, user_id_hash);
+                """
+            )
+            # Lets the time-window analytics (metrics, tester quality) scan narrow index entries instead of rows.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_feedback_created_cover
+                ON feedback_events(
+                    created_at, user_id_hash, article_link, user_label, ai_label, user_confidence, trust_weight
+                );
                 """
             )
+            # Covers get_article_summary without touching table rows; replaces the narrow article_link index.
+            conn.execute(
+                """
+                CREATE INDEX IF NOT EXISTS idx_feedback_article_label_cover
+                ON feedback_events(article_link, user_label, ai_label, user_confidence, trust_weight);
+                """
+            )
+            # Superseded by composite indexes that lead with the selective column.
+            for index_name in (
+                "idx_feedback_article",
+                "idx_feedback_stock",
+                "idx_feedback_created",
+                "idx_feedback_stock_created",
+                "idx_feedback_article_cover",
+                "idx_admin_audit_action",
+                "idx_keyword_votes_keyword",
+            ):
+                conn.execute(f"DROP INDEX IF EXISTS {index_name}")
+            conn.execute(
+                """
+                INSERT INTO schema_meta (key, value) VALUES ('schema_version', ?)
+                ON CONFLICT(key) DO UPDATE SET value = excluded.value
+                """,
+                (str(conn.execute("PRAGMA schema_version").fetchone()[0]),),
+            )
+
+    def _ensure_feedback_columns(self, conn: sqlite3.Connection):
+        # table_xinfo marks stored generated columns with hidden = 3.
+        hidden_by_column = {
+            str(row["name"]): int(row["hidden"])
+            for row in conn.execute("PRAGMA table_xinfo(feedback_events)").fetchall()
+        }
+        if hidden_by_column.get("weighted_score") != 3:
+            self._rebuild_feedback_events(conn, has_trust_weight="trust_weight" in hidden_by_column)
 
         conn.execute(
             """
@@ -211,15 +477,48 @@ class FeedbackStore:
             WHERE trust_weight IS NULL OR trust_weight <= 0
             """
         )
+
+    def _rebuild_feedback_events(self, conn: sqlite3.Connection, has_trust_weight: bool):
+        # Legacy tables carry weighted_score as a plain column; SQLite can only add a stored generated one by rebuild.
+        columns = ", ".join(FEEDBACK_EVENTS_COPY_COLUMNS)
+        trust_weight = "trust_weight" if has_trust_weight else "1.0"
+        conn.execute("DROP TABLE IF EXISTS feedback_events_rebuild")
+        conn.execute(FEEDBACK_EVENTS_TABLE_SQL.format(table="feedback_events_rebuild"))
         conn.execute(
-            """
-            UPDATE feedback_events
-            SET weighted_score = ROUND(user_confidence * trust_weight, 4)
-            WHERE weighted_score IS NULL OR weighted_score <= 0
+            f"""
+            INSERT INTO feedback_events_rebuild ({columns}, trust_weight)
+            SELECT {columns}, {trust_weight}
+            FROM feedback_events
             """
         )
+        conn.execute("DROP TABLE feedback_events")
+        conn.execute("ALTER TABLE feedback_events_rebuild RENAME TO feedback_events")
 
     def _resolve_effective_trust(self, conn: sqlite3.Connection, user_id_hash: str) -> Dict[str, object]:
+        now = time.time()
+        with self._trust_cache_lock:
+            cached = self._trust_cache.get(user_id_hash)
+            if cached and cached[1] > now:
+                return cached[0]
+            generation = self._trust_generation
+
+        trust_meta = self._load_effective_trust(conn=conn, user_id_hash=user_id_hash)
+        with self._trust_cache_lock:
+            # A trust write committed since the SELECT started; the row read may predate it.
+            if generation == self._trust_generation:
+                if len(self._trust_cache) >= TRUST_CACHE_MAX_ENTRIES:
+                    self._trust_cache.clear()
+                self._trust_cache[user_id_hash] = (trust_meta, now + self._rules_cache_ttl_sec)
+        return trust_meta
+
+    def _invalidate_trust(self, *user_id_hashes: str):
+        # Call only after COMMIT, so no later read can cache the pre-write row.
+        with self._trust_cache_lock:
+            self._trust_generation += 1
+            for user_id_hash in user_id_hashes:
+                self._trust_cache.pop(user_id_hash, None)
+
+    def _load_effective_trust(self, conn: sqlite3.Connection, user_id_hash: str) -> Dict[str, object]:
         manual_row = conn.execute(
             """
             SELECT trust_weight, note, updated_at
@@ -238,7 +537,9 @@ class FeedbackStore:
                 "note": str(manual_row["note"] or ""),
                 "updated_at": str(manual_row["updated_at"] or ""),
             }
+        return self._load_tier_trust(conn=conn, user_id_hash=user_id_hash)
 
+    def _load_tier_trust(self, conn: sqlite3.Connection, user_id_hash: str) -> Dict[str, object]:
         tier_row = conn.execute(
             """
             SELECT tester_tier, note, updated_at
@@ -268,76 +569,42 @@ class FeedbackStore:
         }
 
     def _reweight_user_feedback(self, conn: sqlite3.Connection, user_id_hash: str, trust_weight: float) -> int:
-        feedback_rows = conn.execute(
+        updated = conn.execute(
             """
-            SELECT id, user_confidence
-            FROM feedback_events
+            UPDATE feedback_events
+            SET trust_weight = ?
             WHERE user_id_hash = ?
             """,
-            (user_id_hash,),
-        ).fetchall()
-
-        for row in feedback_rows:
-            feedback_id = int(row["id"])
-            confidence = int(row["user_confidence"] or 3)
-            weighted_score = round(confidence * trust_weight, 4)
-            conn.execute(
-                """
-                UPDATE feedback_events
-                SET trust_weight = ?, weighted_score = ?
-                WHERE id = ?
-                """,
-                (trust_weight, weighted_score, feedback_id),
-            )
+            (trust_weight, user_id_hash),
+        ).rowcount
+        if updated:
             conn.execute(
                 """
                 UPDATE keyword_votes
-                SET weight = ?
-                WHERE feedback_id = ?
+                SET weight = (SELECT weighted_score FROM feedback_events WHERE id = keyword_votes.feedback_id)
+                WHERE feedback_id IN (SELECT id FROM feedback_events WHERE user_id_hash = ?)
                 """,
-                (weighted_score, feedback_id),
+                (user_id_hash,),
             )
-
-        return len(feedback_rows)
+        return updated
 
     def _dedupe_feedback_events(self, conn: sqlite3.Connection):
-        duplicate_groups = conn.execute(
-            """
-            SELECT user_id_hash, article_link, COUNT(*) AS cnt
-            FROM feedback_events
-            GROUP BY user_id_hash, article_link
-            HAVING COUNT(*) > 1
-            """
-        ).fetchall()
-
-        for group in duplicate_groups:
-            user_id_hash = str(group["user_id_hash"])
-            article_link = str(group["article_link"])
-            rows = conn.execute(
-                """
-                SELECT id
+        # Keep the newest row per (user, article); one window pass instead of a query per duplicate group.
+        duplicate_ids = """
+            SELECT id FROM (
+                SELECT id, ROW_NUMBER() OVER (PARTITION BY user_id_hash, article_link ORDER BY id DESC) AS rn
                 FROM feedback_events
-                WHERE user_id_hash = ? AND article_link = ?
-                ORDER BY id DESC
-                """,
-                (user_id_hash, article_link),
-            ).fetchall()
-            if not rows:
-                continue
-
-            keep_id = int(rows[0]["id"])
-            remove_ids = [int(row["id"]) for row in rows[1:]]
-            if not remove_ids:
-                continue
-
-            conn.executemany(
-                "DELETE FROM keyword_votes WHERE feedback_id = ?",
-                [(feedback_id,) for feedback_id in remove_ids],
-            )
-            conn.executemany(
-                "DELETE FROM feedback_events WHERE id = ?",
-                [(feedback_id,) for feedback_id in remove_ids],
             )
+            WHERE rn > 1
+        """
+        conn.execute(f"DELETE FROM keyword_votes WHERE feedback_id IN ({duplicate_ids})")
+        conn.execute(f"DELETE FROM feedback_events WHERE id IN ({duplicate_ids})")
+        conn.execute(
+            """
+            DELETE FROM keyword_votes
+            WHERE id NOT IN (SELECT MAX(id) FROM keyword_votes GROUP BY feedback_id, keyword)
+            """
+        )
 
     def submit_feedback(
         self,
@@ -361,28 +628,28 @@ class FeedbackStore:
         confidence = max(1, min(5, int(user_confidence)))
         keywords = extract_keywords(article_title)
 
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             trust_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_hash)
             trust_weight = float(trust_meta["trust_weight"])
-            weighted_score = round(confidence * trust_weight, 4)
-            existing = conn.execute(
+            existed = conn.execute(
                 """
-                SELECT id
-                FROM feedback_events
-                WHERE user_id_hash = ? AND article_link = ?
-                LIMIT 1
+                SELECT EXISTS(
+                    SELECT 1
+                    FROM feedback_events
+                    WHERE user_id_hash = ? AND article_link = ?
+                )
                 """,
                 (user_hash, article_link),
-            ).fetchone()
-            vote_action = "updated" if existing else "created"
+            ).fetchone()[0]
+            vote_action = "updated" if existed else "created"
 
-            conn.execute(
+            feedback_row = conn.execute(
                 """
                 INSERT INTO feedback_events (
                     created_at, user_id_hash, stock_code, article_link, article_title, article_source,
-                    ai_label, user_label, user_confidence, trust_weight, weighted_score, note
+                    ai_label, user_label, user_confidence, trust_weight, note
                 )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 ON CONFLICT(user_id_hash, article_link) DO UPDATE SET
                     created_at = excluded.created_at,
                     stock_code = excluded.stock_code,
@@ -392,8 +659,8 @@ class FeedbackStore:
                     user_label = excluded.user_label,
                     user_confidence = excluded.user_confidence,
                     trust_weight = excluded.trust_weight,
-                    weighted_score = excluded.weighted_score,
                     note = excluded.note
+                RETURNING id, weighted_score
                 """,
                 (
                     created_at,
@@ -406,34 +673,37 @@ class FeedbackStore:
                     user_label,
                     confidence,
                     trust_weight,
-                    weighted_score,
                     note,
                 ),
-            )
-            feedback_row = conn.execute(
-                """
-                SELECT id
-                FROM feedback_events
-                WHERE user_id_hash = ? AND article_link = ?
-                LIMIT 1
-                """,
-                (user_hash, article_link),
             ).fetchone()
             if not feedback_row:
                 raise RuntimeError("feedback upsert failed")
             feedback_id = int(feedback_row["id"])
+            weighted_score = float(feedback_row["weighted_score"])
 
-            conn.execute("DELETE FROM keyword_votes WHERE feedback_id = ?", (feedback_id,))
-
-            for keyword in keywords:
+            # Re-votes only touch keywords that changed; unchanged ones are updated in place.
+            if existed:
                 conn.execute(
                     """
-                    INSERT INTO keyword_votes (feedback_id, created_at, keyword, ai_label, user_label, weight)
-                    VALUES (?, ?, ?, ?, ?, ?)
+                    DELETE FROM keyword_votes
+                    WHERE feedback_id = ? AND keyword NOT IN (SELECT value FROM json_each(?))
                     """,
-                    (feedback_id, created_at, keyword, ai_label, user_label, weighted_score),
+                    (feedback_id, json.dumps(keywords, ensure_ascii=False)),
                 )
 
+            conn.executemany(
+                """
+                INSERT INTO keyword_votes (feedback_id, created_at, keyword, ai_label, user_label, weight)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(feedback_id, keyword) DO UPDATE SET
+                    created_at = excluded.created_at,
+                    ai_label = excluded.ai_label,
+                    user_label = excluded.user_label,
+                    weight = excluded.weight
+                """,
+                [(feedback_id, created_at, keyword, ai_label, user_label, weighted_score) for keyword in keywords],
+            )
+
         summary = self.get_article_summary(article_link)
         return {
             "feedback_id": feedback_id,
@@ -447,34 +717,22 @@ class FeedbackStore:
         }
 
     def get_article_summary(self, article_link: str) -> Dict[str, object]:
-        with self._connect() as conn:
-            label_rows = conn.execute(
-                """
-                SELECT
-                    user_label,
-                    COUNT(*) AS votes,
-                    SUM(weighted_score) AS weighted_votes
-                FROM feedback_events
-                WHERE article_link = ?
-                GROUP BY user_label
-                """,
-                (article_link,),
-            ).fetchall()
-
-            total_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS total_votes,
-                    COUNT(DISTINCT user_id_hash) AS unique_users,
-                    SUM(CASE WHEN ai_label = user_label THEN 1 ELSE 0 END) AS ai_match_votes,
-                    SUM(weighted_score) AS total_weighted_votes
-                FROM feedback_events
-                WHERE article_link = ?
-                """,
-                (article_link,),
-            ).fetchone()
+        label_rows = self._connect().execute(
+            f"""
+            SELECT
+                user_label,
+                COUNT(*) AS votes,
+                SUM({WEIGHTED_SCORE_SQL}) AS weighted_votes,
+                COUNT(*) FILTER (WHERE ai_label = user_label) AS ai_match_votes
+            FROM feedback_events
+            WHERE article_link = ?
+            GROUP BY user_label
+            ORDER BY weighted_votes DESC, {LABEL_RANK_SQL}
+            """,
+            (article_link,),
+        ).fetchall()
 
-        if not total_row or int(total_row["total_votes"] or 0) == 0:
+        if not label_rows:
             return {
                 "article_link": article_link,
                 "total_votes": 0,
@@ -489,26 +747,29 @@ class FeedbackStore:
 
         weighted = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
         raw = {"positive": 0, "negative": 0, "neutral": 0}
+        ai_match_votes = 0
         for row in label_rows:
             label = str(row["user_label"])
             raw[label] = int(row["votes"] or 0)
             weighted[label] = float(row["weighted_votes"] or 0.0)
+            ai_match_votes += int(row["ai_match_votes"] or 0)
 
-        best_label = max(weighted.items(), key=lambda x: x[1])[0]
+        # Rows arrive heaviest first (ties in LABELS order), so the first one is the consensus.
+        best_label = str(label_rows[0]["user_label"])
         total_weight = sum(weighted.values()) or 1.0
         consensus_ratio = weighted[best_label] / total_weight
 
-        total_votes = int(total_row["total_votes"] or 0)
-        ai_match_votes = int(total_row["ai_match_votes"] or 0)
+        # ux_feedback_user_article keeps one row per user and article, so every vote is a distinct user.
+        total_votes = sum(raw.values())
 
         return {
             "article_link": article_link,
             "total_votes": total_votes,
-            "unique_users": int(total_row["unique_users"] or 0),
+            "unique_users": total_votes,
             "consensus_label": best_label,
             "consensus_ratio": round(consensus_ratio, 4),
             "ai_match_ratio": round(ai_match_votes / max(1, total_votes), 4),
-            "total_weighted_votes": round(float(total_row["total_weighted_votes"] or 0.0), 4),
+            "total_weighted_votes": round(sum(weighted.values()), 4),
             "breakdown": raw,
             "weighted_breakdown": {
                 "positive": round(weighted["positive"], 4),
@@ -557,19 +818,26 @@ class FeedbackStore:
                 raise ValueError("user_id or user_id_hash is required")
             user_id_hash = hash_user_id(user_id)
 
-        with self._connect() as conn:
-            trust_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
+        conn = self._connect()
+        trust_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
         return float(trust_meta["trust_weight"])
 
-    def upsert_user_trust_profile(self, user_id: str, trust_weight: float, note: str = "") -> Dict[str, object]:
-        if not user_id:
-            raise ValueError("user_id is required")
+    def upsert_user_trust_profile(
+        self,
+        user_id: Optional[str],
+        trust_weight: float,
+        note: str = "",
+        user_id_hash: Optional[str] = None,
+    ) -> Dict[str, object]:
+        if not user_id_hash:
+            if not user_id:
+                raise ValueError("user_id or user_id_hash is required")
+            user_id_hash = hash_user_id(user_id)
 
         bounded_weight = max(MIN_TRUST_WEIGHT, min(MAX_TRUST_WEIGHT, float(trust_weight)))
-        user_id_hash = hash_user_id(user_id)
         updated_at = now_str()
 
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 INSERT INTO user_trust_profiles (user_id_hash, trust_weight, note, updated_at)
@@ -586,6 +854,7 @@ class FeedbackStore:
                 user_id_hash=user_id_hash,
                 trust_weight=bounded_weight,
             )
+        self._invalidate_trust(user_id_hash)
 
         return {
             "user_id_hash": user_id_hash,
@@ -596,14 +865,19 @@ class FeedbackStore:
             "source": "manual",
         }
 
-    def clear_user_trust_profile(self, user_id: str) -> Dict[str, object]:
-        if not user_id:
-            raise ValueError("user_id is required")
+    def clear_user_trust_profile(
+        self,
+        user_id: Optional[str] = None,
+        user_id_hash: Optional[str] = None,
+    ) -> Dict[str, object]:
+        if not user_id_hash:
+            if not user_id:
+                raise ValueError("user_id or user_id_hash is required")
+            user_id_hash = hash_user_id(user_id)
 
-        user_id_hash = hash_user_id(user_id)
         updated_at = now_str()
 
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 DELETE FROM user_trust_profiles
@@ -611,13 +885,15 @@ class FeedbackStore:
                 """,
                 (user_id_hash,),
             )
-            trust_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
+            # With the manual override gone, the tier (or system default) is the effective trust.
+            trust_meta = self._load_tier_trust(conn=conn, user_id_hash=user_id_hash)
             effective_weight = float(trust_meta["trust_weight"])
             updated_feedback_count = self._reweight_user_feedback(
                 conn=conn,
                 user_id_hash=user_id_hash,
                 trust_weight=effective_weight,
             )
+        self._invalidate_trust(user_id_hash)
 
         return {
             "user_id_hash": user_id_hash,
@@ -633,26 +909,26 @@ class FeedbackStore:
             raise ValueError("user_id is required")
         user_id_hash = hash_user_id(user_id)
 
-        with self._connect() as conn:
-            manual_row = conn.execute(
-                """
-                SELECT user_id_hash, trust_weight, note, updated_at
-                FROM user_trust_profiles
-                WHERE user_id_hash = ?
-                LIMIT 1
-                """,
-                (user_id_hash,),
-            ).fetchone()
-            tier_row = conn.execute(
-                """
-                SELECT tester_tier, note, updated_at
-                FROM user_tester_tiers
-                WHERE user_id_hash = ?
-                LIMIT 1
-                """,
-                (user_id_hash,),
-            ).fetchone()
-            effective = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
+        conn = self._connect()
+        manual_row = conn.execute(
+            """
+            SELECT user_id_hash, trust_weight, note, updated_at
+            FROM user_trust_profiles
+            WHERE user_id_hash = ?
+            LIMIT 1
+            """,
+            (user_id_hash,),
+        ).fetchone()
+        tier_row = conn.execute(
+            """
+            SELECT tester_tier, note, updated_at
+            FROM user_tester_tiers
+            WHERE user_id_hash = ?
+            LIMIT 1
+            """,
+            (user_id_hash,),
+        ).fetchone()
+        effective = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
 
         return {
             "user_id_hash": user_id_hash,
@@ -679,26 +955,17 @@ class FeedbackStore:
         }
 
     def list_user_trust_profiles(self, limit: int = 200) -> List[Dict[str, object]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT user_id_hash, trust_weight, note, updated_at
-                FROM user_trust_profiles
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """,
-                (int(limit),),
-            ).fetchall()
-
-        return [
-            {
-                "user_id_hash": str(row["user_id_hash"]),
-                "trust_weight": float(row["trust_weight"]),
-                "note": str(row["note"] or ""),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ]
+        cursor = self._connect().cursor()
+        cursor.row_factory = _trust_profile_row
+        return cursor.execute(
+            """
+            SELECT user_id_hash, trust_weight, note, updated_at
+            FROM user_trust_profiles
+            ORDER BY updated_at DESC
+            LIMIT ?
+            """,
+            (int(limit),),
+        ).fetchall()
 
     def _upsert_user_tier_by_hash(
         self,
@@ -712,19 +979,10 @@ class FeedbackStore:
             raise ValueError(f"tester_tier must be one of {TESTER_TIERS}")
 
         default_weight = float(TESTER_TIER_WEIGHTS[tester_tier])
-        conn.execute(
-            """
-            INSERT INTO user_tester_tiers (user_id_hash, tester_tier, note, updated_at)
-            VALUES (?, ?, ?, ?)
-            ON CONFLICT(user_id_hash) DO UPDATE SET
-                tester_tier = excluded.tester_tier,
-                note = excluded.note,
-                updated_at = excluded.updated_at
-            """,
-            (user_id_hash, tester_tier, note, updated_at),
-        )
+        conn.execute(TESTER_TIER_UPSERT_SQL, (user_id_hash, tester_tier, note, updated_at))
 
-        effective_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
+        # Uncommitted state is read directly; the caller invalidates the trust cache after COMMIT.
+        effective_meta = self._load_effective_trust(conn=conn, user_id_hash=user_id_hash)
         effective_weight = float(effective_meta["trust_weight"])
         updated_feedback_count = 0
         if str(effective_meta.get("source")) == "tier_default":
@@ -752,31 +1010,33 @@ class FeedbackStore:
         user_id_hash = hash_user_id(user_id)
         updated_at = now_str()
 
-        with self._lock, self._connect() as conn:
-            return self._upsert_user_tier_by_hash(
+        with self._transaction() as conn:
+            result = self._upsert_user_tier_by_hash(
                 conn=conn,
                 user_id_hash=user_id_hash,
                 tester_tier=tester_tier,
                 note=note,
                 updated_at=updated_at,
             )
+        self._invalidate_trust(user_id_hash)
+        return result
 
     def get_user_tester_tier(self, user_id: str) -> Dict[str, object]:
         if not user_id:
             raise ValueError("user_id is required")
 
         user_id_hash = hash_user_id(user_id)
-        with self._connect() as conn:
-            row = conn.execute(
-                """
-                SELECT tester_tier, note, updated_at
-                FROM user_tester_tiers
-                WHERE user_id_hash = ?
-                LIMIT 1
-                """,
-                (user_id_hash,),
-            ).fetchone()
-            effective_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
+        conn = self._connect()
+        row = conn.execute(
+            """
+            SELECT tester_tier, note, updated_at
+            FROM user_tester_tiers
+            WHERE user_id_hash = ?
+            LIMIT 1
+            """,
+            (user_id_hash,),
+        ).fetchone()
+        effective_meta = self._resolve_effective_trust(conn=conn, user_id_hash=user_id_hash)
 
         if not row:
             return {
@@ -801,27 +1061,17 @@ class FeedbackStore:
         }
 
     def list_user_tester_tiers(self, limit: int = 200) -> List[Dict[str, object]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT user_id_hash, tester_tier, note, updated_at
-                FROM user_tester_tiers
-                ORDER BY updated_at DESC
-                LIMIT ?
-                """,
-                (int(limit),),
-            ).fetchall()
-
-        return [
-            {
-                "user_id_hash": str(row["user_id_hash"]),
-                "tester_tier": str(row["tester_tier"]),
-                "default_weight": float(TESTER_TIER_WEIGHTS.get(str(row["tester_tier"]), DEFAULT_TRUST_WEIGHT)),
-                "note": str(row["note"] or ""),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ]
+        cursor = self._connect().cursor()
+        cursor.row_factory = _tester_tier_row
+        return cursor.execute(
+            """
+            SELECT user_id_hash, tester_tier, note, updated_at
+            FROM user_tester_tiers
+            ORDER BY updated_at DESC
+            LIMIT ?
+            """,
+            (int(limit),),
+        ).fetchall()
 
     def get_tester_quality_candidates(
         self,
@@ -834,102 +1084,85 @@ class FeedbackStore:
         if promote_threshold <= demote_threshold:
             raise ValueError("promote_threshold must be greater than demote_threshold")
 
-        rows_query = """
-            SELECT user_id_hash, article_link, ai_label, user_label, weighted_score
-            FROM feedback_events
-        """
-        rows_params: Tuple[object, ...] = ()
+        scope_filter = ""
+        params: Tuple[object, ...] = ()
         if recent_days is not None:
             bounded_days = max(1, int(recent_days))
-            cutoff = (datetime.now() - timedelta(days=bounded_days)).strftime("%Y-%m-%d %H:%M:%S")
-            rows_query += " WHERE created_at >= ?"
-            rows_params = (cutoff,)
-
-        with self._connect() as conn:
-            rows = conn.execute(rows_query, rows_params).fetchall()
-            manual_rows = conn.execute(
-                """
-                SELECT user_id_hash, trust_weight
-                FROM user_trust_profiles
-                """
-            ).fetchall()
-            tier_rows = conn.execute(
-                """
-                SELECT user_id_hash, tester_tier
-                FROM user_tester_tiers
-                """
-            ).fetchall()
-
-        if not rows:
-            return []
-
-        article_consensus_weights: Dict[str, Dict[str, float]] = {}
-        for row in rows:
-            article_link = str(row["article_link"])
-            label = str(row["user_label"])
-            weighted_score = float(row["weighted_score"] or 0.0)
-            if article_link not in article_consensus_weights:
-                article_consensus_weights[article_link] = {
-                    "positive": 0.0,
-                    "negative": 0.0,
-                    "neutral": 0.0,
-                }
-            article_consensus_weights[article_link][label] += weighted_score
-
-        article_consensus_label: Dict[str, str] = {}
-        for article_link, weights in article_consensus_weights.items():
-            consensus_label = max(weights.items(), key=lambda x: x[1])[0]
-            article_consensus_label[article_link] = consensus_label
-
-        manual_map = {
-            str(row["user_id_hash"]): float(row["trust_weight"] or DEFAULT_TRUST_WEIGHT)
-            for row in manual_rows
-        }
-        tier_map = {
-            str(row["user_id_hash"]): str(row["tester_tier"] or "general")
-            for row in tier_rows
-        }
-
-        user_stats: Dict[str, Dict[str, float]] = {}
-        for row in rows:
-            user_id_hash = str(row["user_id_hash"])
-            article_link = str(row["article_link"])
-            ai_label = str(row["ai_label"])
-            user_label = str(row["user_label"])
-            weighted_score = float(row["weighted_score"] or 0.0)
-
-            stat = user_stats.setdefault(
-                user_id_hash,
-                {
-                    "vote_count": 0.0,
-                    "weighted_votes": 0.0,
-                    "ai_match_votes": 0.0,
-                    "consensus_match_votes": 0.0,
-                },
+            cutoff = cutoff_str(bounded_days * 86400)
+            scope_filter = "WHERE created_at >= ?"
+            params = (cutoff,)
+
+        # Article consensus, per-user tallies and trust/tier lookups are resolved by SQLite;
+        # Python only turns one enriched row per user into a recommendation.
+        conn = self._connect()
+        user_rows = conn.execute(
+            f"""
+            WITH scoped AS (
+                SELECT id, user_id_hash, article_link, ai_label, user_label, {WEIGHTED_SCORE_SQL} AS weighted_score
+                FROM feedback_events
+                {scope_filter}
+            ),
+            per_article AS (
+                SELECT article_link, user_label, SUM(weighted_score) AS w
+                FROM scoped
+                GROUP BY article_link, user_label
+            ),
+            consensus AS (
+                SELECT article_link, user_label AS consensus_label
+                FROM (
+                    SELECT
+                        article_link,
+                        user_label,
+                        ROW_NUMBER() OVER (PARTITION BY article_link ORDER BY w DESC, {LABEL_RANK_SQL}) AS rn
+                    FROM per_article
+                )
+                WHERE rn = 1
+            ),
+            tallies AS (
+                SELECT
+                    s.user_id_hash,
+                    MIN(s.id) AS first_id,
+                    COUNT(*) AS vote_count,
+                    SUM(s.weighted_score) AS weighted_votes,
+                    COUNT(*) FILTER (WHERE s.ai_label = s.user_label) AS ai_match_votes,
+                    COUNT(*) FILTER (WHERE s.user_label = c.consensus_label) AS consensus_match_votes
+                FROM scoped s
+                JOIN consensus c ON c.article_link = s.article_link
+                GROUP BY s.user_id_hash
+                HAVING COUNT(*) >= ?
             )
+            SELECT
+                u.user_id_hash,
+                u.vote_count,
+                u.weighted_votes,
+                CAST(u.ai_match_votes AS REAL) / u.vote_count AS ai_match_ratio,
+                CAST(u.consensus_match_votes AS REAL) / u.vote_count AS consensus_match_ratio,
+                t.trust_weight AS manual_trust_weight,
+                ti.tester_tier
+            FROM tallies u
+            LEFT JOIN user_trust_profiles t ON t.user_id_hash = u.user_id_hash
+            LEFT JOIN user_tester_tiers ti ON ti.user_id_hash = u.user_id_hash
+            ORDER BY u.first_id
+            """,
+            params + (int(min_votes),),
+        )
 
-            stat["vote_count"] += 1
-            stat["weighted_votes"] += weighted_score
-            if ai_label == user_label:
-                stat["ai_match_votes"] += 1
-            if user_label == article_consensus_label.get(article_link, "neutral"):
-                stat["consensus_match_votes"] += 1
-
+        # Rows are streamed off the cursor; the per-user result set is never materialized twice.
         candidates: List[Dict[str, object]] = []
-        for user_id_hash, stat in user_stats.items():
-            vote_count = int(stat["vote_count"])
-            if vote_count < min_votes:
-                continue
-
-            ai_match_ratio = float(stat["ai_match_votes"]) / max(1, vote_count)
-            consensus_match_ratio = float(stat["consensus_match_votes"]) / max(1, vote_count)
-
-            current_tier = tier_map.get(user_id_hash, "general")
-            manual_override = user_id_hash in manual_map
+        for row in user_rows:
+            user_id_hash = str(row["user_id_hash"])
+            vote_count = int(row["vote_count"])
+            ai_match_ratio = float(row["ai_match_ratio"])
+            consensus_match_ratio = float(row["consensus_match_ratio"])
+
+            manual_trust_weight = row["manual_trust_weight"]
+            tester_tier = row["tester_tier"]
+            current_tier = str(tester_tier or "general")
+            manual_override = manual_trust_weight is not None
             if manual_override:
                 effective_source = "manual"
-                effective_weight = float(manual_map[user_id_hash])
-            elif user_id_hash in tier_map:
+                effective_weight = float(manual_trust_weight or DEFAULT_TRUST_WEIGHT)
+            elif tester_tier is not None:
                 effective_source = "tier_default"
                 effective_weight = float(TESTER_TIER_WEIGHTS.get(current_tier, DEFAULT_TRUST_WEIGHT))
             else:
@@ -941,22 +1174,20 @@ class FeedbackStore:
 
             if manual_override:
                 recommendation = "manual_override_keep"
-            elif consensus_match_ratio >= promote_threshold:
-                promote_target = TIER_PROMOTE_TARGET.get(current_tier, current_tier)
-                if promote_target != current_tier:
-                    recommended_tier = promote_target
-                    recommendation = f"promote_{current_tier}_to_{promote_target}"
-            elif consensus_match_ratio <= demote_threshold:
-                demote_target = TIER_DEMOTE_TARGET.get(current_tier, current_tier)
-                if demote_target != current_tier:
-                    recommended_tier = demote_target
-                    recommendation = f"demote_{current_tier}_to_{demote_target}"
+            else:
+                decision = None
+                if consensus_match_ratio >= promote_threshold:
+                    decision = TIER_PROMOTE_DECISION.get(current_tier)
+                elif consensus_match_ratio <= demote_threshold:
+                    decision = TIER_DEMOTE_DECISION.get(current_tier)
+                if decision:
+                    recommended_tier, recommendation = decision
 
             candidates.append(
                 {
                     "user_id_hash": user_id_hash,
                     "vote_count": vote_count,
-                    "weighted_votes": round(float(stat["weighted_votes"]), 4),
+                    "weighted_votes": round(float(row["weighted_votes"] or 0.0), 4),
                     "consensus_match_ratio": round(consensus_match_ratio, 4),
                     "ai_match_ratio": round(ai_match_ratio, 4),
                     "current_tier": current_tier,
@@ -969,15 +1200,16 @@ class FeedbackStore:
                 }
             )
 
-        candidates.sort(
+        # nlargest keeps sorted(..., reverse=True)[:limit] ordering, ties included, without sorting every user.
+        return heapq.nlargest(
+            max(0, int(limit)),
+            candidates,
             key=lambda item: (
-                1 if item.get("recommended_tier") else 0,
-                int(item.get("vote_count", 0)),
-                float(item.get("consensus_match_ratio", 0.0)),
+                item["recommended_tier"] is not None,
+                item["vote_count"],
+                item["consensus_match_ratio"],
             ),
-            reverse=True,
         )
-        return candidates[:limit]
 
     def auto_apply_tester_tiers(
         self,
@@ -1012,36 +1244,105 @@ class FeedbackStore:
                 "preview": actionable[:max_apply],
             }
 
-        applied: List[Dict[str, object]] = []
-        with self._lock, self._connect() as conn:
-            for candidate in actionable[:max_apply]:
-                user_id_hash = str(candidate["user_id_hash"])
-                recommended_tier = str(candidate["recommended_tier"])
-                note = (
+        selected = actionable[:max_apply]
+        updated_at = now_str()
+        tier_rows = [
+            (
+                str(candidate["user_id_hash"]),
+                str(candidate["recommended_tier"]),
+                (
                     "auto_quality:"
                     f"{candidate['recommendation']};"
                     f"votes={candidate['vote_count']};"
                     f"consensus={candidate['consensus_match_ratio']}"
+                ),
+                updated_at,
+            )
+            for candidate in selected
+        ]
+
+        # One upsert batch and set-based reweighting for the whole selection instead of a
+        # trust lookup and reweight round per user.
+        user_hashes_json = json.dumps([row[0] for row in tier_rows])
+        with self._transaction() as conn:
+            conn.executemany(TESTER_TIER_UPSERT_SQL, tier_rows)
+            manual_weights = {
+                str(row["user_id_hash"]): float(row["trust_weight"] or DEFAULT_TRUST_WEIGHT)
+                for row in conn.execute(
+                    """
+                    SELECT user_id_hash, trust_weight
+                    FROM user_trust_profiles
+                    WHERE user_id_hash IN (SELECT value FROM json_each(?))
+                    """,
+                    (user_hashes_json,),
                 )
-                result = self._upsert_user_tier_by_hash(
-                    conn=conn,
-                    user_id_hash=user_id_hash,
-                    tester_tier=recommended_tier,
-                    note=note,
-                    updated_at=now_str(),
+            }
+            feedback_counts = {
+                str(row["user_id_hash"]): int(row["feedback_count"])
+                for row in conn.execute(
+                    """
+                    SELECT user_id_hash, COUNT(*) AS feedback_count
+                    FROM feedback_events
+                    WHERE user_id_hash IN (SELECT value FROM json_each(?))
+                    GROUP BY user_id_hash
+                    """,
+                    (user_hashes_json,),
                 )
-                applied.append(
-                    {
-                        "user_id_hash": user_id_hash,
-                        "from_tier": candidate["current_tier"],
-                        "to_tier": recommended_tier,
-                        "recommendation": candidate["recommendation"],
-                        "consensus_match_ratio": candidate["consensus_match_ratio"],
-                        "vote_count": candidate["vote_count"],
-                        "result": result,
-                    }
+            }
+            reweight_rows = [
+                (float(TESTER_TIER_WEIGHTS[tester_tier]), user_id_hash)
+                for user_id_hash, tester_tier, _, _ in tier_rows
+                if user_id_hash not in manual_weights and feedback_counts.get(user_id_hash)
+            ]
+            if reweight_rows:
+                conn.executemany(
+                    """
+                    UPDATE feedback_events
+                    SET trust_weight = ?
+                    WHERE user_id_hash = ?
+                    """,
+                    reweight_rows,
+                )
+                conn.execute(
+                    """
+                    UPDATE keyword_votes
+                    SET weight = (SELECT weighted_score FROM feedback_events WHERE id = keyword_votes.feedback_id)
+                    WHERE feedback_id IN (
+                        SELECT id FROM feedback_events
+                        WHERE user_id_hash IN (SELECT value FROM json_each(?))
+                    )
+                    """,
+                    (json.dumps([user_id_hash for _, user_id_hash in reweight_rows]),),
                 )
 
+        self._invalidate_trust(*(row[0] for row in tier_rows))
+        applied: List[Dict[str, object]] = []
+        for candidate, (user_id_hash, tester_tier, note, _) in zip(selected, tier_rows):
+            manual_override = user_id_hash in manual_weights
+            default_weight = float(TESTER_TIER_WEIGHTS[tester_tier])
+            applied.append(
+                {
+                    "user_id_hash": user_id_hash,
+                    "from_tier": candidate["current_tier"],
+                    "to_tier": tester_tier,
+                    "recommendation": candidate["recommendation"],
+                    "consensus_match_ratio": candidate["consensus_match_ratio"],
+                    "vote_count": candidate["vote_count"],
+                    "result": {
+                        "user_id_hash": user_id_hash,
+                        "tester_tier": tester_tier,
+                        "default_weight": default_weight,
+                        "effective_trust_weight": round(
+                            manual_weights[user_id_hash] if manual_override else default_weight, 4
+                        ),
+                        "effective_source": "manual" if manual_override else "tier_default",
+                        "note": note,
+                        "updated_at": updated_at,
+                        "updated_feedback_count": 0 if manual_override else feedback_counts.get(user_id_hash, 0),
+                    },
+                }
+            )
+
         return {
             "dry_run": False,
             "candidates_count": len(candidates),
@@ -1057,28 +1358,28 @@ class FeedbackStore:
         min_disagreement_ratio: float = 0.3,
         limit: int = 100,
     ) -> List[Dict[str, object]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                WITH agg AS (
-                    SELECT
-                        keyword,
-                        COUNT(*) AS vote_count,
-                        SUM(weight) AS total_weight,
-                        SUM(CASE WHEN user_label = 'positive' THEN weight ELSE 0 END) AS w_pos,
-                        SUM(CASE WHEN user_label = 'negative' THEN weight ELSE 0 END) AS w_neg,
-                        SUM(CASE WHEN user_label = 'neutral' THEN weight ELSE 0 END) AS w_neu,
-                        SUM(CASE WHEN ai_label != user_label THEN weight ELSE 0 END) AS w_disagree
-                    FROM keyword_votes
-                    GROUP BY keyword
-                )
-                SELECT * FROM agg
-                WHERE vote_count >= ?
-                ORDER BY vote_count DESC, total_weight DESC
-                LIMIT ?
-                """,
-                (min_votes, limit * 3),
-            ).fetchall()
+        conn = self._connect()
+        rows = conn.execute(
+            """
+            WITH agg AS (
+                SELECT
+                    keyword,
+                    COUNT(*) AS vote_count,
+                    SUM(weight) AS total_weight,
+                    TOTAL(weight) FILTER (WHERE user_label = 'positive') AS w_pos,
+                    TOTAL(weight) FILTER (WHERE user_label = 'negative') AS w_neg,
+                    TOTAL(weight) FILTER (WHERE user_label = 'neutral') AS w_neu,
+                    TOTAL(weight) FILTER (WHERE ai_label != user_label) AS w_disagree
+                FROM keyword_votes
+                GROUP BY keyword
+            )
+            SELECT * FROM agg
+            WHERE vote_count >= ?
+            ORDER BY vote_count DESC, total_weight DESC
+            LIMIT ?
+            """,
+            (min_votes, limit * 3),
+        ).fetchall()
 
         candidates: List[Dict[str, object]] = []
         for row in rows:
@@ -1091,8 +1392,8 @@ class FeedbackStore:
                 "negative": float(row["w_neg"] or 0.0),
                 "neutral": float(row["w_neu"] or 0.0),
             }
-            best_label, best_weight = max(weights.items(), key=lambda x: x[1])
-            consensus_ratio = best_weight / total_weight
+            best_label = _consensus_label(weights["positive"], weights["negative"], weights["neutral"])
+            consensus_ratio = weights[best_label] / total_weight
             disagreement_ratio = float(row["w_disagree"] or 0.0) / total_weight
 
             if consensus_ratio < consensus_threshold:
@@ -1136,7 +1437,7 @@ class FeedbackStore:
             raise ValueError("keyword is required")
 
         updated_at = now_str()
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 INSERT INTO keyword_rules (keyword, label, status, source, support_votes, consensus_ratio, updated_at)
@@ -1169,7 +1470,7 @@ class FeedbackStore:
             raise ValueError("keyword is required")
 
         updated_at = now_str()
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 UPDATE keyword_rules
@@ -1183,30 +1484,18 @@ class FeedbackStore:
         return {"keyword": keyword, "status": "disabled", "updated_at": updated_at}
 
     def list_keyword_rules(self, status: str = "applied", limit: int = 200) -> List[Dict[str, object]]:
-        with self._connect() as conn:
-            rows = conn.execute(
-                """
-                SELECT keyword, label, status, source, support_votes, consensus_ratio, updated_at
-                FROM keyword_rules
-                WHERE status = ?
-                ORDER BY support_votes DESC, consensus_ratio DESC, updated_at DESC
-                LIMIT ?
-                """,
-                (status, limit),
-            ).fetchall()
-
-        return [
-            {
-                "keyword": str(row["keyword"]),
-                "label": str(row["label"]),
-                "status": str(row["status"]),
-                "source": str(row["source"]),
-                "support_votes": int(row["support_votes"] or 0),
-                "consensus_ratio": float(row["consensus_ratio"] or 0.0),
-                "updated_at": str(row["updated_at"]),
-            }
-            for row in rows
-        ]
+        cursor = self._connect().cursor()
+        cursor.row_factory = _keyword_rule_row
+        return cursor.execute(
+            """
+            SELECT keyword, label, status, source, support_votes, consensus_ratio, updated_at
+            FROM keyword_rules
+            WHERE status = ?
+            ORDER BY support_votes DESC, consensus_ratio DESC, updated_at DESC
+            LIMIT ?
+            """,
+            (status, limit),
+        ).fetchall()
 
     def log_admin_action(
         self,
@@ -1218,7 +1507,7 @@ class FeedbackStore:
         created_at = now_str()
         meta_json = json.dumps(meta or {}, ensure_ascii=False, separators=(",", ":"))
 
-        with self._lock, self._connect() as conn:
+        with self._transaction() as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO admin_audit_logs (created_at, action, target_type, target_id, meta_json)
@@ -1229,168 +1518,153 @@ class FeedbackStore:
             return int(cursor.lastrowid)
 
     def list_admin_audit_logs(self, limit: int = 200, action: Optional[str] = None) -> List[Dict[str, object]]:
-        with self._connect() as conn:
-            if action:
-                rows = conn.execute(
-                    """
-                    SELECT id, created_at, action, target_type, target_id, meta_json
-                    FROM admin_audit_logs
-                    WHERE action = ?
-                    ORDER BY id DESC
-                    LIMIT ?
-                    """,
-                    (action, int(limit)),
-                ).fetchall()
-            else:
-                rows = conn.execute(
-                    """
-                    SELECT id, created_at, action, target_type, target_id, meta_json
-                    FROM admin_audit_logs
-                    ORDER BY id DESC
-                    LIMIT ?
-                    """,
-                    (int(limit),),
-                ).fetchall()
-
-        logs: List[Dict[str, object]] = []
-        for row in rows:
-            raw_meta = str(row["meta_json"] or "{}")
-            try:
-                meta = json.loads(raw_meta)
-            except json.JSONDecodeError:
-                meta = {"raw": raw_meta}
-            logs.append(
-                {
-                    "id": int(row["id"]),
-                    "created_at": str(row["created_at"]),
-                    "action": str(row["action"]),
-                    "target_type": str(row["target_type"]),
-                    "target_id": str(row["target_id"]),
-                    "meta": meta,
-                }
-            )
-        return logs
-
-    def get_metrics(self, since_hours: int = 24) -> Dict[str, object]:
-        bounded_hours = max(1, int(since_hours))
-        cutoff = (datetime.now() - timedelta(hours=bounded_hours)).strftime("%Y-%m-%d %H:%M:%S")
-
-        with self._connect() as conn:
-            total_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS total_feedback_events,
-                    COUNT(DISTINCT user_id_hash) AS total_unique_users,
-                    SUM(weighted_score) AS total_weighted_votes,
-                    SUM(CASE WHEN ai_label = user_label THEN 1 ELSE 0 END) AS total_ai_match_votes,
-                    MIN(created_at) AS first_feedback_at,
-                    MAX(created_at) AS last_feedback_at
-                FROM feedback_events
-                """
-            ).fetchone()
-
-            recent_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS recent_feedback_events,
-                    COUNT(DISTINCT user_id_hash) AS recent_unique_users,
-                    SUM(weighted_score) AS recent_weighted_votes,
-                    SUM(CASE WHEN ai_label = user_label THEN 1 ELSE 0 END) AS recent_ai_match_votes
-                FROM feedback_events
-                WHERE created_at >= ?
-                """,
-                (cutoff,),
-            ).fetchone()
-
-            total_labels = conn.execute(
-                """
-                SELECT user_label, COUNT(*) AS cnt
-                FROM feedback_events
-                GROUP BY user_label
+        cursor = self._connect().cursor()
+        cursor.row_factory = _admin_audit_row
+        if action:
+            return cursor.execute(
                 """
-            ).fetchall()
-
-            recent_labels = conn.execute(
-                """
-                SELECT user_label, COUNT(*) AS cnt
-                FROM feedback_events
-                WHERE created_at >= ?
-                GROUP BY user_label
+                SELECT id, created_at, action, target_type, target_id, meta_json
+                FROM admin_audit_logs
+                WHERE action = ?
+                ORDER BY created_at DESC, id DESC
+                LIMIT ?
                 """,
-                (cutoff,),
+                (action, int(limit)),
             ).fetchall()
+        return cursor.execute(
+            """
+            SELECT id, created_at, action, target_type, target_id, meta_json
+            FROM admin_audit_logs
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (int(limit),),
+        ).fetchall()
 
-            keyword_votes_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM keyword_votes
-                """
-            ).fetchone()
-
-            keyword_rules_row = conn.execute(
-                """
-                SELECT
-                    SUM(CASE WHEN status = 'applied' THEN 1 ELSE 0 END) AS applied_count,
-                    SUM(CASE WHEN status = 'disabled' THEN 1 ELSE 0 END) AS disabled_count
-                FROM keyword_rules
-                """
-            ).fetchone()
-
-            trust_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM user_trust_profiles
-                """
-            ).fetchone()
+    def list_admin_audit_logs_json(self, limit: int = 200, action: Optional[str] = None) -> Tuple[int, str]:
+        # Same rows as list_admin_audit_logs, rendered by SQLite as a JSON array so the API can return the
+        # stored meta_json as-is instead of parsing and re-encoding it per row.
+        where = "WHERE action = ?" if action else ""
+        order = "created_at DESC, id DESC" if action else "id DESC"
+        params: Tuple[object, ...] = (action, int(limit)) if action else (int(limit),)
+        cursor = self._connect().cursor()
+        cursor.row_factory = None
+        rows = cursor.execute(
+            f"""
+            SELECT json_object(
+                'id', id,
+                'created_at', created_at,
+                'action', action,
+                'target_type', target_type,
+                'target_id', target_id,
+                'meta', CASE
+                    WHEN meta_json = '' THEN json_object()
+                    WHEN json_valid(meta_json) THEN json(meta_json)
+                    ELSE json_object('raw', meta_json)
+                END
+            )
+            FROM admin_audit_logs
+            {where}
+            ORDER BY {order}
+            LIMIT ?
+            """,
+            params,
+        ).fetchall()
+        return len(rows), "[" + ",".join(row[0] for row in rows) + "]"
 
-            tier_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM user_tester_tiers
-                """
-            ).fetchone()
+    def get_metrics(self, since_hours: int = 24) -> Dict[str, object]:
+        bounded_hours = max(1, int(since_hours))
+        return self._cached_read(("metrics", bounded_hours), lambda: self._compute_metrics(bounded_hours))
+
+    def _submit_metrics_read(self, read: Callable[[], sqlite3.Row]) -> "Future[sqlite3.Row]":
+        if self.db_path == ":memory:":
+            # Each in-memory connection is a separate database, so another thread would read an empty one.
+            future: "Future[sqlite3.Row]" = Future()
+            future.set_result(read())
+            return future
+        with self._metrics_pool_lock:
+            if self._metrics_pool is None:
+                self._metrics_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="feedback-metrics")
+            pool = self._metrics_pool
+        return pool.submit(read)
+
+    def _load_metrics_counts(self) -> sqlite3.Row:
+        return self._connect().execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM keyword_votes) AS keyword_votes_count,
+                (SELECT COUNT(*) FROM keyword_rules WHERE status = 'applied') AS keyword_rules_applied_count,
+                (SELECT COUNT(*) FROM keyword_rules WHERE status = 'disabled') AS keyword_rules_disabled_count,
+                (SELECT COUNT(*) FROM user_trust_profiles) AS user_trust_profile_count,
+                (SELECT COUNT(*) FROM user_tester_tiers) AS user_tier_count,
+                (SELECT COUNT(*) FROM admin_audit_logs) AS admin_audit_log_count
+            """
+        ).fetchone()
 
-            audit_row = conn.execute(
-                """
-                SELECT COUNT(*) AS cnt
-                FROM admin_audit_logs
-                """
-            ).fetchone()
+    def _compute_metrics(self, bounded_hours: int) -> Dict[str, object]:
+        cutoff = cutoff_str(bounded_hours * 3600)
+
+        conn = self._connect()
+        # The small-table counts run on a pool thread (its own connection, concurrent under WAL) while this
+        # thread scans feedback_events; sqlite3 releases the GIL while a statement steps.
+        counts_future = self._submit_metrics_read(self._load_metrics_counts)
+        # One pass over feedback_events covers the totals, the recent window and both label distributions.
+        feedback_row = conn.execute(
+            f"""
+            SELECT
+                COUNT(*) AS total_feedback_events,
+                COUNT(DISTINCT user_id_hash) AS total_unique_users,
+                SUM({WEIGHTED_SCORE_SQL}) AS total_weighted_votes,
+                COUNT(*) FILTER (WHERE ai_label = user_label) AS total_ai_match_votes,
+                MIN(created_at) AS first_feedback_at,
+                MAX(created_at) AS last_feedback_at,
+                COUNT(*) FILTER (WHERE user_label = 'positive') AS total_positive,
+                COUNT(*) FILTER (WHERE user_label = 'negative') AS total_negative,
+                COUNT(*) FILTER (WHERE user_label = 'neutral') AS total_neutral,
+                COUNT(*) FILTER (WHERE created_at >= :cutoff) AS recent_feedback_events,
+                COUNT(DISTINCT CASE WHEN created_at >= :cutoff THEN user_id_hash END) AS recent_unique_users,
+                TOTAL({WEIGHTED_SCORE_SQL}) FILTER (WHERE created_at >= :cutoff) AS recent_weighted_votes,
+                COUNT(*) FILTER (WHERE created_at >= :cutoff AND ai_label = user_label)
+                    AS recent_ai_match_votes,
+                COUNT(*) FILTER (WHERE created_at >= :cutoff AND user_label = 'positive') AS recent_positive,
+                COUNT(*) FILTER (WHERE created_at >= :cutoff AND user_label = 'negative') AS recent_negative,
+                COUNT(*) FILTER (WHERE created_at >= :cutoff AND user_label = 'neutral') AS recent_neutral
+            FROM feedback_events
+            """,
+            {"cutoff": cutoff},
+        ).fetchone()
 
-        total_feedback_events = int(total_row["total_feedback_events"] or 0)
-        recent_feedback_events = int(recent_row["recent_feedback_events"] or 0)
-        total_ai_match_votes = int(total_row["total_ai_match_votes"] or 0)
-        recent_ai_match_votes = int(recent_row["recent_ai_match_votes"] or 0)
+        counts_row = counts_future.result()
 
-        total_label_distribution = {"positive": 0, "negative": 0, "neutral": 0}
-        for row in total_labels:
-            total_label_distribution[str(row["user_label"])] = int(row["cnt"] or 0)
+        total_feedback_events = int(feedback_row["total_feedback_events"] or 0)
+        recent_feedback_events = int(feedback_row["recent_feedback_events"] or 0)
+        total_ai_match_votes = int(feedback_row["total_ai_match_votes"] or 0)
+        recent_ai_match_votes = int(feedback_row["recent_ai_match_votes"] or 0)
 
-        recent_label_distribution = {"positive": 0, "negative": 0, "neutral": 0}
-        for row in recent_labels:
-            recent_label_distribution[str(row["user_label"])] = int(row["cnt"] or 0)
+        total_label_distribution = {label: int(feedback_row[f"total_{label}"] or 0) for label in LABELS}
+        recent_label_distribution = {label: int(feedback_row[f"recent_{label}"] or 0) for label in LABELS}
 
         return {
             "window_hours": bounded_hours,
             "window_start": cutoff,
             "total_feedback_events": total_feedback_events,
             "recent_feedback_events": recent_feedback_events,
-            "total_unique_users": int(total_row["total_unique_users"] or 0),
-            "recent_unique_users": int(recent_row["recent_unique_users"] or 0),
-            "total_weighted_votes": round(float(total_row["total_weighted_votes"] or 0.0), 4),
-            "recent_weighted_votes": round(float(recent_row["recent_weighted_votes"] or 0.0), 4),
+            "total_unique_users": int(feedback_row["total_unique_users"] or 0),
+            "recent_unique_users": int(feedback_row["recent_unique_users"] or 0),
+            "total_weighted_votes": round(float(feedback_row["total_weighted_votes"] or 0.0), 4),
+            "recent_weighted_votes": round(float(feedback_row["recent_weighted_votes"] or 0.0), 4),
             "total_ai_match_ratio": round(total_ai_match_votes / max(1, total_feedback_events), 4),
             "recent_ai_match_ratio": round(recent_ai_match_votes / max(1, recent_feedback_events), 4),
             "label_distribution": total_label_distribution,
             "recent_label_distribution": recent_label_distribution,
-            "keyword_votes_count": int(keyword_votes_row["cnt"] or 0),
-            "keyword_rules_applied_count": int(keyword_rules_row["applied_count"] or 0),
-            "keyword_rules_disabled_count": int(keyword_rules_row["disabled_count"] or 0),
-            "user_trust_profile_count": int(trust_row["cnt"] or 0),
-            "user_tier_count": int(tier_row["cnt"] or 0),
-            "admin_audit_log_count": int(audit_row["cnt"] or 0),
-            "first_feedback_at": str(total_row["first_feedback_at"] or ""),
-            "last_feedback_at": str(total_row["last_feedback_at"] or ""),
+            "keyword_votes_count": int(counts_row["keyword_votes_count"] or 0),
+            "keyword_rules_applied_count": int(counts_row["keyword_rules_applied_count"] or 0),
+            "keyword_rules_disabled_count": int(counts_row["keyword_rules_disabled_count"] or 0),
+            "user_trust_profile_count": int(counts_row["user_trust_profile_count"] or 0),
+            "user_tier_count": int(counts_row["user_tier_count"] or 0),
+            "admin_audit_log_count": int(counts_row["admin_audit_log_count"] or 0),
+            "first_feedback_at": str(feedback_row["first_feedback_at"] or ""),
+            "last_feedback_at": str(feedback_row["last_feedback_at"] or ""),
         }
 
     def get_stock_feedback_signal(
@@ -1401,51 +1675,66 @@ class FeedbackStore:
     ) -> Dict[str, object]:
         bounded_hours = max(1, int(since_hours))
         bounded_min_votes = max(1, int(min_votes))
-        cutoff = (datetime.now() - timedelta(hours=bounded_hours)).strftime("%Y-%m-%d %H:%M:%S")
-
-        with self._connect() as conn:
-            total_row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) AS total_votes,
-                    COUNT(DISTINCT user_id_hash) AS unique_users,
-                    SUM(weighted_score) AS total_weighted_votes,
-                    SUM(CASE WHEN ai_label = user_label THEN 1 ELSE 0 END) AS ai_match_votes
-                FROM feedback_events
-                WHERE stock_code = ? AND created_at >= ?
-                """,
-                (stock_code, cutoff),
-            ).fetchone()
+        return self._cached_read(
+            ("stock_signal", stock_code, bounded_hours, bounded_min_votes),
+            lambda: self._compute_stock_feedback_signal(stock_code, bounded_hours, bounded_min_votes),
+        )
 
-            label_rows = conn.execute(
-                """
-                SELECT
-                    user_label,
-                    COUNT(*) AS vote_count,
-                    SUM(weighted_score) AS weighted_votes
+    def _compute_stock_feedback_signal(
+        self,
+        stock_code: str,
+        bounded_hours: int,
+        bounded_min_votes: int,
+    ) -> Dict[str, object]:
+        cutoff = cutoff_str(bounded_hours * 3600)
+
+        # The window slice is read from the covering index once; per-label rows carry the totals and the
+        # trailing NULL-label row carries the distinct-user count, which cannot be summed across labels.
+        rows = self._connect().execute(
+            f"""
+            WITH scoped AS MATERIALIZED (
+                SELECT user_id_hash, ai_label, user_label, {WEIGHTED_SCORE_SQL} AS weighted_score
                 FROM feedback_events
                 WHERE stock_code = ? AND created_at >= ?
-                GROUP BY user_label
-                """,
-                (stock_code, cutoff),
-            ).fetchall()
-
-        total_votes = int(total_row["total_votes"] or 0)
-        unique_users = int(total_row["unique_users"] or 0)
-        total_weighted_votes = float(total_row["total_weighted_votes"] or 0.0)
-        ai_match_votes = int(total_row["ai_match_votes"] or 0)
+            )
+            SELECT
+                user_label,
+                COUNT(*) AS vote_count,
+                SUM(weighted_score) AS weighted_votes,
+                COUNT(*) FILTER (WHERE ai_label = user_label) AS ai_match_votes
+            FROM scoped
+            GROUP BY user_label
+            UNION ALL
+            SELECT NULL, COUNT(DISTINCT user_id_hash), NULL, NULL
+            FROM scoped
+            """,
+            (stock_code, cutoff),
+        ).fetchall()
 
+        total_votes = 0
+        unique_users = 0
+        total_weighted_votes = 0.0
+        ai_match_votes = 0
         label_votes = {"positive": 0, "negative": 0, "neutral": 0}
         label_weighted_votes = {"positive": 0.0, "negative": 0.0, "neutral": 0.0}
-        for row in label_rows:
-            label = str(row["user_label"])
-            label_votes[label] = int(row["vote_count"] or 0)
-            label_weighted_votes[label] = float(row["weighted_votes"] or 0.0)
+        for label, vote_count, weighted_votes, label_ai_match_votes in rows:
+            if label is None:
+                unique_users = int(vote_count or 0)
+                continue
+            label_votes[label] = int(vote_count or 0)
+            label_weighted_votes[label] = float(weighted_votes or 0.0)
+            total_votes += label_votes[label]
+            total_weighted_votes += label_weighted_votes[label]
+            ai_match_votes += int(label_ai_match_votes or 0)
 
         consensus_label = "neutral"
         consensus_ratio = 0.0
         if total_weighted_votes > 0:
-            consensus_label = max(label_weighted_votes.items(), key=lambda x: x[1])[0]
+            consensus_label = _consensus_label(
+                label_weighted_votes["positive"],
+                label_weighted_votes["negative"],
+                label_weighted_votes["neutral"],
+            )
             consensus_ratio = label_weighted_votes[consensus_label] / total_weighted_votes
 
         return {
@@ -1468,30 +1757,50 @@ class FeedbackStore:
             "ready": total_votes >= bounded_min_votes,
         }
 
-    def get_applied_rules_map(self) -> Dict[str, Dict[str, object]]:
+    def get_applied_rules_map(self) -> Mapping[str, Dict[str, object]]:
+        # Read-only view of the cache; callers only look rules up, so no per-call copy is made.
         now = time.time()
         if now - self._rules_cache_ts <= self._rules_cache_ttl_sec and self._rules_cache:
-            return dict(self._rules_cache)
+            return self._rules_cache
 
-        rules = self.list_keyword_rules(status="applied", limit=5000)
+        # The literal status predicate lets SQLite match the idx_keyword_rules_applied partial index.
+        cursor = self._connect().cursor()
+        cursor.row_factory = None
+        cursor.execute(
+            """
+            SELECT keyword, label, source, support_votes, consensus_ratio
+            FROM keyword_rules
+            WHERE status = 'applied'
+            ORDER BY support_votes DESC, consensus_ratio DESC, updated_at DESC
+            LIMIT 5000
+            """
+        )
         mapped = {
-            rule["keyword"]: {
-                "label": rule["label"],
-                "support_votes": rule["support_votes"],
-                "consensus_ratio": rule["consensus_ratio"],
-                "source": rule["source"],
+            keyword: {
+                "label": label,
+                "support_votes": support_votes,
+                "consensus_ratio": float(consensus_ratio),
+                "source": source,
             }
-            for rule in rules
+            for keyword, label, source, support_votes, consensus_ratio in cursor
         }
-        self._rules_cache = mapped
+        self._rules_matcher = _build_rules_matcher(mapped)
+        self._rules_cache = MappingProxyType(mapped)
         self._rules_cache_ts = now
-        return dict(mapped)
-
-    def match_applied_rules(self, text: str) -> List[Tuple[str, Dict[str, object]]]:
-        rules = self.get_applied_rules_map()
-        lowered = text.lower()
-        matched: List[Tuple[str, Dict[str, object]]] = []
-        for keyword, rule in rules.items():
-            if keyword and keyword in lowered:
-                matched.append((keyword, rule))
-        return matched
+        return self._rules_cache
+
+    @contextmanager
+    def rules_snapshot(self) -> Iterator[RulesMatcher]:
+        # Batch callers check cache freshness once and pass the frozen matcher to every match_applied_rules call.
+        self.get_applied_rules_map()
+        yield self._rules_matcher
+
+    def match_applied_rules(
+        self,
+        text: str,
+        snapshot: Optional[RulesMatcher] = None,
+    ) -> List[Tuple[str, Dict[str, object]]]:
+        if snapshot is None:
+            self.get_applied_rules_map()
+            snapshot = self._rules_matcher
+        return _match_rules(snapshot, text.lower())
@@ -1,10 +1,16 @@
 ﻿from collections import Counter, defaultdict, deque
 import csv
 from datetime import datetime
+from functools import lru_cache
 import io
+import json
+import math
+from operator import itemgetter
 from pathlib import Path
-from typing import Deque, Dict, List, Literal, Optional, Tuple
+from types import MappingProxyType
+from typing import Deque, Dict, List, Literal, Mapping, Optional, Tuple
 import hashlib
+import hmac
 import os
 import re
 import threading
@@ -12,11 +18,11 @@ import time
 
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import uvicorn
 
 from crawler import NaverNewsSearchCrawler
-from feedback_store import FeedbackStore
+from feedback_store import FeedbackStore, RulesMatcher
 from alert_store import AlertStore
 
 
@@ -60,18 +66,18 @@ STOCK_CODE_TO_NAME: Dict[str, str] = {
 
 DEFAULT_WATCHLIST = [{"code": code, "name": name} for code, name in STOCK_CODE_TO_NAME.items()]
 
-POSITIVE_KEYWORDS = {
+POSITIVE_KEYWORDS = frozenset({
     "\uc0c1\uc2b9", "\uae09\ub4f1", "\ud751\uc790", "\uc0ac\uc0c1\ucd5c\ub300", "\uc131\uc7a5", "\uc218\uc8fc", "\uacc4\uc57d", "\uccb4\uacb0",
     "\uc2b9\uc778", "\ud1b5\uacfc", "\ud2b9\ud5c8", "\ud655\ub300", "\uc99d\uac00", "\ud638\uc2e4\uc801", "\uc2e0\uace0\uac00", "\ubc30\ub2f9",
     "\ub9e4\uc218", "\ud22c\uc790\uc720\uce58", "\ucd9c\uc2dc", "\uc591\uc0b0", "\ud30c\ud2b8\ub108\uc2ed", "\uacf5\uae09", "\uc218\ud61c",
     "\uac15\uc138", "\uac1c\uc120",
-}
+})
 
-NEGATIVE_KEYWORDS = {
+NEGATIVE_KEYWORDS = frozenset({
     "\ud558\ub77d", "\uae09\ub77d", "\uc801\uc790", "\uac10\uc18c", "\ucd95\uc18c", "\uc911\ub2e8", "\uc9c0\uc5f0", "\ub9ac\uc2a4\ud06c", "\uc545\ud654",
     "\uc6b0\ub824", "\uc18c\uc1a1", "\uc81c\uc7ac", "\uc870\uc0ac", "\uc2e4\ud328", "\ucca0\ud68c", "\ucde8\uc18c", "\ud30c\uc5c5", "\uc190\uc2e4",
     "\uacbd\uace0", "\ub9e4\ub3c4", "\uc57d\uc138", "\ubd80\uc9c4", "\uac10\uc6d0", "\uc720\uc99d", "\ud574\uc9c0", "\uace0\ubc1c",
-}
+})
 
 IMPACT_POSITIVE_KEYWORDS: Dict[str, int] = {
     "\uc2e4\uc801": 8,
@@ -95,6 +101,12 @@ IMPACT_NEGATIVE_KEYWORDS: Dict[str, int] = {
     "\ud558\ud5a5": 8,
 }
 
+# Signed weights: negative keywords carry -weight so one pass scores both polarities
+IMPACT_KEYWORDS: Dict[str, int] = {
+    **IMPACT_POSITIVE_KEYWORDS,
+    **{kw: -weight for kw, weight in IMPACT_NEGATIVE_KEYWORDS.items()},
+}
+
 FEEDBACK_RULE_SCORE_BOOST = 2
 FEEDBACK_CONSENSUS_MIN_VOTES = int(os.getenv("FEEDBACK_CONSENSUS_MIN_VOTES", "20"))
 FEEDBACK_CONSENSUS_THRESHOLD = float(os.getenv("FEEDBACK_CONSENSUS_THRESHOLD", "0.8"))
@@ -109,6 +121,7 @@ ADMIN_WRITE_KEY_ENV = "SIGNALWATCH_ADMIN_WRITE_KEY"
 ADMIN_WRITE_RATE_LIMIT_COUNT_ENV = "ADMIN_WRITE_RATE_LIMIT_COUNT"
 ADMIN_WRITE_RATE_LIMIT_WINDOW_SEC_ENV = "ADMIN_WRITE_RATE_LIMIT_WINDOW_SEC"
 ADMIN_WRITE_RATE_LIMIT_ACTION_PREFIX = "ADMIN_WRITE_RATE_LIMIT"
+ACTION_TOKEN_RE = re.compile(r"[^A-Za-z0-9]+")
 ADMIN_WRITE_ACTIONS = [
     "upsert_user_trust",
     "reset_user_trust",
@@ -126,7 +139,8 @@ ADMIN_WRITE_ACTIONS = [
     "monitoring_adaptive_profile_update",
 ]
 ADMIN_WRITE_RATE_LOCK = threading.Lock()
-ADMIN_WRITE_RATE_BUCKETS: Dict[str, Deque[float]] = defaultdict(deque)
+# Token bucket per "identity:action": (tokens left, last refill time); refills at max_requests per window.
+ADMIN_WRITE_RATE_BUCKETS: Dict[str, Tuple[float, float]] = {}
 
 
 def _bounded_int_env(name: str, default: int, min_value: int, max_value: int) -> int:
@@ -148,6 +162,11 @@ def _bounded_float_env(name: str, default: float, min_value: float, max_value: f
 
 
 def _bounded_int(value: object, default: int, min_value: int, max_value: int) -> int:
+    # Fast path for already-validated ints (bool excluded so True still maps to 1)
+    if type(value) is int:
+        if value > max_value:
+            value = max_value
+        return min_value if value < min_value else value
     try:
         parsed = int(value)
     except (TypeError, ValueError):
@@ -188,6 +207,12 @@ if MONITORING_ADAPTIVE_MIN_BOUND > MONITORING_ADAPTIVE_MAX_BOUND:
         MONITORING_ADAPTIVE_MIN_BOUND,
     )
 
+# topic_key_from_title normalizers, applied in this order.
+TOPIC_BRACKET_RE = re.compile(r"\[[^\]]*\]")
+TOPIC_PAREN_RE = re.compile(r"\([^)]*\)")
+TOPIC_PUNCT_RE = re.compile(r"[\"'“”‘’`·…,:;!?/\\|]+")
+TOPIC_SPACE_RE = re.compile(r"\s+")
+
 # In-memory history to detect "news surge" patterns.
 NEWS_COUNT_HISTORY: Dict[str, Deque[int]] = defaultdict(lambda: deque(maxlen=40))
 
@@ -285,12 +310,20 @@ SCHEDULER_STATE: Dict[str, object] = {
     "next_interval_sec": 0,
     "active_policy_name": "",
 }
+# (source adaptive_profiles dict, read-only sanitized view); writers replace the dict, never mutate it
+ADAPTIVE_PROFILES_SNAPSHOT: Tuple[Optional[object], Mapping[str, Mapping[str, object]]] = (None, MappingProxyType({}))
 
 
 SentimentLabel = Literal["positive", "negative", "neutral"]
 
 
+# Request bodies reject unknown fields and trim string input during validation.
+REQUEST_MODEL_CONFIG = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+
 class ArticleFeedbackRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     user_id: str = Field(..., min_length=3, max_length=128, description="Tester/device unique id")
     stock_code: str = Field(..., min_length=1, max_length=20)
     article_link: str = Field(..., min_length=5, max_length=2000)
@@ -303,6 +336,8 @@ class ArticleFeedbackRequest(BaseModel):
 
 
 class KeywordRuleApplyRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     keyword: str = Field(..., min_length=2, max_length=100)
     label: SentimentLabel
     support_votes: int = Field(default=0, ge=0)
@@ -311,26 +346,36 @@ class KeywordRuleApplyRequest(BaseModel):
 
 
 class KeywordRuleDisableRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     keyword: str = Field(..., min_length=2, max_length=100)
 
 
 class UserTrustUpdateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     user_id: str = Field(..., min_length=3, max_length=128, description="Tester/device unique id")
     trust_weight: float = Field(..., ge=0.2, le=3.0)
     note: str = Field(default="", max_length=200)
 
 
 class UserTrustResetRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     user_id: str = Field(..., min_length=3, max_length=128, description="Tester/device unique id")
 
 
 class UserTierUpdateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     user_id: str = Field(..., min_length=3, max_length=128, description="Tester/device unique id")
     tester_tier: Literal["core", "general", "observer"]
     note: str = Field(default="", max_length=200)
 
 
 class UserTierAutoApplyRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     min_votes: int = Field(default=TESTER_QUALITY_MIN_VOTES_DEFAULT, ge=5, le=10000)
     promote_threshold: float = Field(default=TESTER_QUALITY_PROMOTE_THRESHOLD_DEFAULT, ge=0.5, le=1.0)
     demote_threshold: float = Field(default=TESTER_QUALITY_DEMOTE_THRESHOLD_DEFAULT, ge=0.0, le=0.9)
@@ -341,11 +386,15 @@ class UserTierAutoApplyRequest(BaseModel):
 
 
 class AlertHistoryPruneRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     retention_days: int = Field(default=ALERT_HISTORY_RETENTION_DAYS, ge=1, le=3650)
     max_rows: int = Field(default=ALERT_HISTORY_MAX_ROWS, ge=100, le=2000000)
 
 
 class MonitoringAdaptiveUpdateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     enabled: Optional[bool] = None
     target_alert_count: Optional[int] = Field(default=None, ge=0, le=100)
     alert_band: Optional[int] = Field(default=None, ge=0, le=20)
@@ -356,6 +405,8 @@ class MonitoringAdaptiveUpdateRequest(BaseModel):
 
 
 class MonitoringAdaptiveProfileUpdateRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     policy_name: Literal["pre_market", "market_open", "after_close", "night_watch"]
     enabled: Optional[bool] = None
     target_alert_count: Optional[int] = Field(default=None, ge=0, le=100)
@@ -370,6 +421,8 @@ def now_str() -> str:
     return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
+# Admin env vars are read once per process; _reset_admin_caches() re-reads them (tests change them at runtime).
+@lru_cache(maxsize=1)
 def _admin_key_config() -> Dict[str, object]:
     legacy_key = os.getenv(ADMIN_KEY_ENV, "").strip()
     read_key = os.getenv(ADMIN_READ_KEY_ENV, "").strip() or legacy_key
@@ -383,11 +436,13 @@ def _admin_key_config() -> Dict[str, object]:
     }
 
 
+@lru_cache(maxsize=256)
 def _rate_action_token(action: str) -> str:
-    token = re.sub(r"[^A-Za-z0-9]+", "_", action).strip("_").upper()
+    token = ACTION_TOKEN_RE.sub("_", action).strip("_").upper()
     return token or "DEFAULT"
 
 
+@lru_cache(maxsize=256)
 def _write_rate_limit_config(action: Optional[str] = None) -> Dict[str, object]:
     default_count = _bounded_int_env(ADMIN_WRITE_RATE_LIMIT_COUNT_ENV, 60, 1, 100000)
     default_window = _bounded_int_env(ADMIN_WRITE_RATE_LIMIT_WINDOW_SEC_ENV, 60, 1, 86400)
@@ -417,6 +472,13 @@ def _write_rate_limit_config(action: Optional[str] = None) -> Dict[str, object]:
     }
 
 
+def _reset_admin_caches() -> None:
+    _admin_key_config.cache_clear()
+    _rate_action_token.cache_clear()
+    _write_rate_limit_config.cache_clear()
+
+
+@lru_cache(maxsize=8)
 def _admin_key_fingerprint(key: str) -> str:
     if not key:
         return "unknown"
@@ -431,20 +493,22 @@ def _enforce_admin_write_rate_limit(identity: str, action: str) -> Dict[str, obj
     action_token = str(cfg["action_token"])
     bucket_key = f"{identity}:{action_token}"
 
-    with ADMIN_WRITE_RATE_LOCK:
-        bucket = ADMIN_WRITE_RATE_BUCKETS[bucket_key]
-        while bucket and now_ts - bucket[0] >= window_sec:
-            bucket.popleft()
+    refill_rate = max_requests / window_sec
 
-        if len(bucket) >= max_requests:
-            retry_after = max(1, int(window_sec - (now_ts - bucket[0])))
+    with ADMIN_WRITE_RATE_LOCK:
+        tokens, last_refill = ADMIN_WRITE_RATE_BUCKETS.get(bucket_key, (float(max_requests), now_ts))
+        tokens = min(float(max_requests), tokens + (now_ts - last_refill) * refill_rate)
+        if tokens < 1.0:
+            ADMIN_WRITE_RATE_BUCKETS[bucket_key] = (tokens, now_ts)
+            retry_after = max(1, math.ceil((1.0 - tokens) / refill_rate))
             raise HTTPException(
                 status_code=429,
                 detail=f"Admin write rate limit exceeded for action={action}. Retry after {retry_after}s",
             )
 
-        bucket.append(now_ts)
-        remaining = max(0, max_requests - len(bucket))
+        tokens -= 1.0
+        ADMIN_WRITE_RATE_BUCKETS[bucket_key] = (tokens, now_ts)
+    remaining = int(tokens)
 
     return {
         "action": action,
@@ -464,8 +528,10 @@ def _authorize_admin(required_scope: str, x_admin_key: Optional[str]) -> Dict[st
 
     read_key = str(cfg["read_key"])
     write_key = str(cfg["write_key"])
-    allowed_read = bool(read_key and x_admin_key == read_key)
-    allowed_write = bool(write_key and x_admin_key == write_key)
+    # Constant-time comparison so response timing does not leak how much of a key matched.
+    provided_key = x_admin_key or ""
+    allowed_read = bool(read_key and hmac.compare_digest(provided_key.encode(), read_key.encode()))
+    allowed_write = bool(write_key and hmac.compare_digest(provided_key.encode(), write_key.encode()))
 
     if required_scope == "read" and (allowed_read or allowed_write):
         scope = "write" if allowed_write else "read"
@@ -532,23 +598,25 @@ def normalize_fetch_meta(keyword: str) -> Dict[str, object]:
 
 def collect_news_history_metrics() -> Dict[str, object]:
     by_stock: List[Dict[str, object]] = []
-    for stock_code, history in NEWS_COUNT_HISTORY.items():
+    # Snapshot the items in one C call so a request thread adding a stock cannot break the loop.
+    for stock_code, history in tuple(NEWS_COUNT_HISTORY.items()):
         if not history:
             continue
-        history_list = list(history)
+        # The builtins walk the deque in C; copying it to a list first only added an allocation per stock.
+        samples = len(history)
         by_stock.append(
             {
                 "stock_code": stock_code,
                 "stock_name": STOCK_CODE_TO_NAME.get(stock_code, stock_code),
-                "samples": len(history_list),
-                "latest_count": int(history_list[-1]),
-                "avg_count": round(sum(history_list) / max(1, len(history_list)), 2),
-                "max_count": int(max(history_list)),
-                "min_count": int(min(history_list)),
+                "samples": samples,
+                "latest_count": int(history[-1]),
+                "avg_count": round(sum(history) / samples, 2),
+                "max_count": int(max(history)),
+                "min_count": int(min(history)),
             }
         )
 
-    by_stock.sort(key=lambda item: (item["latest_count"], item["avg_count"]), reverse=True)
+    by_stock.sort(key=itemgetter("latest_count", "avg_count"), reverse=True)
     return {
         "tracked_stocks": len(by_stock),
         "stocks": by_stock,
@@ -595,17 +663,25 @@ def _hhmm_to_minutes(value: str) -> int:
     return int(hour) * 60 + int(minute)
 
 
+def _policy_window(profile: Dict[str, object]) -> Tuple[int, int, bool, Dict[str, object]]:
+    start = _hhmm_to_minutes(str(profile["start"]))
+    end = _hhmm_to_minutes(str(profile["end"]))
+    return start, end, start > end, profile
+
+
+# Kept apart from MONITORING_POLICY so the /health policy payload stays unchanged
+MONITORING_POLICY_WINDOWS = tuple(_policy_window(profile) for profile in MONITORING_POLICY)
+
+
 def current_monitoring_profile(now: Optional[datetime] = None) -> Dict[str, object]:
     current = now or datetime.now()
     current_minutes = current.hour * 60 + current.minute
 
-    for profile in MONITORING_POLICY:
-        start = _hhmm_to_minutes(profile["start"])
-        end = _hhmm_to_minutes(profile["end"])
-        if start <= end:
-            in_range = start <= current_minutes < end
-        else:
+    for start, end, wraps, profile in MONITORING_POLICY_WINDOWS:
+        if wraps:
             in_range = current_minutes >= start or current_minutes < end
+        else:
+            in_range = start <= current_minutes < end
         if in_range:
             return dict(profile)
 
@@ -649,8 +725,13 @@ def _set_scheduler_state(**kwargs):
             SCHEDULER_STATE[key] = value
 
 
-def _sanitize_adaptive_profiles_unlocked() -> Dict[str, Dict[str, object]]:
+def _sanitize_adaptive_profiles_unlocked() -> Mapping[str, Mapping[str, object]]:
+    global ADAPTIVE_PROFILES_SNAPSHOT
     raw_profiles = SCHEDULER_STATE.get("adaptive_profiles", {})
+    source, snapshot = ADAPTIVE_PROFILES_SNAPSHOT
+    if raw_profiles is source:
+        return snapshot
+
     sanitized: Dict[str, Dict[str, object]] = {}
 
     for policy_name in MONITORING_POLICY_NAMES:
@@ -680,8 +761,11 @@ def _sanitize_adaptive_profiles_unlocked() -> Dict[str, Dict[str, object]]:
             merged["min_bound"], merged["max_bound"] = max_bound, min_bound
         sanitized[policy_name] = merged
 
-    SCHEDULER_STATE["adaptive_profiles"] = {k: dict(v) for k, v in sanitized.items()}
-    return sanitized
+    stored = {k: dict(v) for k, v in sanitized.items()}
+    SCHEDULER_STATE["adaptive_profiles"] = stored
+    snapshot = MappingProxyType({k: MappingProxyType(v) for k, v in sanitized.items()})
+    ADAPTIVE_PROFILES_SNAPSHOT = (stored, snapshot)
+    return snapshot
 
 
 def adaptive_scheduler_profiles() -> Dict[str, Dict[str, object]]:
@@ -934,7 +1018,7 @@ def update_adaptive_profile_config(payload: MonitoringAdaptiveProfileUpdateReque
         raise HTTPException(status_code=400, detail=f"Unknown policy_name: {policy_name}")
 
     with SCHEDULER_LOCK:
-        profiles = _sanitize_adaptive_profiles_unlocked()
+        profiles = dict(_sanitize_adaptive_profiles_unlocked())
         profile = dict(profiles.get(policy_name, {}))
         default_profile = dict(DEFAULT_ADAPTIVE_POLICY_OVERRIDES.get(policy_name, {}))
 
@@ -1182,7 +1266,7 @@ def stop_monitoring_scheduler() -> Dict[str, object]:
     return snapshot
 
 
-def analyze_title_sentiment(title: str) -> Dict[str, object]:
+def analyze_title_sentiment(title: str, rules: Optional[RulesMatcher] = None) -> Dict[str, object]:
     text = title.strip()
     positive_hits = sorted({kw for kw in POSITIVE_KEYWORDS if kw in text})
     negative_hits = sorted({kw for kw in NEGATIVE_KEYWORDS if kw in text})
@@ -1191,7 +1275,7 @@ def analyze_title_sentiment(title: str) -> Dict[str, object]:
     feedback_positive_hits: List[str] = []
     feedback_negative_hits: List[str] = []
     feedback_neutral_hits: List[str] = []
-    for keyword, rule in feedback_store.match_applied_rules(text):
+    for keyword, rule in feedback_store.match_applied_rules(text, rules):
         label = str(rule.get("label", "neutral"))
         if label == "positive":
             feedback_positive_hits.append(keyword)
@@ -1228,14 +1312,15 @@ def enrich_news_with_sentiment(news_list: List[Dict[str, object]]) -> Tuple[List
     enriched: List[Dict[str, object]] = []
     label_counter: Counter = Counter()
 
-    for item in news_list:
-        sentiment = analyze_title_sentiment(str(item.get("title", "")))
-        new_item = dict(item)
-        new_item["sentiment_label"] = sentiment["label"]
-        new_item["sentiment_score"] = sentiment["score"]
-        new_item["sentiment_keywords"] = sentiment["keywords"]
-        enriched.append(new_item)
-        label_counter[sentiment["label"]] += 1
+    with feedback_store.rules_snapshot() as rules:
+        for item in news_list:
+            sentiment = analyze_title_sentiment(str(item.get("title", "")), rules)
+            new_item = dict(item)
+            new_item["sentiment_label"] = sentiment["label"]
+            new_item["sentiment_score"] = sentiment["score"]
+            new_item["sentiment_keywords"] = sentiment["keywords"]
+            enriched.append(new_item)
+            label_counter[sentiment["label"]] += 1
 
     positive = label_counter["positive"]
     negative = label_counter["negative"]
@@ -1292,10 +1377,10 @@ def priority_from_level(level: str) -> str:
 
 def topic_key_from_title(title: str) -> str:
     text = str(title or "").lower()
-    text = re.sub(r"\[[^\]]*\]", " ", text)
-    text = re.sub(r"\([^)]*\)", " ", text)
-    text = re.sub(r"[\"'“”‘’`·…,:;!?/\\|]+", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = TOPIC_BRACKET_RE.sub(" ", text)
+    text = TOPIC_PAREN_RE.sub(" ", text)
+    text = TOPIC_PUNCT_RE.sub(" ", text)
+    text = TOPIC_SPACE_RE.sub(" ", text).strip()
     return text
 
 
@@ -1362,14 +1447,14 @@ def calculate_importance_score(
     impact_negative_hits = set()
     for item in unique_news:
         title = str(item.get("title", ""))
-        for kw, weight in IMPACT_POSITIVE_KEYWORDS.items():
-            if kw in title:
-                impact_score += weight
-                impact_positive_hits.add(kw)
-        for kw, weight in IMPACT_NEGATIVE_KEYWORDS.items():
+        for kw, signed_weight in IMPACT_KEYWORDS.items():
             if kw in title:
-                impact_score += weight
-                impact_negative_hits.add(kw)
+                if signed_weight >= 0:
+                    impact_score += signed_weight
+                    impact_positive_hits.add(kw)
+                else:
+                    impact_score -= signed_weight
+                    impact_negative_hits.add(kw)
 
     impact_score = min(30, impact_score)
     if impact_score > 0:
@@ -2064,11 +2149,15 @@ def get_alerts(
             max_value=20,
         )
 
+        news_by_name = search_crawler.get_news_by_keywords(
+            [stock["name"] for stock in DEFAULT_WATCHLIST],
+            resolved_news_fetch_limit,
+        )
         alerts: List[Dict[str, object]] = []
         for stock in DEFAULT_WATCHLIST:
             stock_code = stock["code"]
             stock_name = stock["name"]
-            news_list = search_crawler.get_news_by_keyword(stock_name, resolved_news_fetch_limit)
+            news_list = news_by_name[stock_name]
             fetch_meta = normalize_fetch_meta(stock_name)
             if not news_list:
                 continue
@@ -2107,11 +2196,13 @@ def get_alerts(
         source_counter = Counter([item.get("fetch_meta", {}).get("source", "unknown") for item in alerts])
         score_avg = round(sum([item["importance_score"] for item in alerts]) / len(alerts), 2) if alerts else 0.0
         generated_at = now_str()
-        persisted_count = alert_store.save_alerts(alerts=alerts, created_at=generated_at)
+        # Queue the insert so the prune below rides the same writer batch, then surface any insert error.
+        persist_future = alert_store.submit_alerts(alerts=alerts, created_at=generated_at)
         prune_result = alert_store.prune_history(
             retention_days=ALERT_HISTORY_RETENTION_DAYS,
             max_rows=ALERT_HISTORY_MAX_ROWS,
         )
+        persisted_count = int(persist_future.result())
 
         return {
             "success": True,
@@ -2127,6 +2218,7 @@ def get_alerts(
                 "data_source": {
                     "network": source_counter.get("network", 0),
                     "cache": source_counter.get("cache", 0),
+                    "warm_cache": source_counter.get("warm_cache", 0),
                     "stale_cache": source_counter.get("stale_cache", 0),
                     "unknown": source_counter.get("unknown", 0),
                 },
@@ -2145,6 +2237,7 @@ def get_alert_history(
     delivery_level: Optional[str] = Query(default=None, pattern="^(push_immediate|in_app|daily_digest)$"),
     min_score: int = Query(default=0, ge=0, le=100),
     limit: int = Query(default=100, ge=1, le=1000),
+    include_payload: bool = Query(default=True),
 ):
     try:
         rows = alert_store.list_alert_history(
@@ -2152,6 +2245,7 @@ def get_alert_history(
             stock_code=stock_code,
             delivery_level=delivery_level,
             min_score=min_score,
+            include_payload=include_payload,
         )
         level_counter = Counter([str(row.get("delivery_level", "daily_digest")) for row in rows])
         score_avg = round(sum([int(row.get("importance_score", 0)) for row in rows]) / len(rows), 2) if rows else 0.0
@@ -2191,6 +2285,7 @@ def export_alert_history_csv(
             stock_code=stock_code,
             delivery_level=delivery_level,
             min_score=min_score,
+            include_payload=False,
         )
 
         output = io.StringIO()
@@ -2263,9 +2358,12 @@ def get_multiple_news(
         summaries: Dict[str, Dict[str, object]] = {}
         alert_decisions: Dict[str, Dict[str, object]] = {}
 
+        keywords = {stock_code: stock_code_to_keyword(stock_code) for stock_code in stock_codes}
+        news_by_keyword = search_crawler.get_news_by_keywords(list(keywords.values()), limit_each)
+
         for stock_code in stock_codes:
-            keyword = stock_code_to_keyword(stock_code)
-            news_list = search_crawler.get_news_by_keyword(keyword, limit_each)
+            keyword = keywords[stock_code]
+            news_list = news_by_keyword[keyword]
             fetch_meta = normalize_fetch_meta(keyword)
             enriched, sentiment_summary = enrich_news_with_sentiment(news_list)
             results[stock_code] = enriched
@@ -2823,14 +2921,14 @@ def get_admin_audit_logs(
     admin: Dict[str, str] = Depends(require_admin_read),
 ):
     try:
-        logs = feedback_store.list_admin_audit_logs(limit=limit, action=action)
-        return {
-            "success": True,
-            "count": len(logs),
-            "logs": logs,
-            "auth_mode": admin.get("auth_mode", "disabled"),
-            "generated_at": now_str(),
-        }
+        # The logs array arrives as JSON text from SQLite and is spliced into the body without a decode/encode round trip.
+        count, logs_json = feedback_store.list_admin_audit_logs_json(limit=limit, action=action)
+        body = (
+            f'{{"success":true,"count":{count},"logs":{logs_json},'
+            f'"auth_mode":{json.dumps(admin.get("auth_mode", "disabled"), ensure_ascii=False)},'
+            f'"generated_at":{json.dumps(now_str())}}}'
+        )
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"감사 로그 조회 중 오류: {e}")
 
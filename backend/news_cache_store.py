@@ -0,0 +1,83 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+PRUNE_EVERY_WRITES = 200
+
+
+class NewsCacheStore:
+    """
+    SQLite-backed search result cache shared by every process that opens the same file.
+    - One row per crawler cache key, overwritten on each fetch
+    - Rows older than max_age_sec are pruned periodically on write
+    """
+
+    def __init__(self, db_path: str, max_age_sec: float):
+        self.db_path = db_path
+        self.max_age_sec = max_age_sec
+        self._tls = threading.local()
+        self._writes = 0
+        self._writes_lock = threading.Lock()
+        self._init_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._tls, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA busy_timeout=5000")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._tls.conn = conn
+        return conn
+
+    def _init_db(self):
+        self._connect().executescript(
+            """
+            PRAGMA journal_mode=WAL;
+
+            CREATE TABLE IF NOT EXISTS news_cache (
+                cache_key TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                payload_json TEXT NOT NULL
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def get(self, cache_key: str) -> Optional[Tuple[float, List[Dict[str, str]]]]:
+        row = self._connect().execute(
+            "SELECT fetched_at, payload_json FROM news_cache WHERE cache_key = ?",
+            (cache_key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        fetched_at, payload_json = row
+        try:
+            news = json.loads(payload_json)
+        except ValueError:
+            return None
+        if not isinstance(news, list):
+            return None
+        return float(fetched_at), news
+
+    def set(self, cache_key: str, fetched_at: float, news: List[Dict[str, str]]):
+        conn = self._connect()
+        conn.execute(
+            """
+            INSERT INTO news_cache (cache_key, fetched_at, payload_json)
+            VALUES (?, ?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                fetched_at = excluded.fetched_at,
+                payload_json = excluded.payload_json
+            WHERE excluded.fetched_at >= news_cache.fetched_at
+            """,
+            (cache_key, fetched_at, json.dumps([dict(item) for item in news], ensure_ascii=False)),
+        )
+
+        with self._writes_lock:
+            self._writes += 1
+            should_prune = self._writes % PRUNE_EVERY_WRITES == 0
+        if should_prune:
+            conn.execute("DELETE FROM news_cache WHERE fetched_at < ?", (time.time() - self.max_age_sec,))
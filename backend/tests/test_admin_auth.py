@@ -28,6 +28,7 @@ class AdminAuthScopeTests(unittest.TestCase):
         self._env_backup = {key: os.environ.get(key) for key in self.ENV_KEYS}
         for key in self.ENV_KEYS:
             os.environ.pop(key, None)
+        main._reset_admin_caches()
         with main.ADMIN_WRITE_RATE_LOCK:
             main.ADMIN_WRITE_RATE_BUCKETS.clear()
 
@@ -38,6 +39,7 @@ class AdminAuthScopeTests(unittest.TestCase):
                 os.environ.pop(key, None)
             else:
                 os.environ[key] = old
+        main._reset_admin_caches()
         with main.ADMIN_WRITE_RATE_LOCK:
             main.ADMIN_WRITE_RATE_BUCKETS.clear()
 
@@ -78,6 +80,27 @@ class AdminAuthScopeTests(unittest.TestCase):
             main.enforce_admin_write_rate_limit(auth, "upsert_user_tier")
         self.assertEqual(exc.exception.status_code, 429)
 
+    def test_write_rate_limit_refills_over_the_window(self):
+        os.environ["SIGNALWATCH_ADMIN_WRITE_KEY"] = "write-key"
+        os.environ["ADMIN_WRITE_RATE_LIMIT_COUNT"] = "2"
+        os.environ["ADMIN_WRITE_RATE_LIMIT_WINDOW_SEC"] = "60"
+
+        auth = main.require_admin_write("write-key")
+        main.enforce_admin_write_rate_limit(auth, "upsert_user_tier")
+        main.enforce_admin_write_rate_limit(auth, "upsert_user_tier")
+
+        # Half the window refills half the bucket: one more request goes through.
+        bucket_key = f"{auth['admin_identity']}:UPSERT_USER_TIER"
+        with main.ADMIN_WRITE_RATE_LOCK:
+            tokens, last_refill = main.ADMIN_WRITE_RATE_BUCKETS[bucket_key]
+            main.ADMIN_WRITE_RATE_BUCKETS[bucket_key] = (tokens, last_refill - 30)
+        refilled = main.enforce_admin_write_rate_limit(auth, "upsert_user_tier")
+        self.assertEqual(refilled.get("remaining"), 0)
+
+        with self.assertRaises(HTTPException) as exc:
+            main.enforce_admin_write_rate_limit(auth, "upsert_user_tier")
+        self.assertEqual(exc.exception.status_code, 429)
+
     def test_action_specific_rate_limit_override(self):
         os.environ["SIGNALWATCH_ADMIN_WRITE_KEY"] = "write-key"
         os.environ["ADMIN_WRITE_RATE_LIMIT_COUNT"] = "5"
@@ -1,13 +1,17 @@
+import gc
+import os
 import tempfile
 import unittest
 from pathlib import Path
+import sqlite3
 import sys
+import threading
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
     sys.path.insert(0, str(BACKEND_DIR))
 
-from alert_store import AlertStore  # noqa: E402
+from alert_store import AlertStore, loads_payloads  # noqa: E402
 
 
 class AlertStoreTests(unittest.TestCase):
@@ -17,6 +21,7 @@ class AlertStoreTests(unittest.TestCase):
         self.store = AlertStore(db_path=self.db_path)
 
     def tearDown(self):
+        self.store.close()
         del self.store
         self._tmp_dir.cleanup()
 
@@ -57,6 +62,11 @@ class AlertStoreTests(unittest.TestCase):
         high_only = self.store.list_alert_history(limit=10, delivery_level="push_immediate", min_score=70)
         self.assertEqual(len(high_only), 1)
         self.assertEqual(high_only[0]["stock_code"], "005930")
+        self.assertEqual(high_only[0]["payload"].get("summary"), alerts[0]["summary"])
+
+        without_payload = self.store.list_alert_history(limit=10, include_payload=False)
+        self.assertEqual(len(without_payload), 2)
+        self.assertTrue(all(row["payload"] is None for row in without_payload))
 
     def test_prune_history_removes_old_rows(self):
         old_alert = {
@@ -90,6 +100,41 @@ class AlertStoreTests(unittest.TestCase):
         self.assertEqual(len(rows), 1)
         self.assertEqual(rows[0]["stock_code"], "000660")
 
+    def test_prune_history_trims_overflow_oldest_first(self):
+        alerts = [{"stock_code": f"{idx:06d}", "importance_score": idx} for idx in range(150)]
+        self.store.save_alerts(alerts, created_at="2099-01-01 00:00:00")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM alert_history WHERE id BETWEEN 10 AND 19")
+
+        result = self.store.prune_history(retention_days=30, max_rows=100)
+        self.assertEqual(result["overflow_deleted"], 40)
+        self.assertEqual(result["remaining"], 100)
+
+        rows = self.store.list_alert_history(limit=200)
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(rows[-1]["stock_code"], "000050")
+
+    def test_queued_writes_are_applied_in_order(self):
+        queued = self.store.submit_alerts([{"stock_code": "005930"}], created_at="2020-01-01 00:00:00")
+
+        result = self.store.prune_history(retention_days=30, max_rows=20000)
+        self.assertEqual(queued.result(), 1)
+        self.assertEqual(result["old_deleted"], 1)
+        self.assertEqual(self.store.list_alert_history(limit=10), [])
+
+    def test_failed_write_job_does_not_roll_back_batch(self):
+        def _broken(conn):
+            conn.execute("INSERT INTO alert_history (created_at) VALUES (1)")
+
+        self.store.submit_alerts([{"stock_code": "005930"}])
+        broken = self.store._submit_write(_broken)
+        self.store.save_alerts([{"stock_code": "000660"}])
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            broken.result()
+        rows = self.store.list_alert_history(limit=10)
+        self.assertEqual([row["stock_code"] for row in rows], ["000660", "005930"])
+
     def test_preview_prune_reports_expected_counts(self):
         old_alert = {
             "stock_code": "005930",
@@ -121,6 +166,158 @@ class AlertStoreTests(unittest.TestCase):
         self.assertEqual(preview["would_delete_overflow"], 0)
         self.assertGreaterEqual(preview["would_delete_total"], 1)
 
+    def test_metrics_split_total_and_recent_distributions(self):
+        old_alert = {
+            "stock_code": "005930",
+            "importance_score": 40,
+            "delivery_level": "daily_digest",
+            "priority": "low",
+        }
+        new_alert = {
+            "stock_code": "000660",
+            "importance_score": 80,
+            "delivery_level": "push_immediate",
+            "priority": "high",
+        }
+
+        self.store.save_alerts([old_alert], created_at="2020-01-01 00:00:00")
+        self.store.save_alerts([new_alert, new_alert], created_at="2099-01-01 00:00:00")
+
+        metrics = self.store.get_metrics(since_hours=24)
+        self.assertEqual(metrics["total_alert_history_rows"], 3)
+        self.assertEqual(metrics["recent_alert_history_rows"], 2)
+        self.assertEqual(metrics["recent_avg_importance_score"], 80.0)
+        self.assertEqual(metrics["delivery_level_distribution"], {"daily_digest": 1, "push_immediate": 2})
+        self.assertEqual(metrics["recent_delivery_level_distribution"], {"push_immediate": 2})
+        self.assertEqual(metrics["priority_distribution"], {"high": 2, "low": 1})
+        self.assertEqual(metrics["recent_priority_distribution"], {"high": 2})
+        self.assertEqual(metrics["first_alert_at"], "2020-01-01 00:00:00")
+        self.assertEqual(metrics["last_alert_at"], "2099-01-01 00:00:00")
+
+    def test_metric_counters_follow_inserts_and_deletes(self):
+        self.store.save_alerts([{"delivery_level": "in_app", "priority": "medium"}], created_at="2020-01-01 00:00:00")
+        self.store.save_alerts([{"delivery_level": "in_app", "priority": "high"}], created_at="2099-01-01 00:00:00")
+        self.store.prune_history(retention_days=30, max_rows=20000)
+
+        metrics = self.store.get_metrics(since_hours=24)
+        self.assertEqual(metrics["total_alert_history_rows"], 1)
+        self.assertEqual(metrics["delivery_level_distribution"], {"in_app": 1})
+        self.assertEqual(metrics["priority_distribution"], {"high": 1})
+        self.assertEqual(self.store.preview_prune()["total_rows"], 1)
+
+        reopened = AlertStore(db_path=self.db_path)
+        self.assertEqual(reopened.get_metrics(since_hours=24)["priority_distribution"], {"high": 1})
+        reopened.close()
+
+    def test_list_reads_legacy_text_and_malformed_payloads(self):
+        self.store.save_alerts([{"stock_code": "005930", "summary": "blob"}], created_at="2026-02-13 14:00:00")
+        with sqlite3.connect(self.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO alert_history (
+                    created_at, stock_code, stock_name, importance_score, delivery_level, priority,
+                    article_count, sentiment, summary, payload_json
+                )
+                VALUES (1770991201000000, ?, '', 0, 'in_app', 'low', 0, 'neutral', '', ?)
+                """,
+                [("000660", '{"summary":"legacy"}'), ("035420", "not-json")],
+            )
+
+        rows = {row["stock_code"]: row["payload"] for row in self.store.list_alert_history(limit=10)}
+        self.assertEqual(rows["005930"].get("summary"), "blob")
+        self.assertEqual(rows["000660"].get("summary"), "legacy")
+        self.assertEqual(rows["035420"], {"raw": "not-json"})
+
+    def test_batch_payload_decode_falls_back_per_row(self):
+        raws = [b'{"idx":%d}' % idx for idx in range(20)]
+        self.assertEqual(loads_payloads(raws), [{"idx": idx} for idx in range(20)])
+
+        mixed = list(raws)
+        mixed[3] = '{"idx":"legacy"}'
+        mixed[5] = None
+        mixed[7] = b"not-json"
+        decoded = loads_payloads(mixed)
+        self.assertEqual(len(decoded), 20)
+        self.assertEqual(decoded[3], {"idx": "legacy"})
+        self.assertEqual(decoded[5], {})
+        self.assertEqual(decoded[7], {"raw": "not-json"})
+        self.assertEqual(decoded[19], {"idx": 19})
+
+    def test_legacy_text_created_at_is_migrated_to_epoch(self):
+        legacy_path = str(Path(self._tmp_dir.name) / "legacy_alerts.db")
+        with sqlite3.connect(legacy_path) as conn:
+            conn.executescript(
+                """
+                CREATE TABLE alert_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    created_at TEXT NOT NULL,
+                    stock_code TEXT NOT NULL,
+                    stock_name TEXT NOT NULL,
+                    importance_score INTEGER NOT NULL,
+                    delivery_level TEXT NOT NULL,
+                    priority TEXT NOT NULL,
+                    article_count INTEGER NOT NULL,
+                    sentiment TEXT NOT NULL,
+                    summary TEXT NOT NULL,
+                    payload_json TEXT NOT NULL
+                );
+                CREATE INDEX idx_alert_history_created ON alert_history(created_at DESC);
+                INSERT INTO alert_history (
+                    created_at, stock_code, stock_name, importance_score, delivery_level, priority,
+                    article_count, sentiment, summary, payload_json
+                )
+                VALUES
+                    ('2020-01-01 00:00:00', '005930', '', 50, 'in_app', 'low', 1, 'neutral', '', '{}'),
+                    ('2099-01-01 00:00:00', '000660', '', 70, 'in_app', 'high', 2, 'positive', '', '{}');
+                """
+            )
+
+        store = AlertStore(db_path=legacy_path)
+        rows = store.list_alert_history(limit=10)
+        self.assertEqual([row["created_at"] for row in rows], ["2099-01-01 00:00:00", "2020-01-01 00:00:00"])
+
+        result = store.prune_history(retention_days=30, max_rows=20000)
+        self.assertEqual(result["old_deleted"], 1)
+        self.assertEqual(result["remaining"], 1)
+
+        inserted = store.save_alerts([{"stock_code": "035420"}])
+        self.assertEqual(inserted, 1)
+        self.assertEqual(store.list_alert_history(limit=1)[0]["id"], 3)
+        store.close()
+
+    @unittest.skipUnless(os.path.isdir("/proc/self/fd"), "needs /proc/self/fd")
+    def test_closed_stores_release_their_connections(self):
+        gc.collect()
+        baseline = len(os.listdir("/proc/self/fd"))
+        for idx in range(20):
+            store = AlertStore(db_path=str(Path(self._tmp_dir.name) / f"leak_{idx}.db"))
+            store.save_alerts([{"stock_code": "005930"}])
+            store.list_alert_history(limit=1)
+            store.close()
+            del store
+        gc.collect()
+        self.assertEqual(len(os.listdir("/proc/self/fd")), baseline)
+
+    def test_close_closes_writer_and_reader_connections(self):
+        store = AlertStore(db_path=str(Path(self._tmp_dir.name) / "close_test.db"))
+        store.save_alerts([{"stock_code": "005930"}])
+        readers = []
+
+        def _read():
+            store.list_alert_history(limit=1)
+            readers.append(store._connect())
+
+        worker = threading.Thread(target=_read)
+        worker.start()
+        worker.join()
+        store.list_alert_history(limit=1)
+        readers.append(store._connect())
+
+        store.close()
+        for conn in [store._write_conn, *readers]:
+            with self.assertRaises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
     def test_monitoring_run_history_persistence_and_metrics(self):
         run1 = {
             "status": "success",
@@ -0,0 +1,363 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from crawler import NaverNewsSearchCrawler, NaverStockNewsCrawler, _resolve_parser_backend  # noqa: E402
+
+
+STOCK_NEWS_HTML = """
+<html><body>
+<table class="type5">
+  <tr><th>제목</th><th>정보제공</th><th>날짜</th></tr>
+  <tr>
+    <td class="title"><a href="/item/news_read.nhn?article_id=1">삼성전자 수주 계약</a></td>
+    <td class="info">테스트언론</td>
+    <td class="date">2026.02.13 10:00</td>
+  </tr>
+  <tr>
+    <td class="title"><a href="https://example.com/news-2">삼성전자 실적 개선</a></td>
+    <td class="info">테스트언론2</td>
+    <td class="date">2026.02.13 10:03</td>
+  </tr>
+  <tr><td class="title">링크 없음</td></tr>
+</table>
+</body></html>
+"""
+
+SEARCH_MODERN_HTML = """
+<html><body>
+<div class="group_news">
+  <div class="news_item">
+    <div data-sds-comp="Profile">
+      <span class="sds-comps-profile-info-title-text">테스트언론</span>
+      <div class="sds-comps-profile-info-subtexts">
+        <span class="sds-comps-profile-info-subtext">네이버뉴스</span>
+        <span class="sds-comps-profile-info-subtext">3시간 전</span>
+      </div>
+    </div>
+    <a data-heatmap-target=".tit" href="https://www.example.com/news-1"><mark>삼성전자</mark>  대형 수주</a>
+  </div>
+  <div class="news_item">
+    <div data-sds-comp="Profile">
+      <span class="sds-comps-profile-info-title-text">다른언론</span>
+      <div class="sds-comps-profile-info-subtexts">
+        <span class="sds-comps-profile-info-subtext">1일 전</span>
+      </div>
+    </div>
+    <a data-heatmap-target=".tit" href="https://news.example.org/news-2" title="삼성전자 실적 개선">요약</a>
+    <a data-heatmap-target=".tit" href="https://news.example.org/news-2">중복 링크</a>
+    <a data-heatmap-target=".tit" href="javascript:void(0)">스크립트</a>
+  </div>
+</div>
+</body></html>
+"""
+
+SEARCH_LEGACY_HTML = """
+<html><body>
+<ul class="list_news">
+  <li><div class="news_area">
+    <div class="info_group"><a class="info press" href="#">레거시언론</a></div>
+    <a class="news_tit" href="https://legacy.example.com/a" title="레거시 기사">레거시 기사</a>
+  </div></li>
+</ul>
+</body></html>
+"""
+
+SEARCH_SHARED_CONTAINER_HTML = """
+<html><body>
+<div class="group_news">
+  <a data-heatmap-target=".tit" href="https://a.example.com/1">첫 기사</a>
+  <div data-sds-comp="Profile"><span class="sds-comps-profile-info-title-text">첫언론</span></div>
+  <p><span>구분</span><span>구분</span><span>구분</span></p>
+  <div data-sds-comp="Profile"><span class="sds-comps-profile-info-title-text">둘째언론</span></div>
+  <a data-heatmap-target=".tit" href="https://b.example.com/2">둘째 기사</a>
+</div>
+</body></html>
+"""
+
+
+def _strip_volatile(items):
+    return [{k: v for k, v in item.items() if k not in ("id", "crawled_at")} for item in items]
+
+
+class StockNewsCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        self.crawler = NaverStockNewsCrawler()
+
+    def test_parse_stock_html_rows(self):
+        news = self.crawler._parse_stock_html(STOCK_NEWS_HTML, "005930", 10)
+        self.assertEqual([item["title"] for item in news], ["삼성전자 수주 계약", "삼성전자 실적 개선"])
+        self.assertEqual(news[0]["link"], "https://finance.naver.com/item/news_read.nhn?article_id=1")
+        self.assertEqual(news[0]["source"], "테스트언론")
+        self.assertEqual(news[1]["published_date"], "2026.02.13 10:03")
+        self.assertEqual(news[1]["stock_code"], "005930")
+
+        self.assertEqual(len(self.crawler._parse_stock_html(STOCK_NEWS_HTML, "005930", 1)), 1)
+        self.assertIsNone(self.crawler._parse_stock_html("<html><body></body></html>", "005930", 10))
+
+    def test_multiple_stocks_fetch_concurrently_in_order(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def _fake_get_stock_news(stock_code, max_count=10):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return [{"stock_code": stock_code, "count": str(max_count)}]
+
+        self.crawler.get_stock_news = _fake_get_stock_news
+        codes = ["005930", "000660", "035420", "051910"]
+        results = self.crawler.get_multiple_stocks_news(codes, max_each=3)
+
+        self.assertEqual(list(results.keys()), codes)
+        self.assertEqual(results["000660"], [{"stock_code": "000660", "count": "3"}])
+        self.assertGreater(peak, 1)
+        self.assertEqual(self.crawler.get_multiple_stocks_news([]), {})
+
+    def test_parse_stock_html_backends_agree(self):
+        lxml_news = self.crawler._parse_stock_html(STOCK_NEWS_HTML, "005930", 10)
+        self.crawler.parser_backend = "bs4"
+        bs4_news = self.crawler._parse_stock_html(STOCK_NEWS_HTML, "005930", 10)
+
+        self.assertEqual(_strip_volatile(lxml_news), _strip_volatile(bs4_news))
+
+
+class SearchNewsCrawlerTests(unittest.TestCase):
+    def setUp(self):
+        self.crawler = NaverNewsSearchCrawler()
+
+    def _parse(self, html, backend, max_count=10):
+        self.crawler.parser_backend = backend
+        items = self.crawler._parse_search_html(html, "삼성전자", max_count)
+        return [(item["title"], item["link"], item["source"], item["published_date"]) for item in items]
+
+    def test_parse_modern_layout(self):
+        expected = [
+            ("삼성전자 대형 수주", "https://www.example.com/news-1", "테스트언론", "3시간 전"),
+            ("삼성전자 실적 개선", "https://news.example.org/news-2", "다른언론", "1일 전"),
+        ]
+        self.assertEqual(self._parse(SEARCH_MODERN_HTML, "lxml"), expected)
+        self.assertEqual(self._parse(SEARCH_MODERN_HTML, "bs4"), expected)
+        self.assertEqual(self._parse(SEARCH_MODERN_HTML, "lxml", max_count=1), expected[:1])
+
+    def test_parse_legacy_layout(self):
+        expected = [("레거시 기사", "https://legacy.example.com/a", "레거시언론", "시간 정보 없음")]
+        self.assertEqual(self._parse(SEARCH_LEGACY_HTML, "lxml"), expected)
+        self.assertEqual(self._parse(SEARCH_LEGACY_HTML, "bs4"), expected)
+
+    def test_parse_nearest_profile_in_shared_container(self):
+        expected = [
+            ("첫 기사", "https://a.example.com/1", "첫언론", "시간 정보 없음"),
+            ("둘째 기사", "https://b.example.com/2", "둘째언론", "시간 정보 없음"),
+        ]
+        self.assertEqual(self._parse(SEARCH_SHARED_CONTAINER_HTML, "lxml"), expected)
+        self.assertEqual(self._parse(SEARCH_SHARED_CONTAINER_HTML, "bs4"), expected)
+
+    def test_title_links_are_consumed_lazily(self):
+        self.crawler.parser_backend = "lxml"
+        seen = []
+        original = self.crawler._iter_title_links_lxml
+
+        def _tracking_iter(tree):
+            for link in original(tree):
+                seen.append(link.get("href"))
+                yield link
+
+        self.crawler._iter_title_links_lxml = _tracking_iter
+        items = self.crawler._parse_search_html(SEARCH_MODERN_HTML, "삼성전자", 1)
+
+        self.assertEqual(len(items), 1)
+        self.assertEqual(seen, ["https://www.example.com/news-1"])
+
+    def test_process_pool_parse_matches_inline_parse(self):
+        inline = self.crawler._parse_search_response(SEARCH_MODERN_HTML, "삼성전자", 10)
+
+        self.crawler.parse_processes = 1
+        self.crawler.parse_process_min_bytes = 0
+        try:
+            pooled = self.crawler._parse_search_response(SEARCH_MODERN_HTML, "삼성전자", 10)
+        finally:
+            self.crawler._parse_pool.shutdown()
+
+        self.assertEqual(_strip_volatile(pooled), _strip_volatile(inline))
+
+    def test_source_falls_back_to_article_host(self):
+        html = """
+        <html><body><div class="group_news">
+          <a data-heatmap-target=".tit" href="https://WWW.Example.co.kr:8443/a">호스트 기사</a>
+          <a data-heatmap-target=".tit" href="/relative">상대 링크</a>
+        </div></body></html>
+        """
+        expected = [("호스트 기사", "https://WWW.Example.co.kr:8443/a", "example.co.kr", "시간 정보 없음")]
+        self.assertEqual(self._parse(html, "lxml"), expected)
+        self.assertEqual(self._parse(html, "bs4"), expected)
+
+    def test_keyword_batch_serves_cache_inline_and_fetches_misses_concurrently(self):
+        self.crawler._set_cache("캐시", 5, [{"title": "cached"}])
+        fetched = []
+        lock = threading.Lock()
+
+        def _fake_request(keyword):
+            with lock:
+                fetched.append(keyword)
+            return None
+
+        self.crawler._request_search = _fake_request
+        results = self.crawler.get_news_by_keywords(["캐시", "미스1", "미스2", "캐시"], 5)
+
+        self.assertEqual(list(results.keys()), ["캐시", "미스1", "미스2"])
+        self.assertEqual(results["캐시"], [{"title": "cached"}])
+        self.assertEqual(results["미스1"], [])
+        self.assertEqual(sorted(fetched), ["미스1", "미스2"])
+
+    def test_throttle_spaces_concurrent_requests(self):
+        self.crawler.min_request_interval_sec = 0.05
+        stamps = []
+
+        def _worker():
+            self.crawler._throttle()
+            stamps.append(time.time())
+
+        threads = [threading.Thread(target=_worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stamps.sort()
+        self.assertGreaterEqual(stamps[2] - stamps[0], 0.09)
+
+    def test_cache_is_bounded_and_keeps_stale_entries_for_fallback(self):
+        self.crawler.cache_max_entries = 2
+        self.crawler._set_cache("a", 5, [{"title": "a"}])
+        self.crawler._set_cache("b", 5, [{"title": "b"}])
+        self.crawler._set_cache("a", 5, [{"title": "a2"}])
+        self.crawler._set_cache("c", 5, [{"title": "c"}])
+
+        self.assertIsNone(self.crawler._get_stale_cached_news("b", 5))
+        self.assertEqual(self.crawler._get_cached_news("a", 5)[0], [{"title": "a2"}])
+
+        self.crawler.cache_ttl_sec = 0
+        time.sleep(0.01)
+        self.assertIsNone(self.crawler._get_cached_news("c", 5))
+        self.assertEqual(self.crawler._get_stale_cached_news("c", 5)[0], [{"title": "c"}])
+
+        metrics = self.crawler.get_runtime_metrics()
+        self.assertEqual(metrics["cache_entries"], 2)
+        self.assertEqual(metrics["valid_cache_entries"], 0)
+        self.assertEqual(metrics["stale_cache_entries"], 2)
+
+    def test_warm_cache_hit_returns_immediately_and_refreshes_in_background(self):
+        self.crawler.cache_ttl_sec = 0
+        self.crawler.stale_ttl_sec = 60
+        self.crawler._set_cache("삼성전자", 5, [{"title": "old"}])
+        time.sleep(0.01)
+
+        refreshed = threading.Event()
+
+        def _fake_fetch(keyword, max_count):
+            self.crawler._set_cache(keyword, max_count, [{"title": "new"}])
+            refreshed.set()
+            return [{"title": "new"}]
+
+        self.crawler._fetch_news = _fake_fetch
+        self.assertEqual(self.crawler.get_news_by_keyword("삼성전자", 5), [{"title": "old"}])
+        self.assertEqual(self.crawler.get_last_result_meta("삼성전자")["source"], "warm_cache")
+        self.assertTrue(refreshed.wait(2))
+        stats = self.crawler.get_runtime_metrics()["stats"]
+        self.assertEqual(stats["warm_cache_hits"], 1)
+        self.assertEqual(stats["stale_cache_hits"], 0)
+
+        self.crawler.cache_ttl_sec = 60
+        self.assertEqual(self.crawler._get_cached_news("삼성전자", 5)[0], [{"title": "new"}])
+        self.assertEqual(self.crawler.get_runtime_metrics()["stats"]["background_refreshes"], 1)
+
+    def test_cache_admission_waits_for_repeat_fetch(self):
+        self.crawler.cache_admit_after = 2
+        self.crawler._set_cache("희귀", 5, [{"title": "first"}])
+        self.assertIsNone(self.crawler._get_stale_cached_news("희귀", 5))
+        self.crawler._set_cache("희귀", 5, [{"title": "second"}])
+        self.assertEqual(self.crawler._get_cached_news("희귀", 5)[0], [{"title": "second"}])
+
+    def test_cache_hits_share_read_only_snapshots(self):
+        self.crawler._set_cache("삼성전자", 5, [{"title": "cached"}])
+        first = self.crawler.get_news_by_keyword("삼성전자", 5)
+        second = self.crawler.get_news_by_keyword("삼성전자", 5)
+
+        self.assertIs(first[0], second[0])
+        with self.assertRaises(TypeError):
+            first[0]["title"] = "changed"
+
+        copied = self.crawler.get_news_by_keyword("삼성전자", 5, copy=True)
+        copied[0]["title"] = "changed"
+        self.assertEqual(self.crawler.get_news_by_keyword("삼성전자", 5)[0]["title"], "cached")
+
+    def test_cache_key_ignores_case_width_and_spacing(self):
+        self.crawler._set_cache(" Samsung   Electronics ", 5, [{"title": "cached"}])
+        self.assertIsNotNone(self.crawler._get_cached_news("samsung electronics", 5))
+        self.assertIsNotNone(self.crawler._get_cached_news("ＳＡＭＳＵＮＧ Electronics", 5))
+        self.assertIsNone(self.crawler._get_cached_news("samsung electronics", 10))
+
+    def test_concurrent_misses_share_one_fetch(self):
+        release = threading.Event()
+        calls = []
+
+        def _slow_fetch(keyword, max_count):
+            calls.append(keyword)
+            release.wait(2)
+            return [{"title": "fetched"}]
+
+        self.crawler._fetch_news = _slow_fetch
+        results = []
+        threads = [
+            threading.Thread(target=lambda kw=kw: results.append(self.crawler.get_news_by_keyword(kw, 5)))
+            for kw in ("삼성전자", " 삼성전자", "삼성전자 ")
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [[{"title": "fetched"}]] * 3)
+        self.assertEqual(self.crawler.get_runtime_metrics()["stats"]["coalesced_fetches"], 2)
+
+    def test_shared_cache_file_serves_other_crawler_instances(self):
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp_dir:
+            os.environ["NEWS_CACHE_DB_PATH"] = os.path.join(tmp_dir, "news_cache.db")
+            try:
+                writer = NaverNewsSearchCrawler()
+                reader = NaverNewsSearchCrawler()
+            finally:
+                os.environ.pop("NEWS_CACHE_DB_PATH", None)
+
+            writer._set_cache("삼성전자", 5, [{"title": "shared"}])
+            cached = reader._get_cached_news("삼성전자", 5)
+            self.assertIsNotNone(cached)
+            self.assertEqual(cached[0], [{"title": "shared"}])
+            self.assertIsNone(reader._get_cached_news("SK하이닉스", 5))
+
+    def test_unknown_parser_backend_falls_back_to_lxml(self):
+        self.assertEqual(_resolve_parser_backend(" BS4 "), "bs4")
+        self.assertEqual(_resolve_parser_backend("selectolax"), "lxml")
+        self.assertEqual(_resolve_parser_backend(""), "lxml")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,299 @@
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from feedback_store import FeedbackStore, hash_user_id  # noqa: E402
+
+
+class FeedbackStoreTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp_dir = tempfile.TemporaryDirectory(ignore_cleanup_errors=True)
+        self.store = FeedbackStore(db_path=str(Path(self._tmp_dir.name) / "feedback_store.db"))
+
+    def tearDown(self):
+        self._tmp_dir.cleanup()
+
+    def _submit(self, user_id: str, article_link: str, **overrides):
+        payload = {
+            "user_id": user_id,
+            "stock_code": "005930",
+            "article_link": article_link,
+            "article_title": "Samsung memory chip outlook",
+            "article_source": "example.com",
+            "ai_label": "positive",
+            "user_label": "negative",
+            "user_confidence": 4,
+        }
+        payload.update(overrides)
+        return self.store.submit_feedback(**payload)
+
+    def test_resubmission_updates_the_existing_vote(self):
+        created = self._submit("tester-r", "https://example.com/r-0")
+        updated = self._submit("tester-r", "https://example.com/r-0", user_label="positive", user_confidence=2)
+
+        self.assertEqual(created["vote_action"], "created")
+        self.assertEqual(updated["vote_action"], "updated")
+        self.assertEqual(updated["feedback_id"], created["feedback_id"])
+        self.assertEqual(updated["weighted_score"], 2.0)
+        summary = updated["article_summary"]
+        self.assertEqual(summary["total_votes"], 1)
+        self.assertEqual(summary["consensus_label"], "positive")
+
+        retitled = self._submit("tester-r", "https://example.com/r-0", article_title="Samsung foundry outlook")
+        rows = self.store._connect().execute(
+            "SELECT keyword, user_label FROM keyword_votes WHERE feedback_id = ? ORDER BY keyword",
+            (retitled["feedback_id"],),
+        ).fetchall()
+        self.assertEqual(
+            [tuple(row) for row in rows],
+            [("foundry", "negative"), ("outlook", "negative"), ("samsung", "negative")],
+        )
+
+    def test_trust_profile_reweights_feedback_and_keyword_votes(self):
+        for idx in range(3):
+            self._submit("tester-a", f"https://example.com/a-{idx}")
+        self._submit("tester-b", "https://example.com/a-0")
+
+        profile = self.store.upsert_user_trust_profile("tester-a", trust_weight=2.5)
+        self.assertEqual(profile["updated_feedback_count"], 3)
+
+        conn = self.store._connect()
+        user_hash = hash_user_id("tester-a")
+        scores = {
+            row["weighted_score"]
+            for row in conn.execute("SELECT weighted_score FROM feedback_events WHERE user_id_hash = ?", (user_hash,))
+        }
+        self.assertEqual(scores, {10.0})
+        weights = {
+            row["weight"]
+            for row in conn.execute(
+                """
+                SELECT kv.weight
+                FROM keyword_votes kv JOIN feedback_events fe ON fe.id = kv.feedback_id
+                WHERE fe.user_id_hash = ?
+                """,
+                (user_hash,),
+            )
+        }
+        self.assertEqual(weights, {10.0})
+
+        summary = self.store.get_article_summary("https://example.com/a-0")
+        self.assertEqual(summary["total_weighted_votes"], 14.0)
+
+        cleared = self.store.clear_user_trust_profile("tester-a")
+        self.assertEqual(cleared["trust_weight"], 1.0)
+        self.assertEqual(cleared["updated_feedback_count"], 3)
+        self.assertEqual(self.store.get_article_summary("https://example.com/a-0")["total_weighted_votes"], 8.0)
+
+    def test_trust_changes_apply_to_the_next_submission(self):
+        first = self._submit("tester-c", "https://example.com/c-0")
+        self.assertEqual(first["trust_source"], "system_default")
+
+        self.store.upsert_user_tester_tier("tester-c", tester_tier="core")
+        tiered = self._submit("tester-c", "https://example.com/c-1")
+        self.assertEqual(tiered["trust_source"], "tier_default")
+        self.assertEqual(tiered["weighted_score"], 7.2)
+
+        self.store.upsert_user_trust_profile("tester-c", trust_weight=0.5)
+        manual = self._submit("tester-c", "https://example.com/c-2")
+        self.assertEqual(manual["trust_source"], "manual")
+        self.assertEqual(manual["weighted_score"], 2.0)
+
+        self.store.clear_user_trust_profile("tester-c")
+        self.assertEqual(self._submit("tester-c", "https://example.com/c-3")["trust_source"], "tier_default")
+
+    def test_trust_read_during_write_transaction_is_not_cached_past_commit(self):
+        self._submit("tester-x", "https://example.com/x-0", user_confidence=3)
+        reweight = self.store._reweight_user_feedback
+        observed = []
+
+        def _reweight_with_concurrent_read(**kwargs):
+            reader = threading.Thread(target=lambda: observed.append(self.store.get_user_trust_weight("tester-x")))
+            reader.start()
+            reader.join()
+            return reweight(**kwargs)
+
+        self.store._reweight_user_feedback = _reweight_with_concurrent_read
+        self.store.upsert_user_trust_profile("tester-x", trust_weight=0.2)
+        self.assertEqual(observed, [1.0])
+
+        self.assertEqual(self.store.get_user_trust_profile("tester-x")["effective_trust_weight"], 0.2)
+        submitted = self._submit("tester-x", "https://example.com/x-1", user_confidence=3)
+        self.assertEqual(submitted["trust_weight"], 0.2)
+        self.assertEqual(submitted["weighted_score"], 0.6)
+
+        def _failing_reweight(**kwargs):
+            raise RuntimeError("reweight failed")
+
+        self.store.clear_user_trust_profile("tester-x")
+        self.store._reweight_user_feedback = _failing_reweight
+        with self.assertRaises(RuntimeError):
+            self.store.upsert_user_tester_tier("tester-x", tester_tier="core")
+        self.assertEqual(self.store.get_user_trust_weight("tester-x"), 1.0)
+
+    def test_tester_quality_candidates_follow_article_consensus(self):
+        for idx in range(3):
+            link = f"https://example.com/q-{idx}"
+            self._submit("agree-1", link, user_label="negative")
+            self._submit("agree-2", link, user_label="negative")
+            self._submit("dissent", link, user_label="positive")
+        self.store.upsert_user_tester_tier("dissent", tester_tier="core")
+
+        candidates = {
+            item["user_id_hash"]: item
+            for item in self.store.get_tester_quality_candidates(min_votes=3)
+        }
+        agree = candidates[hash_user_id("agree-1")]
+        self.assertEqual(agree["consensus_match_ratio"], 1.0)
+        self.assertEqual(agree["recommendation"], "promote_general_to_core")
+        dissent = candidates[hash_user_id("dissent")]
+        self.assertEqual(dissent["consensus_match_ratio"], 0.0)
+        self.assertEqual(dissent["ai_match_ratio"], 1.0)
+        self.assertEqual(dissent["recommendation"], "demote_core_to_general")
+        self.assertEqual(self.store.get_tester_quality_candidates(min_votes=4), [])
+
+    def test_auto_apply_tester_tiers_reweights_applied_users_in_one_batch(self):
+        for idx in range(3):
+            link = f"https://example.com/a-{idx}"
+            self._submit("agree-1", link, user_label="negative")
+            self._submit("agree-2", link, user_label="negative")
+            self._submit("dissent", link, user_label="positive")
+        self.store.upsert_user_trust_profile("agree-2", trust_weight=2.0)
+
+        report = self.store.auto_apply_tester_tiers(min_votes=3, dry_run=False)
+
+        applied = {item["user_id_hash"]: item["result"] for item in report["applied"]}
+        self.assertEqual(set(applied), {hash_user_id("agree-1"), hash_user_id("dissent")})
+        self.assertEqual(applied[hash_user_id("agree-1")]["tester_tier"], "core")
+        self.assertEqual(applied[hash_user_id("agree-1")]["updated_feedback_count"], 3)
+        self.assertEqual(applied[hash_user_id("dissent")]["tester_tier"], "observer")
+        self.assertEqual(self.store.get_user_trust_weight("agree-1"), 1.8)
+        conn = self.store._connect()
+        weights = dict(
+            conn.execute(
+                """
+                SELECT f.user_id_hash, MAX(k.weight)
+                FROM keyword_votes k
+                JOIN feedback_events f ON f.id = k.feedback_id
+                GROUP BY f.user_id_hash
+                """
+            ).fetchall()
+        )
+        self.assertEqual(weights[hash_user_id("agree-1")], 7.2)
+        self.assertEqual(weights[hash_user_id("agree-2")], 8.0)
+        self.assertEqual(weights[hash_user_id("dissent")], 2.8)
+
+    def test_aggregate_reads_are_cached_until_the_next_write(self):
+        self._submit("tester-c", "https://example.com/c-0")
+        first = self.store.get_stock_feedback_signal("005930", since_hours=24, min_votes=1)
+        self.assertIs(self.store.get_stock_feedback_signal("005930", since_hours=24, min_votes=1), first)
+        self.assertEqual(self.store.get_metrics(since_hours=24)["total_feedback_events"], 1)
+
+        self._submit("tester-d", "https://example.com/c-0")
+
+        refreshed = self.store.get_stock_feedback_signal("005930", since_hours=24, min_votes=1)
+        self.assertEqual(refreshed["total_votes"], 2)
+        self.assertEqual(refreshed["unique_users"], 2)
+        self.assertEqual(self.store.get_metrics(since_hours=24)["total_feedback_events"], 2)
+
+    def test_concurrent_writers_serialize_through_sqlite(self):
+        errors = []
+        start_generation = self.store._write_generation
+
+        def vote(user_idx: int):
+            try:
+                for article_idx in range(10):
+                    self._submit(f"tester-{user_idx}", f"https://example.com/t-{article_idx}")
+                self.store.upsert_user_trust_profile(f"tester-{user_idx}", trust_weight=2.0)
+            except Exception as exc:  # pragma: no cover - surfaced by the assertion below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=vote, args=(idx,)) for idx in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        summary = self.store.get_article_summary("https://example.com/t-0")
+        self.assertEqual(summary["total_votes"], 4)
+        self.assertEqual(summary["total_weighted_votes"], 32.0)
+        # Every commit gets its own generation, so no cached read can outlive a concurrent write.
+        self.assertEqual(self.store._write_generation - start_generation, 4 * 11)
+
+    def test_legacy_weighted_score_column_is_rebuilt_as_generated(self):
+        db_path = str(Path(self._tmp_dir.name) / "legacy_feedback.db")
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE feedback_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                created_at TEXT NOT NULL,
+                user_id_hash TEXT NOT NULL,
+                stock_code TEXT NOT NULL,
+                article_link TEXT NOT NULL,
+                article_title TEXT NOT NULL,
+                article_source TEXT DEFAULT '',
+                ai_label TEXT NOT NULL,
+                user_label TEXT NOT NULL,
+                user_confidence INTEGER NOT NULL DEFAULT 3,
+                note TEXT DEFAULT '',
+                trust_weight REAL NOT NULL DEFAULT 1.0,
+                weighted_score REAL NOT NULL DEFAULT 0.0
+            );
+            CREATE TABLE keyword_votes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                feedback_id INTEGER NOT NULL,
+                created_at TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                ai_label TEXT NOT NULL,
+                user_label TEXT NOT NULL,
+                weight REAL NOT NULL DEFAULT 3.0,
+                FOREIGN KEY(feedback_id) REFERENCES feedback_events(id) ON DELETE CASCADE
+            );
+            INSERT INTO feedback_events (
+                created_at, user_id_hash, stock_code, article_link, article_title,
+                ai_label, user_label, user_confidence, trust_weight, weighted_score
+            )
+            VALUES ('2024-01-01 09:00:00', 'legacy', '005930', 'https://example.com/legacy', 'Samsung',
+                    'positive', 'negative', 4, 1.5, 0);
+            INSERT INTO keyword_votes (feedback_id, created_at, keyword, ai_label, user_label, weight)
+            VALUES (1, '2024-01-01 09:00:00', 'samsung', 'positive', 'negative', 6.0);
+            """
+        )
+        conn.close()
+
+        store = FeedbackStore(db_path=db_path)
+        conn = store._connect()
+        self.assertEqual(conn.execute("SELECT weighted_score FROM feedback_events").fetchone()[0], 6.0)
+        self.assertEqual(conn.execute("SELECT COUNT(*) FROM keyword_votes").fetchone()[0], 1)
+        self.assertEqual(store.get_article_summary("https://example.com/legacy")["total_weighted_votes"], 6.0)
+
+
+    def test_applied_rules_match_every_contained_keyword_in_rule_order(self):
+        for index in range(80):
+            self.store.apply_keyword_rule(f"zz{index:02d}", "neutral", support_votes=1)
+        self.store.apply_keyword_rule("chip", "positive", support_votes=5)
+        self.store.apply_keyword_rule("sung", "neutral", support_votes=7)
+        self.store.apply_keyword_rule("samsung", "positive", support_votes=9)
+        self.store.apply_keyword_rule("recall", "negative", support_votes=3)
+
+        matched = self.store.match_applied_rules("Samsung chip outlook")
+
+        self.assertEqual([keyword for keyword, _ in matched], ["samsung", "sung", "chip"])
+        self.assertEqual(matched[0][1]["label"], "positive")
+        self.assertEqual(self.store.match_applied_rules("zz07"), [("zz07", self.store.get_applied_rules_map()["zz07"])])
+        with self.store.rules_snapshot() as rules:
+            self.assertEqual(self.store.match_applied_rules("Samsung chip outlook", rules), matched)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -207,6 +207,22 @@ class MonitoringSchedulerTests(unittest.TestCase):
         self.assertEqual(result.get("policy_profile", {}).get("target_alert_count"), 6)
         self.assertEqual(result.get("policy_profile", {}).get("min_bound"), 5)
 
+    def test_adaptive_profiles_snapshot_reused_until_replaced(self):
+        with main.SCHEDULER_LOCK:
+            first = main._sanitize_adaptive_profiles_unlocked()
+            second = main._sanitize_adaptive_profiles_unlocked()
+        self.assertIs(first, second)
+        with self.assertRaises(TypeError):
+            first["market_open"]["score_step"] = 1  # type: ignore[index]
+
+        main.update_monitoring_scheduler_adaptive_profiles(
+            payload=main.MonitoringAdaptiveProfileUpdateRequest(policy_name="market_open", score_step=3),
+            admin={"auth_mode": "disabled", "auth_scope": "disabled"},
+        )
+        profiles = main.adaptive_scheduler_profiles()
+        self.assertEqual(profiles["market_open"]["score_step"], 3)
+        self.assertIsNot(main.ADAPTIVE_PROFILES_SNAPSHOT[1], first)
+
     def test_run_uses_policy_adaptive_profile(self):
         main.update_monitoring_scheduler_adaptive(
             payload=main.MonitoringAdaptiveUpdateRequest(
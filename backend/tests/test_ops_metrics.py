@@ -58,6 +58,25 @@ class OpsMetricsEndpointTests(unittest.TestCase):
         main.feedback_store = self._original_feedback_store
         self._tmp_dir.cleanup()
 
+    def test_padded_user_id_round_trips_between_post_and_get(self):
+        admin = {"auth_mode": "disabled", "auth_scope": "disabled"}
+        main.upsert_feedback_user_trust(
+            payload=main.UserTrustUpdateRequest(user_id="  tester-ws  ", trust_weight=2.5),
+            admin=admin,
+        )
+        main.upsert_feedback_user_tier(
+            payload=main.UserTierUpdateRequest(user_id="  tester-ws  ", tester_tier="core"),
+            admin=admin,
+        )
+
+        for query_user_id in ("  tester-ws  ", "tester-ws"):
+            trust = main.get_feedback_user_trust(user_id=query_user_id, admin=admin)["profile"]
+            self.assertTrue(trust["manual_override"]["enabled"])
+            self.assertEqual(trust["effective_trust_weight"], 2.5)
+
+            tier = main.get_feedback_user_tier(user_id=query_user_id, admin=admin)["profile"]
+            self.assertEqual(tier["tester_tier"], "core")
+
     def test_ops_metrics_response_schema(self):
         response = main.get_ops_metrics(
             hours=24,
@@ -1,8 +1,11 @@
+import sqlite3
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
+from pydantic import ValidationError
+
 
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 if str(BACKEND_DIR) not in sys.path:
@@ -81,6 +84,7 @@ class ResponseSchemaTests(unittest.TestCase):
         self.assertIn("summary", res)
         self.assertIn("persisted_count", res)
         self.assertIn("history_prune", res)
+        self.assertIn("warm_cache", res["summary"]["data_source"])
 
         history = main.get_alert_history(
             stock_code=None,
@@ -92,6 +96,28 @@ class ResponseSchemaTests(unittest.TestCase):
         self.assertIn("history", history)
         self.assertIn("summary", history)
 
+    def test_alerts_reports_failed_history_insert(self):
+        with sqlite3.connect(main.alert_store.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TRIGGER fail_alert_insert BEFORE INSERT ON alert_history
+                BEGIN
+                    SELECT RAISE(ABORT, 'insert rejected');
+                END
+                """
+            )
+
+        with self.assertRaises(main.HTTPException) as ctx:
+            main.get_alerts(
+                priority=None,
+                delivery_level_filter=None,
+                min_score=0,
+                limit=5,
+            )
+        self.assertEqual(ctx.exception.status_code, 500)
+        self.assertIn("insert rejected", str(ctx.exception.detail))
+        self.assertEqual(main.alert_store.list_alert_history(limit=10), [])
+
     def test_alert_history_export_csv(self):
         main.get_alerts(
             priority=None,
@@ -184,6 +210,13 @@ class ResponseSchemaTests(unittest.TestCase):
         self.assertIn("policy_profile", response["result"])
         self.assertEqual(response["result"].get("policy_name"), "market_open")
 
+    def test_request_models_strip_strings_and_forbid_extra_fields(self):
+        payload = main.KeywordRuleDisableRequest(keyword="  호재  ")
+        self.assertEqual(payload.keyword, "호재")
+
+        with self.assertRaises(ValidationError):
+            main.KeywordRuleDisableRequest(keyword="호재", label="positive")
+
 
 if __name__ == "__main__":
     unittest.main()